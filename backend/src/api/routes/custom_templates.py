@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException
+from functools import lru_cache
+
+from fastapi import APIRouter, Depends, HTTPException, Query
 from jinja2 import Environment, TemplateSyntaxError
 from loguru import logger
-from sqlalchemy import select
+from sqlalchemy import delete, insert, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.schemas import CustomTemplateCreate, CustomTemplateUpdate, CustomTemplateResponse
@@ -18,26 +21,37 @@ router = APIRouter(tags=["custom-templates"])
 _jinja_env = Environment()
 
 
-def _validate_jinja2(template_str: str) -> None:
-    """Validate Jinja2 syntax. Raises HTTPException on error."""
+@lru_cache(maxsize=512)
+def _parse_cached(template_str: str) -> str | None:
+    """Parse *template_str* once; return the syntax error message or None."""
     try:
         _jinja_env.parse(template_str)
     except TemplateSyntaxError as exc:
+        return str(exc)
+    return None
+
+
+def _validate_jinja2(template_str: str) -> None:
+    """Validate Jinja2 syntax. Raises HTTPException on error."""
+    error = _parse_cached(template_str)
+    if error is not None:
         raise HTTPException(
             status_code=422,
-            detail=f"Invalid Jinja2 syntax in user_prompt_template: {exc}",
+            detail=f"Invalid Jinja2 syntax in user_prompt_template: {error}",
         )
 
 
 @router.get("/api/custom-templates", response_model=list[CustomTemplateResponse])
 async def list_custom_templates(
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
     session: AsyncSession = Depends(get_session),
 ) -> list[CustomTemplate]:
-    """List all custom templates."""
-    result = await session.execute(
-        select(CustomTemplate).order_by(CustomTemplate.name)
+    """List custom templates ordered by name."""
+    result = await session.scalars(
+        select(CustomTemplate).order_by(CustomTemplate.name).limit(limit).offset(offset)
     )
-    return list(result.scalars().all())
+    return result.all()
 
 
 @router.get("/api/custom-templates/{template_id}", response_model=CustomTemplateResponse)
@@ -61,24 +75,18 @@ async def create_custom_template(
     # Validate Jinja2 syntax
     _validate_jinja2(body.user_prompt_template)
 
-    # Check name uniqueness
-    existing = await session.execute(
-        select(CustomTemplate).where(CustomTemplate.name == body.name)
-    )
-    if existing.scalar_one_or_none():
+    # Name uniqueness is enforced by the UNIQUE constraint on custom_templates.name
+    try:
+        result = await session.scalars(
+            insert(CustomTemplate).returning(CustomTemplate),
+            [body.model_dump()],
+        )
+        template = result.one()
+        await session.commit()
+    except IntegrityError:
+        await session.rollback()
         raise HTTPException(status_code=409, detail=f"Template name '{body.name}' already exists")
 
-    template = CustomTemplate(
-        name=body.name,
-        template_type=body.template_type,
-        system_prompt=body.system_prompt,
-        user_prompt_template=body.user_prompt_template,
-        output_schema=body.output_schema,
-    )
-    session.add(template)
-    await session.commit()
-    await session.refresh(template)
-
     # Update in-memory registry
     TemplateRegistry.register_custom(template)
     logger.info(f"Created custom template: {template.name}")
@@ -97,32 +105,39 @@ async def update_custom_template(
     if not template:
         raise HTTPException(status_code=404, detail="Custom template not found")
 
-    update_data = body.model_dump(exclude_unset=True)
+    # Keep only fields whose value actually differs; PUT round-trips often
+    # resubmit the stored values unchanged.
+    update_data = {
+        key: value
+        for key, value in body.model_dump(exclude_unset=True).items()
+        if getattr(template, key) != value
+    }
+    if not update_data:
+        return template
 
     # Validate Jinja2 if user_prompt_template is being updated
     if "user_prompt_template" in update_data:
         _validate_jinja2(update_data["user_prompt_template"])
 
-    # Check name uniqueness if name is being updated
-    if "name" in update_data and update_data["name"] != template.name:
-        existing = await session.execute(
-            select(CustomTemplate).where(CustomTemplate.name == update_data["name"])
-        )
-        if existing.scalar_one_or_none():
-            raise HTTPException(
-                status_code=409,
-                detail=f"Template name '{update_data['name']}' already exists",
-            )
-        # Unregister old name from registry
-        TemplateRegistry.unregister_custom(template.name)
-
+    old_name = template.name
     for key, value in update_data.items():
         setattr(template, key, value)
 
-    await session.commit()
-    await session.refresh(template)
+    # updated_at is refreshed by the UPDATE itself (RETURNING via eager
+    # defaults), so no refresh round-trip is needed.  A renamed template that
+    # collides with an existing name trips the UNIQUE constraint.
+    try:
+        await session.commit()
+    except IntegrityError:
+        await session.rollback()
+        raise HTTPException(
+            status_code=409,
+            detail=f"Template name '{body.name or old_name}' already exists",
+        )
 
     # Update in-memory registry
+    if template.name != old_name:
+        TemplateRegistry.unregister_custom(old_name)
     TemplateRegistry.register_custom(template)
     logger.info(f"Updated custom template: {template.name}")
 
@@ -135,13 +150,15 @@ async def delete_custom_template(
     session: AsyncSession = Depends(get_session),
 ) -> None:
     """Delete a custom template."""
-    template = await session.get(CustomTemplate, template_id)
-    if not template:
+    name = await session.scalar(
+        delete(CustomTemplate)
+        .where(CustomTemplate.id == template_id)
+        .returning(CustomTemplate.name)
+    )
+    if name is None:
         raise HTTPException(status_code=404, detail="Custom template not found")
+    await session.commit()
 
     # Remove from in-memory registry
-    TemplateRegistry.unregister_custom(template.name)
-
-    await session.delete(template)
-    await session.commit()
-    logger.info(f"Deleted custom template: {template.name}")
+    TemplateRegistry.unregister_custom(name)
+    logger.info(f"Deleted custom template: {name}")
@@ -2,51 +2,108 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
+from datetime import datetime, timezone
 from pathlib import Path
 
-from fastapi import APIRouter, Depends, HTTPException
+import anyio
+from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import FileResponse, PlainTextResponse
-from sqlalchemy import select
+from loguru import logger
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.datastructures import Headers
+from starlette.types import Receive, Scope, Send
 
 from api.schemas import ExportResponse, HFPushRequest, HFPushResponse
+from clients.redis_client import RedisClient, get_redis_client
 from config import get_settings
 from db.database import get_session
-from db.models import Export
+from db.models import Export, HFPushJob
 
 router = APIRouter(tags=["exports"])
 
 
+class ZeroCopyFileResponse(FileResponse):
+    """FileResponse that lets the server ``sendfile()`` the export when it can.
+
+    If the ASGI server advertises the ``http.response.zerocopysend``
+    extension, the open file descriptor is handed over and the bytes never
+    pass through Python.  Otherwise (HEAD, range requests, or servers such
+    as uvicorn without the extension) it behaves like ``FileResponse``, with
+    a larger read size to cut per-chunk overhead on big exports.
+    """
+
+    chunk_size = 1024 * 1024
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            "http.response.zerocopysend" not in scope.get("extensions", {})
+            or scope["method"].upper() == "HEAD"
+            or Headers(scope=scope).get("range") is not None
+        ):
+            await super().__call__(scope, receive, send)
+            return
+
+        if self.stat_result is None:
+            self.set_stat_headers(await asyncio.to_thread(os.stat, self.path))
+
+        async with await anyio.open_file(self.path, "rb") as file:
+            await send({
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.raw_headers,
+            })
+            await send({
+                "type": "http.response.zerocopysend",
+                "file": file.wrapped.fileno(),
+                "more_body": False,
+            })
+
+        if self.background is not None:
+            await self.background()
+
+
 @router.get("/api/jobs/{job_id}/exports", response_model=list[ExportResponse])
 async def list_exports(
     job_id: int,
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
     session: AsyncSession = Depends(get_session),
 ) -> list[Export]:
-    """List all exports for a given job."""
-    result = await session.execute(
-        select(Export).where(Export.job_id == job_id).order_by(Export.created_at.desc())
+    """List exports for a given job, newest first."""
+    result = await session.scalars(
+        select(Export)
+        .where(Export.job_id == job_id)
+        .order_by(Export.created_at.desc())
+        .limit(limit)
+        .offset(offset)
     )
-    return list(result.scalars().all())
+    return result.all()
 
 
 @router.get("/api/exports/{export_id}/download")
 async def download_export(
     export_id: int,
     session: AsyncSession = Depends(get_session),
-) -> FileResponse:
+) -> ZeroCopyFileResponse:
     """Download the exported dataset file."""
     export = await session.get(Export, export_id)
     if not export:
         raise HTTPException(status_code=404, detail="Export not found")
 
     file_path = Path(export.file_path)
-    if not file_path.exists():
+    try:
+        stat_result = file_path.stat()
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Export file not found on disk")
 
-    return FileResponse(
+    return ZeroCopyFileResponse(
         path=str(file_path),
         filename=file_path.name,
         media_type="application/octet-stream",
+        stat_result=stat_result,
     )
 
 
@@ -66,13 +123,28 @@ async def get_dataset_card(
     return PlainTextResponse(content=export.dataset_card, media_type="text/markdown")
 
 
-@router.post("/api/exports/{export_id}/push-to-hf")
+def _hf_token() -> str:
+    """HuggingFace token from the (cached) settings, resolved as a dependency."""
+    return get_settings().huggingface_token
+
+
+@router.post(
+    "/api/exports/{export_id}/push-to-hf",
+    status_code=202,
+    response_model=HFPushResponse,
+)
 async def push_to_huggingface(
     export_id: int,
     body: HFPushRequest,
     session: AsyncSession = Depends(get_session),
-) -> HFPushResponse:
-    """Push an exported dataset to HuggingFace Hub."""
+    redis: RedisClient = Depends(get_redis_client),
+    hf_token: str = Depends(_hf_token),
+) -> HFPushJob:
+    """Queue an upload of an exported dataset to HuggingFace Hub.
+
+    The upload itself runs in the worker; poll the push-status endpoint for
+    the result.
+    """
     export = await session.get(Export, export_id)
     if not export:
         raise HTTPException(status_code=404, detail="Export not found")
@@ -81,21 +153,46 @@ async def push_to_huggingface(
     if not file_path.exists():
         raise HTTPException(status_code=404, detail="Export file not found on disk")
 
-    settings = get_settings()
-    if not settings.huggingface_token:
+    if not hf_token:
         raise HTTPException(
             status_code=400,
             detail="HuggingFace token not configured. Set HUGGINGFACE_TOKEN in your environment.",
         )
 
+    result = await session.scalars(
+        insert(HFPushJob).returning(HFPushJob),
+        [{"export_id": export_id, "repo_id": body.repo_id, "private": body.private}],
+    )
+    push_job = result.one()
+    await session.commit()
+
     try:
-        from clients.hf_client import HFClient
-        client = HFClient(token=settings.huggingface_token)
-        result = await client.push_dataset(
-            file_path=file_path,
-            repo_id=body.repo_id,
-            private=body.private,
-        )
-        return HFPushResponse(**result)
+        await redis.enqueue_hf_push(push_job.id)
     except Exception as exc:
-        raise HTTPException(status_code=500, detail=f"Failed to push to HuggingFace: {exc}")
+        # Nothing will ever pick the row up; close it so status polls end
+        logger.warning(f"Failed to enqueue HuggingFace push {push_job.id}: {exc}")
+        push_job.status = "failed"
+        push_job.error = "Could not queue the upload"
+        push_job.completed_at = datetime.now(timezone.utc)
+        await session.commit()
+        raise HTTPException(
+            status_code=503, detail="Job queue unavailable, please try again later"
+        )
+
+    return push_job
+
+
+@router.get(
+    "/api/exports/{export_id}/push-status/{push_id}",
+    response_model=HFPushResponse,
+)
+async def get_push_status(
+    export_id: int,
+    push_id: int,
+    session: AsyncSession = Depends(get_session),
+) -> HFPushJob:
+    """Get the status of a queued HuggingFace push."""
+    push_job = await session.get(HFPushJob, push_id)
+    if not push_job or push_job.export_id != export_id:
+        raise HTTPException(status_code=404, detail="Push job not found")
+    return push_job
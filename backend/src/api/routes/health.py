@@ -1,40 +1,56 @@
-from fastapi import APIRouter
+import asyncio
+import time
+
+from fastapi import APIRouter, Depends
 from sqlalchemy import text
 
+from clients.redis_client import RedisClient, get_redis_client
+
 router = APIRouter()
 
+DB_CHECK_TTL = 2.0  # seconds a successful DB ping is reused for
+REDIS_PING_TIMEOUT = 1.0  # seconds
+
+_last_db_ok: float | None = None  # monotonic time of the last successful DB ping
 
-@router.get("/health")
-@router.get("/api/health")
-async def health_check() -> dict:
-    """Health check endpoint with component status."""
-    from db.database import _engine
 
-    checks: dict[str, str] = {}
+async def _db_check() -> str:
+    """Ping the database, reusing a recent success so frequent probes skip it."""
+    global _last_db_ok
+    from db.database import _engine
 
-    # Database check
+    if not _engine:
+        return "not_initialized"
     try:
-        if _engine:
+        now = time.monotonic()
+        if _last_db_ok is None or now - _last_db_ok > DB_CHECK_TTL:
             async with _engine.connect() as conn:
                 await conn.execute(text("SELECT 1"))
-            checks["database"] = "ok"
-        else:
-            checks["database"] = "not_initialized"
+            _last_db_ok = now
+        return "ok"
     except Exception:
-        checks["database"] = "error"
+        _last_db_ok = None
+        return "error"
+
 
-    # Redis check (best-effort, not critical for health)
+async def _redis_check(redis: RedisClient) -> str:
+    """Ping Redis (best-effort, not critical for health)."""
     try:
-        from clients.redis_client import RedisClient
-        rc = RedisClient()
-        if await rc.ping():
-            checks["redis"] = "ok"
-        else:
-            checks["redis"] = "unreachable"
-        await rc.close()
+        if await asyncio.wait_for(redis.ping(), timeout=REDIS_PING_TIMEOUT):
+            return "ok"
+        return "unreachable"
     except Exception:
-        checks["redis"] = "unavailable"
+        return "unavailable"
+
+
+@router.get("/health")
+@router.get("/api/health")
+async def health_check(redis: RedisClient = Depends(get_redis_client)) -> dict:
+    """Health check endpoint with component status."""
+    # The checks are independent, so their round-trips overlap.
+    db_status, redis_status = await asyncio.gather(_db_check(), _redis_check(redis))
+    checks = {"database": db_status, "redis": redis_status}
 
-    overall = "ok" if checks.get("database") == "ok" else "degraded"
+    overall = "ok" if db_status == "ok" else "degraded"
 
     return {"status": overall, "components": checks}
@@ -2,11 +2,11 @@ from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from loguru import logger
-from sqlalchemy import select, func
+from sqlalchemy import insert, select, func, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.schemas import JobCreate, JobResponse, JobComparison, JobComparisonItem
-from clients.redis_client import RedisClient
+from clients.redis_client import RedisClient, get_redis_client
 from db.database import get_session
 from db.models import Job, Project, TrainingExample
 
@@ -18,6 +18,7 @@ async def create_job(
     project_id: int,
     body: JobCreate,
     session: AsyncSession = Depends(get_session),
+    redis: RedisClient = Depends(get_redis_client),
 ) -> Job:
     # Verify project exists
     project = await session.get(Project, project_id)
@@ -28,20 +29,16 @@ async def create_job(
     config_dict = body.config.model_dump()
     config_dict["urls"] = body.urls
 
-    job = Job(
-        project_id=project_id,
-        status="pending",
-        config=config_dict,
+    result = await session.scalars(
+        insert(Job).returning(Job),
+        [{"project_id": project_id, "status": "pending", "config": config_dict}],
     )
-    session.add(job)
+    job = result.one()
     await session.commit()
-    await session.refresh(job)
 
     # Enqueue job to Redis for worker processing
     try:
-        rc = RedisClient()
-        await rc.enqueue_job(job.id, config_dict)
-        await rc.close()
+        await redis.enqueue_job(job.id, config_dict)
     except Exception as exc:
         logger.warning(f"Failed to enqueue job {job.id}: {exc}")
 
@@ -51,16 +48,22 @@ async def create_job(
 @router.get("/api/projects/{project_id}/jobs", response_model=list[JobResponse])
 async def list_jobs(
     project_id: int,
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
     session: AsyncSession = Depends(get_session),
 ) -> list[Job]:
     project = await session.get(Project, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    result = await session.execute(
-        select(Job).where(Job.project_id == project_id).order_by(Job.created_at.desc())
+    result = await session.scalars(
+        select(Job)
+        .where(Job.project_id == project_id)
+        .order_by(Job.created_at.desc())
+        .limit(limit)
+        .offset(offset)
     )
-    return list(result.scalars().all())
+    return result.all()
 
 
 @router.get("/api/jobs/compare", response_model=JobComparison)
@@ -79,32 +82,34 @@ async def compare_jobs(
     if len(job_ids) > 10:
         raise HTTPException(status_code=400, detail="Maximum 10 jobs can be compared at once")
 
+    # One query for the jobs, one grouped aggregate for their examples
+    jobs = await session.scalars(select(Job).where(Job.id.in_(set(job_ids))))
+    jobs_by_id = {job.id: job for job in jobs}
+
+    stats_result = await session.execute(
+        select(
+            TrainingExample.job_id,
+            func.count(),
+            func.count().filter(TrainingExample.passed_qc == True),
+            func.coalesce(func.avg(TrainingExample.quality_score), 0.0),
+        )
+        .where(TrainingExample.job_id.in_(set(job_ids)))
+        .group_by(TrainingExample.job_id)
+    )
+    stats_by_job = {
+        jid: (total, passed, avg_score)
+        for jid, total, passed, avg_score in stats_result.all()
+    }
+
     items = []
     for jid in job_ids:
-        job = await session.get(Job, jid)
+        job = jobs_by_id.get(jid)
         if not job:
             raise HTTPException(status_code=404, detail=f"Job {jid} not found")
 
-        # Get example statistics
-        total_result = await session.execute(
-            select(func.count()).where(TrainingExample.job_id == jid)
+        total_examples, passed_examples, avg_quality_score = stats_by_job.get(
+            jid, (0, 0, 0.0)
         )
-        total_examples = total_result.scalar() or 0
-
-        passed_result = await session.execute(
-            select(func.count()).where(
-                TrainingExample.job_id == jid,
-                TrainingExample.passed_qc == True,
-            )
-        )
-        passed_examples = passed_result.scalar() or 0
-
-        avg_score_result = await session.execute(
-            select(func.avg(TrainingExample.quality_score)).where(
-                TrainingExample.job_id == jid
-            )
-        )
-        avg_quality_score = avg_score_result.scalar() or 0.0
 
         # Get template type from job config
         template_type = None
@@ -147,16 +152,21 @@ async def cancel_job(
     job_id: int,
     session: AsyncSession = Depends(get_session),
 ) -> Job:
-    job = await session.get(Job, job_id)
-    if not job:
-        raise HTTPException(status_code=404, detail="Job not found")
-
-    if job.status in ("completed", "failed", "cancelled"):
-        raise HTTPException(status_code=400, detail=f"Cannot cancel job with status: {job.status}")
+    # Conditional UPDATE: the status check and the write happen atomically
+    job = await session.scalar(
+        update(Job)
+        .where(Job.id == job_id, Job.status.notin_(["completed", "failed", "cancelled"]))
+        .values(status="cancelled")
+        .returning(Job)
+    )
+    if job is None:
+        # Nothing updated -- look the job up only to report why
+        existing = await session.get(Job, job_id)
+        if not existing:
+            raise HTTPException(status_code=404, detail="Job not found")
+        raise HTTPException(status_code=400, detail=f"Cannot cancel job with status: {existing.status}")
 
-    job.status = "cancelled"
     await session.commit()
-    await session.refresh(job)
     return job
 
 
@@ -164,6 +174,7 @@ async def cancel_job(
 async def retry_job(
     job_id: int,
     session: AsyncSession = Depends(get_session),
+    redis: RedisClient = Depends(get_redis_client),
 ) -> Job:
     """Retry a failed or cancelled job by creating a new job with the same config."""
     job = await session.get(Job, job_id)
@@ -176,20 +187,16 @@ async def retry_job(
             detail=f"Only failed or cancelled jobs can be retried (current: {job.status})",
         )
 
-    new_job = Job(
-        project_id=job.project_id,
-        status="pending",
-        config=job.config,
+    result = await session.scalars(
+        insert(Job).returning(Job),
+        [{"project_id": job.project_id, "status": "pending", "config": job.config}],
     )
-    session.add(new_job)
+    new_job = result.one()
     await session.commit()
-    await session.refresh(new_job)
 
     # Enqueue to Redis
     try:
-        rc = RedisClient()
-        await rc.enqueue_job(new_job.id, new_job.config)
-        await rc.close()
+        await redis.enqueue_job(new_job.id, new_job.config)
     except Exception as exc:
         logger.warning(f"Failed to enqueue retried job {new_job.id}: {exc}")
 
@@ -1,5 +1,5 @@
-from fastapi import APIRouter, Depends, HTTPException, Response
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import delete, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.schemas import ProjectCreate, ProjectUpdate, ProjectResponse
@@ -14,19 +14,22 @@ async def create_project(
     body: ProjectCreate,
     session: AsyncSession = Depends(get_session),
 ) -> Project:
-    project = Project(**body.model_dump())
-    session.add(project)
+    result = await session.scalars(insert(Project).returning(Project), [body.model_dump()])
+    project = result.one()
     await session.commit()
-    await session.refresh(project)
     return project
 
 
 @router.get("", response_model=list[ProjectResponse])
 async def list_projects(
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
     session: AsyncSession = Depends(get_session),
 ) -> list[Project]:
-    result = await session.execute(select(Project).order_by(Project.created_at.desc()))
-    return list(result.scalars().all())
+    result = await session.scalars(
+        select(Project).order_by(Project.created_at.desc()).limit(limit).offset(offset)
+    )
+    return result.all()
 
 
 @router.get("/{project_id}", response_model=ProjectResponse)
@@ -46,13 +49,20 @@ async def update_project(
     body: ProjectUpdate,
     session: AsyncSession = Depends(get_session),
 ) -> Project:
-    project = await session.get(Project, project_id)
+    update_data = body.model_dump(exclude_unset=True)
+    if not update_data:
+        project = await session.get(Project, project_id)
+    else:
+        result = await session.scalars(
+            update(Project)
+            .where(Project.id == project_id)
+            .values(**update_data)
+            .returning(Project)
+        )
+        project = result.one_or_none()
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
-    for key, value in body.model_dump(exclude_unset=True).items():
-        setattr(project, key, value)
     await session.commit()
-    await session.refresh(project)
     return project
 
 
@@ -61,9 +71,8 @@ async def delete_project(
     project_id: int,
     session: AsyncSession = Depends(get_session),
 ) -> Response:
-    project = await session.get(Project, project_id)
-    if not project:
+    result = await session.execute(delete(Project).where(Project.id == project_id))
+    if result.rowcount == 0:
         raise HTTPException(status_code=404, detail="Project not found")
-    await session.delete(project)
     await session.commit()
     return Response(status_code=204)
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter
+from functools import lru_cache
+
+from fastapi import APIRouter, Response
 from pydantic import BaseModel
 
 from config import get_settings
@@ -37,9 +39,9 @@ class SettingsResponse(BaseModel):
     export_format: str
 
 
-@router.get("/api/settings", response_model=SettingsResponse)
-async def get_current_settings() -> SettingsResponse:
-    """Return current server configuration with sensitive values masked."""
+@lru_cache
+def _settings_payload() -> bytes:
+    """Serialize the masked settings once; they are fixed for the process lifetime."""
     settings = get_settings()
     return SettingsResponse(
         openai_api_key_configured=bool(settings.openai_api_key and settings.openai_api_key != "sk-your-key-here"),
@@ -55,4 +57,10 @@ async def get_current_settings() -> SettingsResponse:
         scraping_max_concurrent=settings.scraping_max_concurrent,
         scraping_rate_limit=settings.scraping_rate_limit,
         export_format=settings.export_format,
-    )
+    ).model_dump_json().encode()
+
+
+@router.get("/api/settings", response_model=SettingsResponse)
+async def get_current_settings() -> Response:
+    """Return current server configuration with sensitive values masked."""
+    return Response(content=_settings_payload(), media_type="application/json")
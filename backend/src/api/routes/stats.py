@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from api.schemas import StatsOverview
+from api.schemas import CostEntry, StatsOverview
 from db.database import get_session
 from db.models import Job, Project, TrainingExample
 
@@ -18,57 +18,53 @@ async def get_overview(
     session: AsyncSession = Depends(get_session),
 ) -> StatsOverview:
     """Return aggregate stats for the dashboard."""
-    total_projects = await session.scalar(
-        select(func.count()).select_from(Project)
-    ) or 0
-
-    total_jobs = await session.scalar(
-        select(func.count()).select_from(Job)
-    ) or 0
-
-    active_jobs = await session.scalar(
-        select(func.count()).select_from(Job).where(
-            Job.status.in_(["pending", "running"])
+    # One round-trip: each figure is an independent scalar subquery
+    row = (await session.execute(
+        select(
+            select(func.count()).select_from(Project).scalar_subquery().label("total_projects"),
+            select(func.count()).select_from(Job).scalar_subquery().label("total_jobs"),
+            select(func.count())
+            .select_from(Job)
+            .where(Job.status.in_(["pending", "running"]))
+            .scalar_subquery()
+            .label("active_jobs"),
+            select(func.count())
+            .select_from(TrainingExample)
+            .scalar_subquery()
+            .label("total_examples"),
+            select(func.coalesce(func.sum(Job.cost_total), 0.0))
+            .scalar_subquery()
+            .label("total_cost"),
         )
-    ) or 0
-
-    total_examples = await session.scalar(
-        select(func.count()).select_from(TrainingExample)
-    ) or 0
-
-    total_cost = await session.scalar(
-        select(func.coalesce(func.sum(Job.cost_total), 0.0))
-    ) or 0.0
+    )).one()
 
     return StatsOverview(
-        total_projects=total_projects,
-        total_jobs=total_jobs,
-        active_jobs=active_jobs,
-        total_examples=total_examples,
-        total_cost=float(total_cost),
+        total_projects=row.total_projects or 0,
+        total_jobs=row.total_jobs or 0,
+        active_jobs=row.active_jobs or 0,
+        total_examples=row.total_examples or 0,
+        total_cost=float(row.total_cost or 0.0),
     )
 
 
-@router.get("/api/stats/costs")
+@router.get("/api/stats/costs", response_model=list[CostEntry])
 async def get_costs(
-    limit: int = 10,
+    limit: int = Query(10, ge=1, le=500),
+    offset: int = Query(0, ge=0),
     session: AsyncSession = Depends(get_session),
-) -> list[dict]:
+) -> list:
     """Return recent jobs with their cost breakdown."""
+    # Select only the reported columns so each row skips decoding Job.config
     result = await session.execute(
-        select(Job)
+        select(
+            Job.id.label("job_id"),
+            Job.project_id,
+            Job.cost_total,
+            Job.completed_at,
+        )
         .where(Job.status == "completed")
         .order_by(Job.completed_at.desc())
         .limit(limit)
+        .offset(offset)
     )
-    jobs = result.scalars().all()
-
-    return [
-        {
-            "job_id": job.id,
-            "project_id": job.project_id,
-            "cost_total": job.cost_total,
-            "completed_at": job.completed_at.isoformat() if job.completed_at else None,
-        }
-        for job in jobs
-    ]
+    return result.all()
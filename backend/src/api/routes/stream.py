@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 import asyncio
-import json
 
+import orjson
 import redis.asyncio as aioredis
 from fastapi import APIRouter
 from fastapi.responses import StreamingResponse
@@ -43,19 +43,16 @@ async def _event_generator(job_id: int):
         logger.info(f"SSE: subscribed to {channel}")
 
         while True:
-            try:
-                message = await asyncio.wait_for(
-                    pubsub.get_message(ignore_subscribe_messages=True),
-                    timeout=KEEPALIVE_INTERVAL,
-                )
-            except asyncio.TimeoutError:
-                # Send keepalive ping
-                yield ": keepalive\n\n"
-                continue
+            # Blocks on the socket until a message arrives or the keepalive
+            # interval elapses (returns None), so there is no poll loop.
+            message = await pubsub.get_message(
+                ignore_subscribe_messages=True,
+                timeout=KEEPALIVE_INTERVAL,
+            )
 
             if message is None:
-                # No message yet, small sleep to avoid busy loop
-                await asyncio.sleep(0.1)
+                # Send keepalive ping
+                yield ": keepalive\n\n"
                 continue
 
             if message["type"] == "message":
@@ -64,11 +61,11 @@ async def _event_generator(job_id: int):
 
                 # Check if job is completed or failed -- close stream
                 try:
-                    parsed = json.loads(data)
+                    parsed = orjson.loads(data)
                     if parsed.get("status") in ("completed", "failed"):
                         logger.info(f"SSE: job {job_id} {parsed['status']}, closing stream")
                         break
-                except (json.JSONDecodeError, KeyError):
+                except (orjson.JSONDecodeError, KeyError):
                     pass
 
     except asyncio.CancelledError:
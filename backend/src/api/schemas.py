@@ -22,20 +22,24 @@ class GenerationConfig(BaseModel):
     model: str = Field(default_factory=lambda: get_settings().generation_model)
     examples_per_chunk: int = 3
     max_concurrent_llm: int = 5
+    # 0 makes generation deterministic, so repeated prompts are served from cache
+    temperature: float = Field(default=0.7, ge=0.0, le=2.0)
+    # Half-price provider batch; results may take up to 24h
+    use_batch_api: bool = False
 
 class QualityConfig(BaseModel):
     min_score: float = 0.7
-    checks: list[str] = ["toxicity", "readability", "format"]
+    checks: list[str] = Field(default_factory=lambda: ["toxicity", "readability", "format"])
 
 class ExportConfig(BaseModel):
     format: str = "jsonl"
 
 class PipelineConfig(BaseModel):
-    scraping: ScrapingConfig = ScrapingConfig()
-    processing: ProcessingConfig = ProcessingConfig()
-    generation: GenerationConfig = GenerationConfig()
-    quality: QualityConfig = QualityConfig()
-    export: ExportConfig = ExportConfig()
+    scraping: ScrapingConfig = Field(default_factory=ScrapingConfig)
+    processing: ProcessingConfig = Field(default_factory=ProcessingConfig)
+    generation: GenerationConfig = Field(default_factory=GenerationConfig)
+    quality: QualityConfig = Field(default_factory=QualityConfig)
+    export: ExportConfig = Field(default_factory=ExportConfig)
 
 
 # --- Project ---
@@ -65,7 +69,7 @@ class ProjectResponse(BaseModel):
 
 class JobCreate(BaseModel):
     urls: list[str] = Field(..., min_length=1)
-    config: PipelineConfig = PipelineConfig()
+    config: PipelineConfig = Field(default_factory=PipelineConfig)
 
 class JobResponse(BaseModel):
     id: int
@@ -76,6 +80,7 @@ class JobResponse(BaseModel):
     progress: float
     error: str | None
     cost_total: float
+    llm_batch_id: str | None = None
     started_at: datetime | None
     completed_at: datetime | None
     created_at: datetime
@@ -107,6 +112,14 @@ class StatsOverview(BaseModel):
     total_examples: int
     total_cost: float
 
+class CostEntry(BaseModel):
+    job_id: int
+    project_id: int
+    cost_total: float
+    completed_at: datetime | None
+
+    model_config = {"from_attributes": True}
+
 
 # --- HuggingFace Push ---
 
@@ -115,9 +128,17 @@ class HFPushRequest(BaseModel):
     private: bool = False
 
 class HFPushResponse(BaseModel):
+    id: int
+    export_id: int
     repo_id: str
-    url: str
+    status: str
+    url: str | None
     files_uploaded: int
+    error: str | None
+    created_at: datetime
+    completed_at: datetime | None
+
+    model_config = {"from_attributes": True}
 
 
 # --- Custom Templates ---
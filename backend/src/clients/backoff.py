@@ -0,0 +1,48 @@
+"""Retry delays shared by the HTTP and LLM clients."""
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+
+BASE_DELAY = 1.0  # seconds
+MAX_DELAY = 30.0  # seconds
+
+
+def next_delay(prev: float) -> float:
+    """Decorrelated-jitter backoff: the next sleep after sleeping `prev` seconds.
+
+    Concurrent callers that fail together draw different delays, so their
+    retries spread out instead of hitting the server again in lockstep.
+    """
+    return random.uniform(BASE_DELAY, min(MAX_DELAY, max(BASE_DELAY, prev * 3)))
+
+
+def retry_after(response) -> float | None:
+    """Seconds the server asked us to wait, from `retry-after-ms` / `Retry-After`.
+
+    Accepts anything with a `headers` mapping (httpx responses, or None).
+    Returns None when no usable hint is present. Hints are capped at MAX_DELAY.
+    """
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    value = headers.get("retry-after-ms")
+    if value is not None:
+        try:
+            return min(MAX_DELAY, max(0.0, float(value) / 1000))
+        except ValueError:
+            pass
+
+    value = headers.get("retry-after")
+    if value is None:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        # HTTP-date form
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return min(MAX_DELAY, max(0.0, seconds))
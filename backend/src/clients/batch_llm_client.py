@@ -0,0 +1,221 @@
+"""OpenAI Batch API client with the :class:`LLMClient` interface."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+import litellm
+import orjson
+from loguru import logger
+
+from clients.llm_client import LLMClient, LLMResponse
+
+_Request = tuple[str, dict, asyncio.Future[LLMResponse]]  # custom_id, body, caller
+
+
+class BatchLLMClient:
+    """LLM client that routes completions through the OpenAI Batch API.
+
+    Exposes the same ``complete`` coroutine as :class:`LLMClient`. Requests
+    are collected until none has arrived for ``collect_window_ms`` (or
+    ``max_batch`` are pending), then submitted as one batch file. Each
+    caller's future resolves when the batch finishes, which may take up to
+    the 24h completion window. In exchange, batch tokens cost half the
+    online price and do not count against online rate limits.
+
+    Only OpenAI models are supported; callers should check :meth:`supports`
+    and fall back to :class:`LLMClient` for other providers.
+
+    *on_submit* is awaited with each new batch id, so the owner can record
+    it.  *is_cancelled* is awaited on every poll; once it returns True the
+    provider batch is cancelled and its callers get a ``RuntimeError``.
+    """
+
+    ENDPOINT = "/v1/chat/completions"
+    COMPLETION_WINDOW = "24h"
+    BATCH_DISCOUNT = 0.5
+    OPENAI_PREFIXES = ("gpt-", "chatgpt-", "o1", "o3", "o4")
+    TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+    def __init__(
+        self,
+        collect_window_ms: float = 500.0,
+        max_batch: int = 50_000,
+        poll_interval: float = 30.0,
+        max_poll_interval: float = 300.0,
+        on_submit: Callable[[str], Awaitable[None]] | None = None,
+        is_cancelled: Callable[[], Awaitable[bool]] | None = None,
+    ) -> None:
+        self._collect_window = collect_window_ms / 1000
+        self._max_batch = max_batch
+        self._poll_interval = poll_interval
+        self._max_poll_interval = max_poll_interval
+        self._on_submit = on_submit
+        self._is_cancelled = is_cancelled
+        self._pending: list[_Request] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._dispatching: set[asyncio.Task] = set()
+        self._next_id = 0
+
+    @classmethod
+    def supports(cls, model: str) -> bool:
+        """Whether *model* is served by the OpenAI Batch API."""
+        return model.removeprefix("openai/").startswith(cls.OPENAI_PREFIXES)
+
+    async def complete(
+        self,
+        prompt: str,
+        model: str = "gpt-4o-mini",
+        temperature: float = 0.7,
+        system_prompt: str | None = None,
+        prompt_prefix: str = "",
+    ) -> LLMResponse:
+        """Queue a completion for the next batch and wait for its result.
+
+        Takes the same arguments as :meth:`LLMClient.complete`.
+
+        Raises:
+            ValueError: If *model* is not an OpenAI model.
+            RuntimeError: If the batch or this request within it failed.
+        """
+        if not self.supports(model):
+            raise ValueError(f"Batch API does not support model {model!r}")
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[LLMResponse] = loop.create_future()
+        body = {
+            "model": model.removeprefix("openai/"),
+            "messages": LLMClient._build_messages(model, system_prompt, prompt_prefix, prompt),
+            "temperature": temperature,
+        }
+        self._pending.append((f"req-{self._next_id}", body, future))
+        self._next_id += 1
+
+        # Debounce: submit once callers stop arriving
+        if self._timer is not None:
+            self._timer.cancel()
+        if len(self._pending) >= self._max_batch:
+            self._flush()
+        else:
+            self._timer = loop.call_later(self._collect_window, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        """Submit every pending request as one batch."""
+        self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.create_task(self._dispatch(batch))
+        self._dispatching.add(task)
+        task.add_done_callback(self._dispatching.discard)
+
+    async def _dispatch(self, batch: list[_Request]) -> None:
+        """Run *batch* and hand each caller its response or error."""
+        try:
+            results = await self._run_batch(batch)
+        except Exception as exc:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for custom_id, _, future in batch:
+            if future.done():
+                continue
+            result = results.get(custom_id)
+            if result is None:
+                result = RuntimeError(f"No batch result for request {custom_id}")
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def _run_batch(self, batch: list[_Request]) -> dict[str, LLMResponse | Exception]:
+        """Upload *batch*, wait for it to finish and parse the output file."""
+        lines = [
+            orjson.dumps(
+                {"custom_id": custom_id, "method": "POST", "url": self.ENDPOINT, "body": body}
+            )
+            for custom_id, body, _ in batch
+        ]
+        input_file = await litellm.acreate_file(
+            file=("requests.jsonl", b"\n".join(lines)), purpose="batch"
+        )
+        created = await litellm.acreate_batch(
+            completion_window=self.COMPLETION_WINDOW,
+            endpoint=self.ENDPOINT,
+            input_file_id=input_file.id,
+        )
+        logger.info(f"Submitted LLM batch {created.id} with {len(batch)} requests")
+        if self._on_submit is not None:
+            try:
+                await self._on_submit(created.id)
+            except Exception as exc:
+                logger.warning(f"Could not record LLM batch {created.id}: {exc}")
+
+        finished = await self._wait_for(created.id)
+        if finished.status != "completed" or not finished.output_file_id:
+            raise RuntimeError(f"LLM batch {finished.id} ended with status {finished.status}")
+
+        output = await litellm.afile_content(file_id=finished.output_file_id)
+        return self._parse_output(output.content)
+
+    async def _wait_for(self, batch_id: str):
+        """Poll *batch_id* with exponential backoff until it reaches a terminal status.
+
+        Raises:
+            RuntimeError: If *is_cancelled* reports the owner cancelled.
+        """
+        delay = self._poll_interval
+        while True:
+            batch = await litellm.aretrieve_batch(batch_id=batch_id)
+            if batch.status in self.TERMINAL_STATUSES:
+                return batch
+            if self._is_cancelled is not None and await self._is_cancelled():
+                try:
+                    await litellm.acancel_batch(batch_id=batch_id)
+                except Exception as exc:
+                    logger.warning(f"Could not cancel LLM batch {batch_id}: {exc}")
+                raise RuntimeError(f"LLM batch {batch_id} cancelled")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self._max_poll_interval)
+
+    def _parse_output(self, content: bytes) -> dict[str, LLMResponse | Exception]:
+        """Map each output line's ``custom_id`` to its response or error."""
+        results: dict[str, LLMResponse | Exception] = {}
+        for line in content.splitlines():
+            if not line.strip():
+                continue
+            row = orjson.loads(line)
+            response = row.get("response") or {}
+            if row.get("error") or response.get("status_code") != 200:
+                error = row.get("error") or response.get("body", {}).get("error")
+                results[row["custom_id"]] = RuntimeError(f"Batch request failed: {error}")
+                continue
+
+            body = response["body"]
+            usage = body.get("usage", {})
+            prompt_tokens = usage.get("prompt_tokens", 0)
+            completion_tokens = usage.get("completion_tokens", 0)
+            results[row["custom_id"]] = LLMResponse(
+                content=body["choices"][0]["message"]["content"],
+                model=body["model"],
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                total_tokens=usage.get("total_tokens", prompt_tokens + completion_tokens),
+                cost=self._cost(body["model"], prompt_tokens, completion_tokens),
+            )
+        return results
+
+    @classmethod
+    def _cost(cls, model: str, prompt_tokens: int, completion_tokens: int) -> float:
+        """Online price for the tokens, less the batch discount."""
+        try:
+            prompt_cost, completion_cost = litellm.cost_per_token(
+                model=model, prompt_tokens=prompt_tokens, completion_tokens=completion_tokens
+            )
+        except Exception as exc:
+            logger.warning(f"No pricing for {model}: {exc}")
+            return 0.0
+        return (prompt_cost + completion_cost) * cls.BATCH_DISCOUNT
@@ -0,0 +1,68 @@
+"""Redis-backed memo of deterministic LLM completions."""
+
+from __future__ import annotations
+
+import hashlib
+
+from loguru import logger
+
+from clients.llm_client import LLMResponse
+from clients.redis_client import RedisClient
+
+DEFAULT_TTL = 7 * 24 * 3600  # seconds
+
+
+class LLMCache:
+    """Stores completions of temperature-0 requests, keyed by the full request.
+
+    Sampling at any other temperature is meant to vary between calls, so
+    those requests are never cached. Cache errors are logged and treated as
+    misses; a Redis outage only costs the provider calls it would have saved.
+    """
+
+    def __init__(self, redis_client: RedisClient) -> None:
+        self._redis = redis_client
+
+    @staticmethod
+    def cacheable(temperature: float) -> bool:
+        return temperature == 0
+
+    @staticmethod
+    def cache_key(
+        model: str,
+        temperature: float,
+        system_prompt: str | None,
+        prompt_prefix: str,
+        prompt: str,
+    ) -> str:
+        request = "\x00".join(
+            (model, repr(float(temperature)), system_prompt or "", prompt_prefix, prompt)
+        )
+        digest = hashlib.blake2b(request.encode("utf-8"), digest_size=16).hexdigest()
+        return f"llm:{digest}"
+
+    async def get(self, key: str) -> LLMResponse | None:
+        """Return the cached response for *key*; a hit costs no tokens."""
+        try:
+            (hit,) = await self._redis.get_many([key])
+        except Exception as exc:
+            logger.warning(f"LLM cache unavailable: {exc}")
+            return None
+        if hit is None:
+            return None
+        return LLMResponse(
+            content=hit["content"],
+            model=hit["model"],
+            prompt_tokens=0,
+            completion_tokens=0,
+            total_tokens=0,
+            cost=0.0,
+        )
+
+    async def set(self, key: str, response: LLMResponse, ttl: int = DEFAULT_TTL) -> None:
+        try:
+            await self._redis.set_many(
+                {key: {"content": response.content, "model": response.model}}, ttl=ttl
+            )
+        except Exception as exc:
+            logger.warning(f"Failed to cache LLM response: {exc}")
@@ -2,8 +2,11 @@ import asyncio
 from dataclasses import dataclass
 
 import litellm
+from litellm.exceptions import UnsupportedParamsError
 from loguru import logger
 
+from clients import backoff
+
 
 @dataclass
 class LLMResponse:
@@ -17,12 +20,42 @@ class LLMResponse:
     cost: float
 
 
+_BatchKey = tuple[str, float, str | None, str, str]
+
+# Marks a content block as a reusable prompt-cache prefix (Anthropic)
+_CACHE_CONTROL = {"type": "ephemeral"}
+
+
 class LLMClient:
-    """Async LLM client wrapping litellm with cost tracking and concurrency control."""
+    """Async LLM client wrapping litellm with cost tracking and concurrency control.
+
+    Identical requests (same model, temperature, system prompt and prompt)
+    issued within ``max_wait_ms`` of each other are coalesced into one
+    provider call with ``n`` set to the number of callers; each caller gets
+    its own sampled choice. Chat-completion APIs take a single conversation
+    per request, so this is the only batching they offer. Models whose
+    provider does not accept ``n`` (e.g. Anthropic) get one call per request.
 
-    def __init__(self, max_concurrent: int = 5, max_retries: int = 3) -> None:
+    A ``prompt_prefix`` that stays the same across calls is sent ahead of
+    the prompt so providers can serve it from their prompt cache: Claude
+    models get explicit ``cache_control`` markers, others (e.g. OpenAI)
+    cache matching prefixes automatically.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 5,
+        max_retries: int = 3,
+        max_batch: int = 8,
+        max_wait_ms: float = 5.0,
+    ) -> None:
         self._semaphore = asyncio.Semaphore(max_concurrent)
         self._max_retries = max_retries
+        self._max_batch = max_batch
+        self._max_wait = max_wait_ms / 1000
+        self._pending: dict[_BatchKey, list[asyncio.Future[LLMResponse]]] = {}
+        self._dispatching: set[asyncio.Task] = set()
+        self._supports_n: dict[str, bool] = {}
 
     async def complete(
         self,
@@ -30,6 +63,7 @@ class LLMClient:
         model: str = "gpt-4o-mini",
         temperature: float = 0.7,
         system_prompt: str | None = None,
+        prompt_prefix: str = "",
     ) -> LLMResponse:
         """Send a completion request to the LLM via litellm.
 
@@ -38,6 +72,8 @@ class LLMClient:
             model: The model identifier (e.g. "gpt-4o-mini").
             temperature: Sampling temperature (0.0 - 2.0).
             system_prompt: Optional system prompt prepended to messages.
+            prompt_prefix: Static start of the user message, sent before
+                *prompt* and marked cacheable where the provider supports it.
 
         Returns:
             LLMResponse with content, token counts, and cost.
@@ -45,26 +81,102 @@ class LLMClient:
         Raises:
             Exception: After max retries exhausted on rate-limit errors.
         """
-        messages: list[dict[str, str]] = []
-        if system_prompt is not None:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
-
-        async with self._semaphore:
-            return await self._call_with_retries(
-                model=model,
-                messages=messages,
-                temperature=temperature,
-            )
+        loop = asyncio.get_running_loop()
+        key: _BatchKey = (model, temperature, system_prompt, prompt_prefix, prompt)
+        future: asyncio.Future[LLMResponse] = loop.create_future()
+
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = []
+            loop.call_later(self._max_wait, self._flush, key, batch)
+        batch.append(future)
+        if len(batch) >= (self._max_batch if self._accepts_n(model) else 1):
+            self._flush(key, batch)
+
+        return await future
+
+    def _accepts_n(self, model: str) -> bool:
+        """Whether *model*'s provider takes ``n``, so identical requests can merge."""
+        if model not in self._supports_n:
+            try:
+                params = litellm.get_supported_openai_params(model=model)
+            except Exception:
+                params = None
+            self._supports_n[model] = isinstance(params, list) and "n" in params
+        return self._supports_n[model]
+
+    def _flush(self, key: _BatchKey, batch: list[asyncio.Future[LLMResponse]]) -> None:
+        """Dispatch *batch* if it is still the open batch for *key*."""
+        if self._pending.get(key) is not batch:
+            return  # already dispatched when it filled up
+        del self._pending[key]
+        task = asyncio.create_task(self._dispatch(key, batch))
+        self._dispatching.add(task)
+        task.add_done_callback(self._dispatching.discard)
+
+    async def _dispatch(
+        self, key: _BatchKey, batch: list[asyncio.Future[LLMResponse]]
+    ) -> None:
+        """Run one provider call for *batch* and hand each caller its choice."""
+        model, temperature, system_prompt, prompt_prefix, prompt = key
+        messages = self._build_messages(model, system_prompt, prompt_prefix, prompt)
+
+        try:
+            async with self._semaphore:
+                try:
+                    responses = await self._call_with_retries(
+                        model=model,
+                        messages=messages,
+                        temperature=temperature,
+                        n=len(batch),
+                    )
+                except UnsupportedParamsError:
+                    if len(batch) == 1:
+                        raise
+                    logger.info(f"{model} rejects n; calling once per request")
+                    self._supports_n[model] = False
+                    responses = []
+            # Providers that ignore or reject ``n`` return fewer choices; top
+            # up singly, with at most one call per caller.
+            for _ in range(len(batch)):
+                if len(responses) >= len(batch):
+                    break
+                async with self._semaphore:
+                    responses += await self._call_with_retries(
+                        model=model, messages=messages, temperature=temperature
+                    )
+        except Exception as exc:
+            for future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for i, future in enumerate(batch):
+            if future.done():
+                continue
+            if i < len(responses):
+                future.set_result(responses[i])
+            else:
+                future.set_exception(RuntimeError(f"{model} returned no completion choices"))
 
     async def _call_with_retries(
         self,
         model: str,
-        messages: list[dict[str, str]],
+        messages: list[dict],
         temperature: float,
-    ) -> LLMResponse:
-        """Call litellm.acompletion with exponential-backoff retry on rate limits."""
+        n: int = 1,
+    ) -> list[LLMResponse]:
+        """Call litellm.acompletion, retrying rate limits with jittered backoff.
+
+        A Retry-After hint on the error's response takes precedence over the
+        computed delay.
+
+        Returns one LLMResponse per choice; usage and cost are split evenly
+        across the choices so per-caller totals still add up.
+        """
         last_error: Exception | None = None
+        extra = {"n": n} if n > 1 else {}
+        delay = backoff.BASE_DELAY
 
         for attempt in range(self._max_retries):
             try:
@@ -72,34 +184,79 @@ class LLMClient:
                     model=model,
                     messages=messages,
                     temperature=temperature,
+                    **extra,
                 )
 
                 cost = litellm.completion_cost(completion_response=response)
-
-                return LLMResponse(
-                    content=response.choices[0].message.content,
-                    model=model,
-                    prompt_tokens=response.usage.prompt_tokens,
-                    completion_tokens=response.usage.completion_tokens,
-                    total_tokens=response.usage.total_tokens,
-                    cost=cost,
-                )
+                return self._split_response(response, model, cost)
 
             except Exception as e:
                 if self._is_rate_limit_error(e):
                     last_error = e
-                    backoff = 2**attempt  # 1s, 2s, 4s
+                    if attempt == self._max_retries - 1:
+                        break
+                    hinted = backoff.retry_after(getattr(e, "response", None))
+                    delay = hinted if hinted is not None else backoff.next_delay(delay)
                     logger.warning(
                         f"Rate limit hit (attempt {attempt + 1}/{self._max_retries}), "
-                        f"retrying in {backoff}s"
+                        f"retrying in {delay:.1f}s"
                     )
-                    await asyncio.sleep(backoff)
+                    await asyncio.sleep(delay)
                 else:
                     raise
 
         # All retries exhausted
         raise last_error  # type: ignore[misc]
 
+    @staticmethod
+    def _build_messages(
+        model: str, system_prompt: str | None, prompt_prefix: str, prompt: str
+    ) -> list[dict]:
+        """Build the chat messages, marking static blocks cacheable for Claude."""
+        if "claude" not in model:
+            messages: list[dict] = []
+            if system_prompt is not None:
+                messages.append({"role": "system", "content": system_prompt})
+            messages.append({"role": "user", "content": prompt_prefix + prompt})
+            return messages
+
+        messages = []
+        if system_prompt is not None:
+            messages.append({
+                "role": "system",
+                "content": [
+                    {"type": "text", "text": system_prompt, "cache_control": _CACHE_CONTROL}
+                ],
+            })
+        blocks: list[dict] = []
+        if prompt_prefix:
+            blocks.append({"type": "text", "text": prompt_prefix, "cache_control": _CACHE_CONTROL})
+        blocks.append({"type": "text", "text": prompt})
+        messages.append({"role": "user", "content": blocks})
+        return messages
+
+    @staticmethod
+    def _split_response(response, model: str, cost: float) -> list[LLMResponse]:
+        """Build one LLMResponse per choice, sharing usage and cost between them."""
+        choices = response.choices
+        count = len(choices)
+        usage = response.usage
+        results: list[LLMResponse] = []
+        for i, choice in enumerate(choices):
+            # The first choice absorbs the integer remainder of the token split
+            first = i == 0
+            results.append(
+                LLMResponse(
+                    content=choice.message.content,
+                    model=model,
+                    prompt_tokens=_share(usage.prompt_tokens, count, first),
+                    completion_tokens=_share(usage.completion_tokens, count, first),
+                    total_tokens=_share(usage.total_tokens, count, first),
+                    cost=cost / count,
+                )
+            )
+        return results
+
     @staticmethod
     def _is_rate_limit_error(error: Exception) -> bool:
         """Check whether an exception represents a 429 rate-limit error."""
@@ -108,3 +265,9 @@ class LLMClient:
         if hasattr(error, "status_code") and error.status_code == 429:
             return True
         return False
+
+
+def _share(total: int, count: int, first: bool) -> int:
+    """Even integer share of *total*; the first share also takes the remainder."""
+    share, remainder = divmod(total, count)
+    return share + remainder if first else share
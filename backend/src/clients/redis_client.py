@@ -1,5 +1,4 @@
-import json
-
+import orjson
 import redis.asyncio as redis
 from loguru import logger
 
@@ -22,22 +21,102 @@ class RedisClient:
 
     async def enqueue_job(self, job_id: int, config: dict) -> None:
         """Push a job onto the pipeline queue."""
-        payload = json.dumps({"job_id": job_id, "config": config})
+        payload = orjson.dumps({"job_id": job_id, "config": config})
         await self._redis.lpush("pipeline:jobs", payload)
         logger.info(f"Enqueued job {job_id}")
 
+    async def enqueue_hf_push(self, push_id: int) -> None:
+        """Push a HuggingFace upload onto its own worker queue.
+
+        Uploads take seconds, so they get a separate list that workers pop
+        before ``pipeline:jobs`` rather than queuing behind pipeline runs.
+        """
+        payload = orjson.dumps({"hf_push_id": push_id})
+        await self._redis.lpush("hf:pushes", payload)
+        logger.info(f"Enqueued HuggingFace push {push_id}")
+
+    async def dequeue_jobs(self, max_count: int = 16, timeout: float = 0) -> list[dict]:
+        """Pop up to `max_count` jobs in one round-trip (BLMPOP, Redis >= 7).
+
+        HuggingFace pushes are popped before pipeline jobs. They still need a
+        free worker slot, so while every slot runs a pipeline job a push
+        waits for one of them to finish.
+
+        Blocks for `timeout` seconds while both queues are empty (0 = forever).
+        """
+        result = await self._redis.blmpop(
+            timeout, 2, "hf:pushes", "pipeline:jobs", direction="RIGHT", count=max_count
+        )
+        if not result:
+            return []
+        _, payloads = result
+        return [orjson.loads(payload) for payload in payloads]
+
     async def dequeue_job(self, timeout: int = 0) -> dict | None:
         """Pop a job from the pipeline queue. Blocks for `timeout` seconds."""
-        result = await self._redis.brpop("pipeline:jobs", timeout=timeout)
-        if result:
-            _, payload = result
-            return json.loads(payload)
-        return None
+        jobs = await self.dequeue_jobs(max_count=1, timeout=timeout)
+        return jobs[0] if jobs else None
+
+    async def requeue_jobs(self, payloads: list[dict]) -> None:
+        """Return dequeued but unprocessed jobs to the front of their queues."""
+        pushes = [p for p in payloads if "hf_push_id" in p]
+        jobs = [p for p in payloads if "hf_push_id" not in p]
+        # RPUSH onto the consumer end, last first, so the next pop sees
+        # them in their original order.
+        for queue, items in (("hf:pushes", pushes), ("pipeline:jobs", jobs)):
+            if items:
+                await self._redis.rpush(queue, *(orjson.dumps(p) for p in reversed(items)))
+
+    async def get_many(self, keys: list[str]) -> list:
+        """Fetch several JSON values with one MGET; missing keys come back as None."""
+        if not keys:
+            return []
+        values = await self._redis.mget(keys)
+        return [orjson.loads(v) if v is not None else None for v in values]
+
+    async def set_many(self, items: dict[str, object], ttl: int) -> None:
+        """Store several JSON values, each expiring after `ttl` seconds, in one round-trip."""
+        if not items:
+            return
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for key, value in items.items():
+                pipe.setex(key, ttl, orjson.dumps(value))
+            await pipe.execute()
 
     async def publish(self, channel: str, data: dict) -> None:
         """Publish progress update to a channel."""
-        await self._redis.publish(channel, json.dumps(data))
+        await self._redis.publish(channel, orjson.dumps(data))
+
+    async def publish_many(self, events: list[tuple[str, dict]]) -> None:
+        """Publish several (channel, data) updates in order, in one round-trip."""
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for channel, data in events:
+                pipe.publish(channel, orjson.dumps(data))
+            await pipe.execute()
 
     async def close(self) -> None:
         """Close Redis connection."""
         await self._redis.close()
+
+
+_shared_client: RedisClient | None = None
+
+
+def get_redis_client() -> RedisClient:
+    """Return the process-wide RedisClient. Used as FastAPI dependency.
+
+    redis-py pools connections inside the client, so one instance serves
+    all concurrent requests instead of reconnecting per request.
+    """
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = RedisClient()
+    return _shared_client
+
+
+async def close_redis_client() -> None:
+    """Close the shared RedisClient, if one was created."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.close()
+        _shared_client = None
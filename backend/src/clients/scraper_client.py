@@ -1,3 +1,6 @@
+import asyncio
+import re
+import time
 from dataclasses import dataclass
 from urllib.parse import urlparse
 from urllib.robotparser import RobotFileParser
@@ -5,6 +8,31 @@ from urllib.robotparser import RobotFileParser
 import httpx
 from loguru import logger
 
+from clients import backoff
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+ROBOTS_TTL = 3600.0  # seconds a parsed robots.txt is reused
+
+# robots.txt parsers shared across ScraperClient instances, keyed by robots URL
+_robots_cache: dict[str, tuple[float, RobotFileParser]] = {}
+# One lock per site, kept for the life of the process like the cache entries:
+# dropping it while checks still wait on it would let a newcomer fetch in parallel
+_robots_locks: dict[str, asyncio.Lock] = {}
+
+_LEADING_SPACE = re.compile(r"\s*")
+_BODY_TAG = re.compile(r"<body", re.IGNORECASE)
+# Paragraph/article content, or common JS framework indicators in otherwise
+# empty pages: Next.js, Vue.js, React mount points and a <noscript> fallback.
+_PAGE_MARKERS = re.compile(
+    r'(?P<content><p|<article)|id="(?:__next|app|root)"|<noscript>',
+    re.IGNORECASE,
+)
+
 
 @dataclass
 class ScrapeResult:
@@ -16,16 +44,77 @@ class ScrapeResult:
     error: str | None = None
     title: str | None = None
     language: str | None = None
+    content_type: str | None = None  # media type only, e.g. "text/html"
+
+
+# Media types the JS-rendering heuristic applies to ("" = header missing)
+_HTML_CONTENT_TYPES = frozenset({"text/html", "application/xhtml+xml", ""})
 
 
 class ScraperClient:
     """Scrapes URLs using httpx with optional Playwright fallback."""
 
     USER_AGENT = "AIDataFactory/0.1.0 (+https://github.com/ai-data-factory)"
+    # Built once and handed to the pooled client. Accept-Encoding is left to
+    # httpx, which advertises br/zstd only when their decoders are installed.
+    DEFAULT_HEADERS = httpx.Headers({
+        "User-Agent": USER_AGENT,
+        "Accept": "text/html,application/xhtml+xml;q=0.9,*/*;q=0.8",
+    })
     TIMEOUT = 30.0  # seconds
+    ROBOTS_TIMEOUT = 10.0  # seconds
+    MAX_BODY_BYTES = 5 * 1024 * 1024  # larger pages are truncated
+    READ_CHUNK_SIZE = 64 * 1024
+    THROTTLED_STATUSES = frozenset({429, 503})  # retried after a backoff delay
+    MAX_BROWSER_PAGES = 4  # concurrent Playwright pages per browser
 
     def __init__(self) -> None:
-        self._robots_cache: dict[str, RobotFileParser] = {}
+        self._client: httpx.AsyncClient | None = None
+        self._playwright = None
+        self._browser = None
+        self._browser_lock = asyncio.Lock()
+        self._page_semaphore = asyncio.Semaphore(self.MAX_BROWSER_PAGES)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client, creating it on first use.
+
+        One client is shared by every scrape and robots.txt fetch so
+        connections (and TLS sessions) to a host are reused.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                follow_redirects=True,
+                timeout=self.TIMEOUT,
+                headers=self.DEFAULT_HEADERS,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+                http2=_HTTP2_AVAILABLE,
+            )
+        return self._client
+
+    async def _get_browser(self):
+        """Return the shared Chromium instance, launching it on first use.
+
+        Raises ImportError if Playwright is not installed.
+        """
+        async with self._browser_lock:
+            if self._browser is None:
+                from playwright.async_api import async_playwright
+
+                self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(headless=True)
+        return self._browser
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client and the shared browser, if started."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
 
     async def scrape_url(
         self,
@@ -55,40 +144,30 @@ class ScraperClient:
     async def _scrape_with_httpx(self, url: str, retry_attempts: int = 3) -> ScrapeResult:
         """Scrape using httpx (fast path for static pages)."""
         last_error = None
+        delay = backoff.BASE_DELAY
         for attempt in range(retry_attempts):
+            hinted = None
             try:
-                async with httpx.AsyncClient(
-                    follow_redirects=True,
-                    timeout=self.TIMEOUT,
-                    headers={"User-Agent": self.USER_AGENT},
-                ) as client:
-                    response = await client.get(url)
-
+                async with self._get_client().stream("GET", url) as response:
                     if response.status_code == 200:
-                        html = response.text
-
-                        # Extract basic metadata from headers
-                        language = None
-                        if "content-language" in response.headers:
-                            language = response.headers["content-language"].split(",")[0].strip()
-
-                        return ScrapeResult(
-                            url=url,
-                            html=html,
-                            status_code=response.status_code,
-                            method="httpx",
-                            language=language,
-                        )
-                    else:
-                        last_error = f"HTTP {response.status_code}"
+                        return await self._read_response(url, response)
+
+                    # Body is never read for failed responses
+                    last_error = f"HTTP {response.status_code}"
+                    if response.status_code not in self.THROTTLED_STATUSES:
+                        continue
+                    hinted = backoff.retry_after(response)
 
             except Exception as e:
                 last_error = str(e)
-                if attempt < retry_attempts - 1:
-                    import asyncio
-                    wait = 2 ** attempt  # exponential backoff: 1s, 2s, 4s
-                    logger.warning(f"Retry {attempt + 1}/{retry_attempts} for {url}: {e}")
-                    await asyncio.sleep(wait)
+
+            # Reached on errors and throttling responses (429/503)
+            if attempt < retry_attempts - 1:
+                delay = hinted if hinted is not None else backoff.next_delay(delay)
+                logger.warning(
+                    f"Retry {attempt + 1}/{retry_attempts} for {url} in {delay:.1f}s: {last_error}"
+                )
+                await asyncio.sleep(delay)
 
         return ScrapeResult(
             url=url,
@@ -98,10 +177,40 @@ class ScraperClient:
             error=last_error,
         )
 
+    async def _read_response(self, url: str, response: httpx.Response) -> ScrapeResult:
+        """Read a streamed 200 response, truncating bodies over MAX_BODY_BYTES."""
+        body = bytearray()
+        async for chunk in response.aiter_bytes(self.READ_CHUNK_SIZE):
+            body += chunk
+            if len(body) > self.MAX_BODY_BYTES:
+                logger.warning(f"Truncating {url} at {self.MAX_BODY_BYTES} bytes")
+                del body[self.MAX_BODY_BYTES:]
+                break
+
+        html = body.decode(response.encoding or "utf-8", errors="replace")
+
+        # Extract basic metadata from headers
+        language = None
+        if "content-language" in response.headers:
+            language = response.headers["content-language"].split(",")[0].strip()
+
+        return ScrapeResult(
+            url=url,
+            html=html,
+            status_code=response.status_code,
+            method="httpx",
+            language=language,
+            content_type=response.headers.get("content-type", "").split(";")[0].strip().lower(),
+        )
+
     async def _scrape_with_playwright(self, url: str) -> ScrapeResult:
-        """Scrape using Playwright (for JS-heavy pages)."""
+        """Scrape using Playwright (for JS-heavy pages).
+
+        The browser is launched once and shared; each scrape gets its own
+        context so cookies and storage do not leak between URLs.
+        """
         try:
-            from playwright.async_api import async_playwright
+            browser = await self._get_browser()
         except ImportError:
             return ScrapeResult(
                 url=url,
@@ -110,26 +219,34 @@ class ScraperClient:
                 method="playwright",
                 error="Playwright not installed. Install with: pip install playwright && playwright install chromium",
             )
+        except Exception as e:
+            return ScrapeResult(
+                url=url,
+                html=None,
+                status_code=None,
+                method="playwright",
+                error=str(e),
+            )
 
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                page = await browser.new_page(user_agent=self.USER_AGENT)
-
-                response = await page.goto(url, wait_until="networkidle", timeout=self.TIMEOUT * 1000)
-                html = await page.content()
-                status_code = response.status if response else None
-                title = await page.title()
-
-                await browser.close()
-
-                return ScrapeResult(
-                    url=url,
-                    html=html,
-                    status_code=status_code,
-                    method="playwright",
-                    title=title,
-                )
+            async with self._page_semaphore:
+                context = await browser.new_context(user_agent=self.USER_AGENT)
+                try:
+                    page = await context.new_page()
+                    response = await page.goto(url, wait_until="networkidle", timeout=self.TIMEOUT * 1000)
+                    html = await page.content()
+                    status_code = response.status if response else None
+                    title = await page.title()
+                finally:
+                    await context.close()
+
+            return ScrapeResult(
+                url=url,
+                html=html,
+                status_code=status_code,
+                method="playwright",
+                title=title,
+            )
         except Exception as e:
             return ScrapeResult(
                 url=url,
@@ -140,45 +257,86 @@ class ScraperClient:
             )
 
     def _needs_playwright(self, result: ScrapeResult) -> bool:
-        """Heuristic: does the httpx result look like it needs JS rendering?"""
+        """Heuristic: does the httpx result look like it needs JS rendering?
+
+        Works on the original string in a single case-insensitive scan rather
+        than lowercasing a copy of the page and searching it once per marker.
+        """
         if result.error or result.html is None:
             return True
-        html = result.html.strip().lower()
+        # PDFs, JSON, plain text etc. gain nothing from a browser render
+        if result.content_type is not None and result.content_type not in _HTML_CONTENT_TYPES:
+            return False
+        html = result.html
+
         # Very short body often means JS-rendered content
-        if len(html) < 500:
+        start = _LEADING_SPACE.match(html).end()
+        end = len(html)
+        while end > start and html[end - 1].isspace():
+            end -= 1
+        if end - start < 500:
             return True
-        # Common JS framework indicators in otherwise empty pages
-        js_indicators = [
-            'id="__next"',      # Next.js
-            'id="app"',         # Vue.js
-            'id="root"',        # React
-            "<noscript>",         # Noscript fallback = JS required
-        ]
-        body_content = html.split("<body")[1] if "<body" in html else html
-        # If body is mostly empty except for a single div + scripts
-        if body_content.count("<p") == 0 and body_content.count("<article") == 0:
-            for indicator in js_indicators:
-                if indicator in body_content:
-                    return True
-        return False
+
+        # Only the <body ...> section (up to any second "<body") is inspected
+        body = _BODY_TAG.search(html, start, end)
+        if body is not None:
+            start = body.end()
+            next_body = _BODY_TAG.search(html, start, end)
+            if next_body is not None:
+                end = next_body.start()
+
+        # If body is mostly empty except for a single div + scripts: no <p> or
+        # <article>, but a JS framework mount point or <noscript> fallback.
+        has_js_indicator = False
+        for match in _PAGE_MARKERS.finditer(html, start, end):
+            if match.lastgroup == "content":
+                return False
+            has_js_indicator = True
+        return has_js_indicator
 
     async def check_robots_txt(self, url: str) -> bool:
-        """Check if we're allowed to scrape this URL per robots.txt."""
+        """Check if we're allowed to scrape this URL per robots.txt.
+
+        Parsed robots.txt files are cached per site for ROBOTS_TTL seconds and
+        shared by all ScraperClient instances; concurrent checks for the same
+        site wait for a single fetch.
+        """
         parsed = urlparse(url)
         robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
 
-        if robots_url in self._robots_cache:
-            rp = self._robots_cache[robots_url]
-            return rp.can_fetch(self.USER_AGENT, url)
+        rp = _cached_robots(robots_url)
+        if rp is None:
+            lock = _robots_locks.setdefault(robots_url, asyncio.Lock())
+            try:
+                async with lock:
+                    rp = _cached_robots(robots_url)
+                    if rp is None:
+                        response = await self._get_client().get(
+                            robots_url, timeout=self.ROBOTS_TIMEOUT
+                        )
+                        rp = await asyncio.to_thread(_parse_robots, response.text)
+                        _robots_cache[robots_url] = (time.monotonic(), rp)
+            except Exception:
+                # If we can't fetch robots.txt, assume allowed
+                logger.debug(f"Could not fetch robots.txt for {parsed.netloc}, allowing scrape")
+                return True
 
-        try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(robots_url)
-                rp = RobotFileParser()
-                rp.parse(response.text.splitlines())
-                self._robots_cache[robots_url] = rp
-                return rp.can_fetch(self.USER_AGENT, url)
-        except Exception:
-            # If we can't fetch robots.txt, assume allowed
-            logger.debug(f"Could not fetch robots.txt for {parsed.netloc}, allowing scrape")
-            return True
+        return rp.can_fetch(self.USER_AGENT, url)
+
+
+def _cached_robots(robots_url: str) -> RobotFileParser | None:
+    """Return the cached parser for *robots_url* unless it has expired."""
+    entry = _robots_cache.get(robots_url)
+    if entry is None:
+        return None
+    fetched_at, rp = entry
+    if time.monotonic() - fetched_at > ROBOTS_TTL:
+        del _robots_cache[robots_url]
+        return None
+    return rp
+
+
+def _parse_robots(text: str) -> RobotFileParser:
+    rp = RobotFileParser()
+    rp.parse(text.splitlines())
+    return rp
@@ -14,6 +14,10 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = "sqlite+aiosqlite:///db/factory.db"
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 1800
 
     # Redis
     redis_url: str = "redis://localhost:6379/0"
@@ -21,6 +25,9 @@ class Settings(BaseSettings):
     # Logging
     log_level: str = "INFO"
 
+    # Worker
+    worker_concurrency: int = 2  # pipeline jobs run side by side per worker
+
     # Data paths
     data_dir: Path = Path("data")
 
@@ -1,5 +1,7 @@
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy import text
+from sqlalchemy import event, insert
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from config import get_settings
 
@@ -17,15 +19,58 @@ async def init_db() -> None:
         settings.database_url,
         echo=settings.debug,
         connect_args={"check_same_thread": False},
+        json_serializer=_json_dumps,
+        json_deserializer=orjson.loads,
+        **_pool_options(settings),
     )
+    if _engine.dialect.name == "sqlite":
+        event.listen(_engine.sync_engine, "connect", _set_sqlite_pragmas)
     _session_factory = async_sessionmaker(_engine, expire_on_commit=False)
 
     async with _engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
-    # Enable WAL mode for concurrent reads
-    async with _engine.begin() as conn:
-        await conn.execute(text("PRAGMA journal_mode=WAL"))
+
+def _json_dumps(value) -> str:
+    """Serialize JSON columns with orjson (non-str keys coerced like json.dumps)."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",  # readers don't block the writer
+    "PRAGMA synchronous=NORMAL",  # fsync at checkpoints, not every commit (safe with WAL)
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MiB
+    "PRAGMA cache_size=-65536",  # 64 MiB
+    "PRAGMA busy_timeout=5000",  # ms
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Apply the SQLite PRAGMAs to every new pooled connection."""
+    cursor = dbapi_connection.cursor()
+    for pragma in _SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+def _pool_options(settings) -> dict:
+    """Pool arguments for the async engine.
+
+    In-memory SQLite keeps its default single-connection pool, since every new
+    connection would open an empty database.
+    """
+    if ":memory:" in settings.database_url:
+        return {}
+    return {
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        # Server databases can drop idle connections; a local SQLite file cannot.
+        "pool_pre_ping": not settings.database_url.startswith("sqlite"),
+    }
 
 
 async def close_db() -> None:
@@ -52,3 +97,22 @@ async def get_async_session() -> AsyncSession:
         raise RuntimeError("Database not initialized. Call init_db() first.")
     async with _session_factory() as session:
         yield session
+
+
+# Rows per INSERT statement; keeps each statement well under SQLite's
+# bound-parameter limit for wide tables.
+BULK_INSERT_BATCH_SIZE = 500
+
+
+async def bulk_insert(session: AsyncSession, model, rows: list[dict]) -> list[int]:
+    """Insert `rows` into `model`'s table and return the new ids in row order.
+
+    Each batch is a single multi-row INSERT ... RETURNING instead of one
+    statement per ORM object. The caller commits.
+    """
+    ids: list[int] = []
+    stmt = insert(model).returning(model.id, sort_by_parameter_order=True)
+    for start in range(0, len(rows), BULK_INSERT_BATCH_SIZE):
+        result = await session.scalars(stmt, rows[start:start + BULK_INSERT_BATCH_SIZE])
+        ids.extend(result.all())
+    return ids
@@ -1,11 +1,41 @@
-from datetime import datetime, timezone
+from datetime import datetime
 
-from sqlalchemy import JSON, Float, Integer, String, Text, Boolean
+from sqlalchemy import JSON, DateTime, Float, Index, Integer, String, Text, Boolean, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.sql.expression import FunctionElement
+
+
+class utcnow(FunctionElement):
+    """Current UTC time, evaluated by the database rather than in Python."""
+
+    type = DateTime(timezone=True)
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _utcnow_default(element, compiler, **kw) -> str:
+    # Timestamp columns are timezone-aware, so no UTC conversion is needed
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "sqlite")
+def _utcnow_sqlite(element, compiler, **kw) -> str:
+    # CURRENT_TIMESTAMP only has second resolution in SQLite
+    return "STRFTIME('%Y-%m-%d %H:%M:%f', 'now')"
+
+
+# Binary JSONB on PostgreSQL; JSON text elsewhere
+JSONType = JSON().with_variant(JSONB(), "postgresql")
 
 
 class Base(DeclarativeBase):
-    pass
+    # Fetch database-generated timestamps via RETURNING in the same statement
+    __mapper_args__ = {"eager_defaults": True}
+
+    # TIMESTAMPTZ on PostgreSQL; SQLite stores the same text either way
+    type_annotation_map = {datetime: DateTime(timezone=True)}
 
 
 class Project(Base):
@@ -14,36 +44,48 @@ class Project(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
-    config: Mapped[dict | None] = mapped_column(JSON, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(
-        default=lambda: datetime.now(timezone.utc)
-    )
+    config: Mapped[dict | None] = mapped_column(JSONType, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(default=utcnow(), server_default=utcnow())
     updated_at: Mapped[datetime] = mapped_column(
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        default=utcnow(), server_default=utcnow(), onupdate=utcnow()
     )
 
 
 class Job(Base):
     __tablename__ = "jobs"
+    __table_args__ = (
+        # list_jobs: WHERE project_id = ? ORDER BY created_at DESC
+        Index("ix_jobs_project_created", "project_id", "created_at"),
+        # get_costs: WHERE status = 'completed' ORDER BY completed_at DESC
+        Index(
+            "ix_jobs_completed_at",
+            "completed_at",
+            sqlite_where=text("status = 'completed'"),
+            postgresql_where=text("status = 'completed'"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     project_id: Mapped[int] = mapped_column(Integer, nullable=False)
     status: Mapped[str] = mapped_column(String(50), default="pending")
     stage: Mapped[str | None] = mapped_column(String(50), nullable=True)
-    config: Mapped[dict] = mapped_column(JSON, nullable=False)
+    config: Mapped[dict] = mapped_column(JSONType, nullable=False)
     progress: Mapped[float] = mapped_column(Float, default=0.0)
     error: Mapped[str | None] = mapped_column(Text, nullable=True)
     cost_total: Mapped[float] = mapped_column(Float, default=0.0)
+    # Provider batch of a use_batch_api job, so a stuck batch can be traced
+    llm_batch_id: Mapped[str | None] = mapped_column(String(100), nullable=True)
     started_at: Mapped[datetime | None] = mapped_column(nullable=True)
     completed_at: Mapped[datetime | None] = mapped_column(nullable=True)
-    created_at: Mapped[datetime] = mapped_column(
-        default=lambda: datetime.now(timezone.utc)
-    )
+    created_at: Mapped[datetime] = mapped_column(default=utcnow(), server_default=utcnow())
 
 
 class RawDocument(Base):
     __tablename__ = "raw_documents"
+    __table_args__ = (
+        # documents of a job, optionally filtered by scrape outcome
+        Index("ix_raw_documents_job_status", "job_id", "scrape_status"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     job_id: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -52,27 +94,32 @@ class RawDocument(Base):
     title: Mapped[str | None] = mapped_column(String(512), nullable=True)
     language: Mapped[str | None] = mapped_column(String(10), nullable=True)
     scrape_status: Mapped[str] = mapped_column(String(50), default="pending")
-    created_at: Mapped[datetime] = mapped_column(
-        default=lambda: datetime.now(timezone.utc)
-    )
+    created_at: Mapped[datetime] = mapped_column(default=utcnow(), server_default=utcnow())
 
 
 class Chunk(Base):
     __tablename__ = "chunks"
+    __table_args__ = (
+        # chunks of a document in order: WHERE document_id = ? ORDER BY chunk_index
+        Index("ix_chunks_document_index", "document_id", "chunk_index"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     document_id: Mapped[int] = mapped_column(Integer, nullable=False)
     content: Mapped[str] = mapped_column(Text, nullable=False)
     token_count: Mapped[int] = mapped_column(Integer, nullable=False)
     chunk_index: Mapped[int] = mapped_column(Integer, nullable=False)
-    chunk_metadata: Mapped[dict | None] = mapped_column("metadata", JSON, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(
-        default=lambda: datetime.now(timezone.utc)
-    )
+    chunk_metadata: Mapped[dict | None] = mapped_column("metadata", JSONType, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(default=utcnow(), server_default=utcnow())
 
 
 class TrainingExample(Base):
     __tablename__ = "training_examples"
+    __table_args__ = (
+        # compare_jobs / per-job QC stats: covers the job_id filter and the
+        # passed_qc count and quality_score average without touching rows
+        Index("ix_training_examples_job_qc", "job_id", "passed_qc", "quality_score"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     chunk_id: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -84,11 +131,9 @@ class TrainingExample(Base):
     token_count: Mapped[int] = mapped_column(Integer, default=0)
     cost: Mapped[float] = mapped_column(Float, default=0.0)
     quality_score: Mapped[float | None] = mapped_column(Float, nullable=True)
-    quality_details: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    quality_details: Mapped[dict | None] = mapped_column(JSONType, nullable=True)
     passed_qc: Mapped[bool | None] = mapped_column(Boolean, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(
-        default=lambda: datetime.now(timezone.utc)
-    )
+    created_at: Mapped[datetime] = mapped_column(default=utcnow(), server_default=utcnow())
 
 
 class CustomTemplate(Base):
@@ -99,18 +144,19 @@ class CustomTemplate(Base):
     template_type: Mapped[str] = mapped_column(String(50), nullable=False)
     system_prompt: Mapped[str] = mapped_column(Text, nullable=False)
     user_prompt_template: Mapped[str] = mapped_column(Text, nullable=False)
-    output_schema: Mapped[dict | None] = mapped_column(JSON, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(
-        default=lambda: datetime.now(timezone.utc)
-    )
+    output_schema: Mapped[dict | None] = mapped_column(JSONType, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(default=utcnow(), server_default=utcnow())
     updated_at: Mapped[datetime] = mapped_column(
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        default=utcnow(), server_default=utcnow(), onupdate=utcnow()
     )
 
 
 class Export(Base):
     __tablename__ = "exports"
+    __table_args__ = (
+        # list_exports: WHERE job_id = ? ORDER BY created_at DESC
+        Index("ix_exports_job_created", "job_id", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     job_id: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -119,6 +165,19 @@ class Export(Base):
     record_count: Mapped[int] = mapped_column(Integer, default=0)
     version: Mapped[str] = mapped_column(String(50), nullable=False)
     dataset_card: Mapped[str | None] = mapped_column(Text, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(
-        default=lambda: datetime.now(timezone.utc)
-    )
+    created_at: Mapped[datetime] = mapped_column(default=utcnow(), server_default=utcnow())
+
+
+class HFPushJob(Base):
+    __tablename__ = "hf_push_jobs"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    export_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    repo_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    private: Mapped[bool] = mapped_column(Boolean, default=False)
+    status: Mapped[str] = mapped_column(String(50), default="pending")
+    url: Mapped[str | None] = mapped_column(String(512), nullable=True)
+    files_uploaded: Mapped[int] = mapped_column(Integer, default=0)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(default=utcnow(), server_default=utcnow())
+    completed_at: Mapped[datetime | None] = mapped_column(nullable=True)
@@ -1,10 +1,15 @@
 import sys
+from pathlib import Path
 
 from loguru import logger
 
 
-def setup_logging(level: str = "INFO") -> None:
-    """Configure loguru for the application."""
+def setup_logging(level: str = "INFO", log_dir: str | Path = "data/logs") -> None:
+    """Configure loguru for the application, with daily log files in *log_dir*.
+
+    Both sinks are enqueued: log calls only hand the record to a background
+    writer thread, which does the I/O and the file rotation/compression.
+    """
     logger.remove()
     logger.add(
         sys.stderr,
@@ -15,13 +20,16 @@ def setup_logging(level: str = "INFO") -> None:
             "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | "
             "<level>{message}</level>"
         ),
-        colorize=True,
+        # ANSI colors only when stderr is a terminal (not in docker logs/pipes)
+        colorize=sys.stderr.isatty(),
+        enqueue=True,
     )
     logger.add(
-        "data/logs/factory_{time:YYYY-MM-DD}.log",
+        Path(log_dir) / "factory_{time:YYYY-MM-DD}.log",
         level=level,
         format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} | {message}",
         rotation="1 day",
         retention="7 days",
         compression="zip",
+        enqueue=True,
     )
@@ -5,6 +5,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from loguru import logger
 
+from clients.redis_client import close_redis_client
 from config import get_settings
 from logging_config import setup_logging
 from db.database import init_db, close_db
@@ -12,16 +13,33 @@ from api.routes import health, projects, jobs, exports, stream, stats, templates
 from api.routes import settings as settings_routes
 
 
+DATA_SUBDIRS = ("raw", "processed", "generated", "exports", "logs")
+
+
+def _provision_data_dirs(data_dir: Path) -> None:
+    """Create the data subdirectories once; later starts only stat a marker file.
+
+    Pipeline stages still create their own output directory before writing,
+    so a subdirectory removed after provisioning is recreated on demand.
+    """
+    marker = data_dir / ".provisioned"
+    if marker.exists():
+        return
+    for subdir in DATA_SUBDIRS:
+        (data_dir / subdir).mkdir(parents=True, exist_ok=True)
+    marker.touch()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup and shutdown events."""
     settings = get_settings()
-    setup_logging(level=settings.log_level)
+    setup_logging(level=settings.log_level, log_dir=settings.data_dir / "logs")
     logger.info("Starting AI Data Factory API...")
 
     # Ensure data directories exist
-    for subdir in ["raw", "processed", "generated", "exports", "logs"]:
-        (settings.data_dir / subdir).mkdir(parents=True, exist_ok=True)
+    _provision_data_dirs(settings.data_dir)
+    # Not covered by the marker: db/ may be a separately mounted volume
     Path("db").mkdir(parents=True, exist_ok=True)
 
     # Initialize database
@@ -41,8 +59,10 @@ async def lifespan(app: FastAPI):
     yield
 
     # Shutdown
+    await close_redis_client()
     await close_db()
     logger.info("AI Data Factory API stopped")
+    await logger.complete()  # drain the enqueued log sinks
 
 
 app = FastAPI(
@@ -0,0 +1,27 @@
+"""MinHash signatures shared by chunk deduplication and duplicate checks."""
+
+from collections.abc import Iterable
+
+from datasketch import LeanMinHash, MinHash
+
+
+def shingles(text: str, k: int = 3) -> set[bytes]:
+    """Return the set of UTF-8 encoded word-level k-shingles for *text*.
+
+    Words are encoded once and the windows joined as bytes, so no shingle
+    is built as a ``str`` only to be encoded again for hashing.
+    """
+    words = [word.encode("utf-8") for word in text.lower().split()]
+    if len(words) < k:
+        return {b" ".join(words)}
+    return set(map(b" ".join, zip(*(words[i:] for i in range(k)))))
+
+
+def signatures(token_sets: Iterable[Iterable[bytes]], num_perm: int = 128) -> list[LeanMinHash]:
+    """Return the MinHash signature of each set of UTF-8 encoded tokens.
+
+    ``MinHash.bulk`` sets up the hash permutations once for the whole list
+    and applies them to each set's hashes in one NumPy pass; the lean copies
+    drop the permutation arrays a plain ``MinHash`` keeps per instance.
+    """
+    return [LeanMinHash(m) for m in MinHash.bulk(token_sets, num_perm=num_perm)]
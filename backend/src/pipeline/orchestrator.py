@@ -2,16 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
 from typing import Any
 
+import orjson
 from loguru import logger
-from sqlalchemy import select
+from sqlalchemy import insert, select, update
 from sqlalchemy.ext.asyncio import async_sessionmaker
 
+from clients.batch_llm_client import BatchLLMClient
+from clients.llm_cache import LLMCache
 from clients.llm_client import LLMClient
 from clients.redis_client import RedisClient
 from config import get_settings
+from db.database import bulk_insert
 from db.models import Export, Job, TrainingExample
 from pipeline.base import StageResult
 from pipeline.stages.export import ShipperStage
@@ -26,6 +33,11 @@ class PipelineOrchestrator:
 
     STAGES = ["spider", "refiner", "factory", "inspector", "shipper"]
 
+    # Non-terminal progress events are buffered this long (seconds) so bursts
+    # go out in one Redis round-trip; terminal events are flushed at once.
+    PROGRESS_FLUSH_INTERVAL = 0.05
+    TERMINAL_STATUSES = frozenset({"completed", "failed", "cancelled"})
+
     STAGE_PROGRESS: dict[str, float] = {
         "spider": 0.1,
         "refiner": 0.3,
@@ -43,33 +55,52 @@ class PipelineOrchestrator:
         self._session_factory = session_factory
         self._redis = redis_client
         self._llm_client = llm_client
+        # Progress events waiting to be published in one pipelined batch
+        self._pending_events: list[tuple[str, dict[str, Any]]] = []
+        self._flush_task: asyncio.Task | None = None
+        self._flush_lock = asyncio.Lock()
 
     # ------------------------------------------------------------------
     # Stage construction
     # ------------------------------------------------------------------
 
-    def _build_stages(self) -> dict[str, Any]:
-        """Instantiate all pipeline stages with their dependencies."""
+    def _build_stages(self, job_id: int) -> dict[str, Any]:
+        """Instantiate all pipeline stages for *job_id* with their dependencies."""
         settings = get_settings()
         return {
             "spider": SpiderStage(data_dir=settings.data_dir),
             "refiner": RefinerStage(),
-            "factory": FactoryStage(llm_client=self._llm_client),
-            "inspector": InspectorStage(),
+            "factory": FactoryStage(
+                llm_client=self._llm_client,
+                llm_cache=LLMCache(self._redis) if self._redis is not None else None,
+                batch_llm_client=BatchLLMClient(
+                    on_submit=partial(self._record_llm_batch, job_id),
+                    is_cancelled=partial(self._is_cancelled, job_id),
+                ),
+            ),
+            "inspector": InspectorStage(redis_client=self._redis),
             "shipper": ShipperStage(),
         }
 
+    @staticmethod
+    async def _preload_models(inspector: InspectorStage, checks: list[str]) -> None:
+        """Load the inspector's models in a worker thread; failures are retried on use."""
+        try:
+            await asyncio.to_thread(inspector.preload_models, checks)
+        except Exception as exc:
+            logger.warning(f"Model preload failed, loading on first use: {exc}")
+
     # ------------------------------------------------------------------
     # Config mapping
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _stage_config(stage_name: str, job: Job) -> dict[str, Any]:
-        """Extract the per-stage config slice from the job's config dict."""
+    def _stage_configs(job: Job) -> dict[str, dict[str, Any]]:
+        """Slice the job's config dict into per-stage configs, keyed by stage."""
         config = job.config or {}
         job_id = job.id
 
-        mapping: dict[str, dict[str, Any]] = {
+        return {
             "spider": {**config.get("scraping", {}), "job_id": job_id},
             "refiner": config.get("processing", {}),
             "factory": config.get("generation", {}),
@@ -80,20 +111,39 @@ class PipelineOrchestrator:
                 "data_dir": str(get_settings().data_dir),
             },
         }
-        return mapping.get(stage_name, {})
 
     # ------------------------------------------------------------------
-    # Cancellation check
+    # Stage bookkeeping
     # ------------------------------------------------------------------
 
-    async def _check_cancelled(self, job_id: int) -> bool:
-        """Check if a job has been cancelled. Returns True if cancelled."""
-        if self._session_factory is None:
-            return False
+    async def _start_stage(self, job_id: int, stage_name: str, progress: float) -> bool:
+        """Set the job's current stage and progress in a single UPDATE.
+
+        The UPDATE skips cancelled jobs, so it doubles as the cancellation
+        check: returns False when the job was cancelled (or no longer exists).
+        """
         async with self._session_factory() as session:
-            result = await session.execute(select(Job).where(Job.id == job_id))
-            job = result.scalar_one_or_none()
-            return job is not None and job.status == "cancelled"
+            result = await session.execute(
+                update(Job)
+                .where(Job.id == job_id, Job.status != "cancelled")
+                .values(stage=stage_name, progress=progress)
+            )
+            await session.commit()
+        return result.rowcount > 0
+
+    async def _is_cancelled(self, job_id: int) -> bool:
+        """Whether *job_id* was cancelled while a stage is running."""
+        async with self._session_factory() as session:
+            status = await session.scalar(select(Job.status).where(Job.id == job_id))
+        return status == "cancelled"
+
+    async def _record_llm_batch(self, job_id: int, batch_id: str) -> None:
+        """Store the provider batch the Factory is waiting on."""
+        async with self._session_factory() as session:
+            await session.execute(
+                update(Job).where(Job.id == job_id).values(llm_batch_id=batch_id)
+            )
+            await session.commit()
 
     # ------------------------------------------------------------------
     # Progress publishing
@@ -107,7 +157,11 @@ class PipelineOrchestrator:
         status: str,
         error: str | None = None,
     ) -> None:
-        """Publish a progress event via Redis Pub/Sub."""
+        """Queue a progress event for Redis Pub/Sub.
+
+        Events are published in order. Terminal statuses flush the queue
+        before returning, so callers see them delivered when the job ends.
+        """
         if self._redis is None:
             return
         data: dict[str, Any] = {
@@ -117,10 +171,31 @@ class PipelineOrchestrator:
         }
         if error is not None:
             data["error"] = error
-        try:
-            await self._redis.publish(f"pipeline:progress:{job_id}", data)
-        except Exception as exc:
-            logger.warning(f"Failed to publish progress for job {job_id}: {exc}")
+        self._pending_events.append((f"pipeline:progress:{job_id}", data))
+
+        if status in self.TERMINAL_STATUSES:
+            await self._flush_progress()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_progress_later())
+
+    async def _flush_progress_later(self) -> None:
+        await asyncio.sleep(self.PROGRESS_FLUSH_INTERVAL)
+        await self._flush_progress()
+
+    async def _flush_progress(self) -> None:
+        """Publish every queued progress event in one pipelined round-trip."""
+        # The lock keeps batches in order when a timed and a terminal flush overlap
+        async with self._flush_lock:
+            events, self._pending_events = self._pending_events, []
+            if not events:
+                return
+            try:
+                if len(events) == 1:
+                    await self._redis.publish(*events[0])
+                else:
+                    await self._redis.publish_many(events)
+            except Exception as exc:
+                logger.warning(f"Failed to publish {len(events)} progress event(s): {exc}")
 
     # ------------------------------------------------------------------
     # Main run loop
@@ -137,149 +212,177 @@ class PipelineOrchestrator:
         if self._session_factory is None:
             raise RuntimeError("session_factory is required")
 
-        # --- Load job ---
+        # --- Claim the job: pending -> running in one conditional UPDATE ---
         async with self._session_factory() as session:
-            result = await session.execute(select(Job).where(Job.id == job_id))
-            job = result.scalar_one_or_none()
+            job = await session.scalar(
+                update(Job)
+                .where(Job.id == job_id, Job.status == "pending")
+                .values(status="running", started_at=datetime.now(timezone.utc))
+                .returning(Job)
+            )
+            if job is None:
+                # Not claimable -- fetch the row by primary key only to report why
+                existing = await session.get(Job, job_id)
+                status = existing.status if existing is not None else None
+            await session.commit()
 
         if job is None:
-            logger.error(f"Job {job_id} not found")
-            raise ValueError(f"Job {job_id} not found")
-
-        if job.status != "pending":
-            logger.warning(f"Job {job_id} has status '{job.status}', expected 'pending'")
+            if status is None:
+                logger.error(f"Job {job_id} not found")
+                raise ValueError(f"Job {job_id} not found")
+            logger.warning(f"Job {job_id} has status '{status}', expected 'pending'")
             raise ValueError(
-                f"Job {job_id} has status '{job.status}', expected 'pending'"
+                f"Job {job_id} has status '{status}', expected 'pending'"
             )
 
-        # --- Mark running ---
-        async with self._session_factory() as session:
-            result = await session.execute(select(Job).where(Job.id == job_id))
-            job = result.scalar_one()
-            job.status = "running"
-            job.started_at = datetime.now(timezone.utc)
-            await session.commit()
-
         logger.info(f"Pipeline started for job {job_id}")
 
-        # --- Build stages ---
-        stages = self._build_stages()
+        # --- Build stages and their configs once per job ---
+        stages = self._build_stages(job_id)
+        stage_configs = self._stage_configs(job)
+
+        # Warm the inspector's models while the I/O-bound stages run
+        checks = stage_configs["inspector"].get("checks", InspectorStage.DEFAULT_CHECKS)
+        preload_task = asyncio.create_task(self._preload_models(stages["inspector"], checks))
 
         # First stage input: URLs from job config
         stage_input: Any = (job.config or {}).get("urls", [])
         total_cost: float = 0.0
 
         # --- Run each stage ---
-        for stage_name in self.STAGES:
-            # Check for cancellation before starting each stage
-            if await self._check_cancelled(job_id):
-                logger.info(f"Job {job_id}: cancelled before stage '{stage_name}'")
-                await self._publish_progress(job_id, stage_name, 0, "cancelled")
-                return
+        # The Refiner consumes pages as the Spider saves them, so parsing and
+        # chunking overlap with scraping instead of waiting for the last URL.
+        scraped: asyncio.Queue[dict | None] | None = None
+        refine_task: asyncio.Task | None = None
+        if isinstance(stages["spider"], SpiderStage) and isinstance(
+            stages["refiner"], RefinerStage
+        ):
+            scraped = asyncio.Queue()
 
-            progress = self.STAGE_PROGRESS[stage_name]
-            stage_obj = stages[stage_name]
-            stage_config = self._stage_config(stage_name, job)
-
-            # Update job stage + publish progress
-            async with self._session_factory() as session:
-                db_result = await session.execute(select(Job).where(Job.id == job_id))
-                job = db_result.scalar_one()
-                job.stage = stage_name
-                job.progress = progress
-                await session.commit()
-
-            await self._publish_progress(job_id, stage_name, progress, "running")
-            logger.info(f"Job {job_id}: starting stage '{stage_name}'")
+        try:
+            for stage_name in self.STAGES:
+                progress = self.STAGE_PROGRESS[stage_name]
+                stage_obj = stages[stage_name]
+                stage_config = stage_configs.get(stage_name, {})
+
+                # Record the stage, unless the job was cancelled meanwhile
+                if not await self._start_stage(job_id, stage_name, progress):
+                    logger.info(f"Job {job_id}: cancelled before stage '{stage_name}'")
+                    await self._publish_progress(job_id, stage_name, 0, "cancelled")
+                    return
 
-            # Execute stage
-            try:
-                stage_result: StageResult = await stage_obj.process(stage_input, stage_config)
-            except Exception as exc:
-                error_msg = f"Stage '{stage_name}' raised an exception: {exc}"
-                logger.error(f"Job {job_id}: {error_msg}")
-                await self._mark_failed(job_id, error_msg)
-                await self._publish_progress(
-                    job_id, stage_name, progress, "failed", error=error_msg
-                )
-                return
+                await self._publish_progress(job_id, stage_name, progress, "running")
+                logger.info(f"Job {job_id}: starting stage '{stage_name}'")
 
-            # Check for stage failure
-            if not stage_result.success:
-                error_msg = (
-                    f"Stage '{stage_name}' failed: "
-                    + "; ".join(stage_result.errors)
-                )
-                logger.error(f"Job {job_id}: {error_msg}")
-                await self._mark_failed(job_id, error_msg)
-                await self._publish_progress(
-                    job_id, stage_name, progress, "failed", error=error_msg
-                )
-                return
+                if stage_name == "inspector":
+                    await preload_task
 
-            # Accumulate cost from factory stage
-            if stage_name == "factory":
-                total_cost += stage_result.stats.get("total_cost", 0.0)
+                # Execute stage
+                try:
+                    if stage_name == "spider" and scraped is not None:
+                        refine_task = asyncio.create_task(
+                            stages["refiner"].process_stream(scraped, stage_configs["refiner"])
+                        )
+                        stage_result: StageResult = await stage_obj.process(
+                            stage_input, stage_config, documents=scraped
+                        )
+                    elif stage_name == "refiner" and refine_task is not None:
+                        stage_result = await refine_task
+                    else:
+                        stage_result = await stage_obj.process(stage_input, stage_config)
+                except Exception as exc:
+                    error_msg = f"Stage '{stage_name}' raised an exception: {exc}"
+                    logger.error(f"Job {job_id}: {error_msg}")
+                    await self._mark_failed(job_id, error_msg)
+                    await self._publish_progress(
+                        job_id, stage_name, progress, "failed", error=error_msg
+                    )
+                    return
 
-                # Check cost limit
-                max_cost = (job.config or {}).get("max_cost")
-                if max_cost is not None and total_cost > max_cost:
+                # Check for stage failure
+                if not stage_result.success:
                     error_msg = (
-                        f"Cost limit exceeded: ${total_cost:.4f} > ${max_cost:.4f}"
+                        f"Stage '{stage_name}' failed: "
+                        + "; ".join(stage_result.errors)
                     )
-                    logger.warning(f"Job {job_id}: {error_msg}")
+                    logger.error(f"Job {job_id}: {error_msg}")
                     await self._mark_failed(job_id, error_msg)
                     await self._publish_progress(
-                        job_id, "factory", progress, "failed", error=error_msg
+                        job_id, stage_name, progress, "failed", error=error_msg
                     )
                     return
 
-            # Persist training examples after inspector stage
-            if stage_name == "inspector":
-                await self._persist_examples(job_id, stage_result.data)
-
-            logger.info(
-                f"Job {job_id}: stage '{stage_name}' completed "
-                f"({len(stage_result.data)} items)"
-            )
+                # Accumulate cost from factory stage
+                if stage_name == "factory":
+                    total_cost += stage_result.stats.get("total_cost", 0.0)
+
+                    # Check cost limit
+                    max_cost = (job.config or {}).get("max_cost")
+                    if max_cost is not None and total_cost > max_cost:
+                        error_msg = (
+                            f"Cost limit exceeded: ${total_cost:.4f} > ${max_cost:.4f}"
+                        )
+                        logger.warning(f"Job {job_id}: {error_msg}")
+                        await self._mark_failed(job_id, error_msg)
+                        await self._publish_progress(
+                            job_id, "factory", progress, "failed", error=error_msg
+                        )
+                        return
+
+                # Persist training examples after inspector stage
+                if stage_name == "inspector":
+                    await self._persist_examples(job_id, stage_result.data)
+
+                logger.info(
+                    f"Job {job_id}: stage '{stage_name}' completed "
+                    f"({len(stage_result.data)} items)"
+                )
 
-            # Output of this stage becomes input of the next
-            stage_input = stage_result.data
+                # Output of this stage becomes input of the next
+                stage_input = stage_result.data
+        finally:
+            if refine_task is not None and not refine_task.done():
+                refine_task.cancel()
+            # Jobs that stop before the Inspector never await the preload
+            if not preload_task.done():
+                preload_task.cancel()
 
         # --- All stages completed successfully ---
 
-        # Create Export record
         shipper_stats = stage_result.stats  # type: ignore[possibly-undefined]
-        async with self._session_factory() as session:
-            export = Export(
-                job_id=job_id,
-                format=shipper_stats.get("format", "jsonl"),
-                file_path=shipper_stats.get("file_path", ""),
-                record_count=shipper_stats.get("record_count", 0),
-                version="v1",
-                dataset_card=None,
-            )
-            # Read dataset card from disk if available
-            dataset_card_path = shipper_stats.get("dataset_card_path")
-            if dataset_card_path:
-                try:
-                    from pathlib import Path
-
-                    card_text = Path(dataset_card_path).read_text(encoding="utf-8")
-                    export.dataset_card = card_text
-                except Exception:
-                    pass
-            session.add(export)
-            await session.commit()
+        dataset_card = None
+        # Read dataset card from disk if available, before the transaction opens
+        dataset_card_path = shipper_stats.get("dataset_card_path")
+        if dataset_card_path:
+            try:
+                dataset_card = await asyncio.to_thread(
+                    Path(dataset_card_path).read_text, encoding="utf-8"
+                )
+            except Exception:
+                pass
 
-        # Mark job completed
+        # Create Export record and mark job completed in one transaction
         async with self._session_factory() as session:
-            db_result = await session.execute(select(Job).where(Job.id == job_id))
-            job = db_result.scalar_one()
-            job.status = "completed"
-            job.progress = 1.0
-            job.cost_total = total_cost
-            job.completed_at = datetime.now(timezone.utc)
+            await session.execute(
+                insert(Export).values(
+                    job_id=job_id,
+                    format=shipper_stats.get("format", "jsonl"),
+                    file_path=shipper_stats.get("file_path", ""),
+                    record_count=shipper_stats.get("record_count", 0),
+                    version="v1",
+                    dataset_card=dataset_card,
+                )
+            )
+            await session.execute(
+                update(Job)
+                .where(Job.id == job_id)
+                .values(
+                    status="completed",
+                    progress=1.0,
+                    cost_total=total_cost,
+                    completed_at=datetime.now(timezone.utc),
+                )
+            )
             await session.commit()
 
         await self._publish_progress(job_id, "shipper", 1.0, "completed")
@@ -291,43 +394,49 @@ class PipelineOrchestrator:
 
     async def _persist_examples(self, job_id: int, examples: list[dict]) -> None:
         """Write training examples to the DB after QC for comparison/analytics."""
-        import json
-
         if not self._session_factory or not examples:
             return
 
         def _sanitize_json(obj):
             """Convert numpy/non-native types to JSON-safe Python types."""
-            return json.loads(json.dumps(obj, default=lambda x: float(x)))
+            return orjson.loads(
+                orjson.dumps(obj, default=float, option=orjson.OPT_NON_STR_KEYS)
+            )
+
+        rows = []
+        for ex in examples:
+            quality_details = ex.get("quality_details")
+            if quality_details:
+                quality_details = _sanitize_json(quality_details)
+            qs = ex.get("quality_score")
+            rows.append({
+                "chunk_id": 0,
+                "job_id": job_id,
+                "template_type": ex.get("template_type", ""),
+                "input_text": ex.get("input", ""),
+                "output_text": ex.get("output", ""),
+                "model_used": ex.get("model_used", ""),
+                "token_count": ex.get("token_count", 0),
+                "cost": float(ex.get("cost", 0.0)),
+                "quality_score": float(qs) if qs is not None else None,
+                "quality_details": quality_details,
+                "passed_qc": ex.get("passed_qc"),
+            })
 
         async with self._session_factory() as session:
-            for ex in examples:
-                quality_details = ex.get("quality_details")
-                if quality_details:
-                    quality_details = _sanitize_json(quality_details)
-                qs = ex.get("quality_score")
-                row = TrainingExample(
-                    chunk_id=0,
-                    job_id=job_id,
-                    template_type=ex.get("template_type", ""),
-                    input_text=ex.get("input", ""),
-                    output_text=ex.get("output", ""),
-                    model_used=ex.get("model_used", ""),
-                    token_count=ex.get("token_count", 0),
-                    cost=float(ex.get("cost", 0.0)),
-                    quality_score=float(qs) if qs is not None else None,
-                    quality_details=quality_details,
-                    passed_qc=ex.get("passed_qc"),
-                )
-                session.add(row)
+            await bulk_insert(session, TrainingExample, rows)
             await session.commit()
         logger.info(f"Job {job_id}: persisted {len(examples)} training examples to DB")
 
     async def _mark_failed(self, job_id: int, error: str) -> None:
-        """Set the job status to 'failed' and store the error message."""
+        """Set the job status to 'failed' and store the error message.
+
+        Cancelled jobs keep their status; their stages fail as a result.
+        """
         async with self._session_factory() as session:
-            db_result = await session.execute(select(Job).where(Job.id == job_id))
-            job = db_result.scalar_one()
-            job.status = "failed"
-            job.error = error
+            await session.execute(
+                update(Job)
+                .where(Job.id == job_id, Job.status != "cancelled")
+                .values(status="failed", error=error)
+            )
             await session.commit()
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import threading
 from abc import ABC, abstractmethod
+from functools import lru_cache, wraps
 
 
 class QualityChecker(ABC):
@@ -15,8 +17,12 @@ class QualityChecker(ABC):
 
     name: str
 
+    # Whether a result depends only on the example itself, so it can be
+    # reused for the same input/output in later runs.
+    cacheable: bool = True
+
     @abstractmethod
-    async def check(self, example: dict) -> tuple[float, str]:
+    def check(self, example: dict) -> tuple[float, str]:
         """Check a single example.
 
         Returns:
@@ -24,3 +30,30 @@ class QualityChecker(ABC):
             range 0.0--1.0 and *detail_message* explains the result.
         """
         ...
+
+    async def acheck(self, example: dict) -> tuple[float, str]:
+        """Awaitable :meth:`check` for checkers that may block on inference.
+
+        The default simply calls :meth:`check`; model-backed checkers
+        override it to move on-demand inference off the event loop.
+        """
+        return self.check(example)
+
+
+def load_once(loader):
+    """Cache a model *loader* per argument, like ``lru_cache(maxsize=4)``.
+
+    Calls are serialized by a lock, so threads that miss a cold cache at
+    the same time wait for one load instead of each building the model.
+    The returned function keeps ``cache_clear``.
+    """
+    cached = lru_cache(maxsize=4)(loader)
+    lock = threading.Lock()
+
+    @wraps(loader)
+    def load(*args):
+        with lock:
+            return cached(*args)
+
+    load.cache_clear = cached.cache_clear
+    return load
@@ -2,7 +2,24 @@
 
 from __future__ import annotations
 
-from pipeline.quality_checks import QualityChecker
+import asyncio
+
+from pipeline.quality_checks import QualityChecker, load_once
+
+
+@load_once
+def _load_model(model_name: str):
+    """Load a SentenceTransformer once per process; encoding does not mutate it.
+
+    SentenceTransformer already places the model on CUDA when a GPU is
+    visible; there the weights are also cast to fp16 for faster forward
+    passes.
+    """
+    from sentence_transformers import SentenceTransformer
+    model = SentenceTransformer(model_name)
+    if model.device.type == "cuda":
+        model.half()
+    return model
 
 
 class CoherenceChecker(QualityChecker):
@@ -10,35 +27,85 @@ class CoherenceChecker(QualityChecker):
 
     Uses sentence-transformers with the all-MiniLM-L6-v2 model (79MB).
     The model is loaded lazily on first use to avoid startup overhead.
+
+    Call :meth:`set_examples` with the full example list first to encode
+    every text in one batched pass; :meth:`check` then only takes a dot
+    product. Texts that were not pre-encoded are encoded on demand.
     """
 
     name = "coherence"
 
+    BATCH_SIZE = 64
+    MODEL_NAME = "all-MiniLM-L6-v2"
+
     def __init__(self) -> None:
         self._model = None
+        self._rows: dict[str, int] = {}
+        self._embeddings = None
+
+    @classmethod
+    def preload(cls) -> None:
+        """Load the shared model ahead of the first check (blocking)."""
+        _load_model(cls.MODEL_NAME)
+
+    def set_examples(self, examples: list[dict]) -> None:
+        """Pre-compute L2-normalised embeddings for every distinct input and output."""
+        texts = dict.fromkeys(
+            text
+            for ex in examples
+            for text in (ex.get("input", "").strip(), ex.get("output", "").strip())
+            if text
+        )
+        if not texts:
+            return
+        import numpy as np
+        embeddings = self._get_model().encode(
+            list(texts),
+            batch_size=self.BATCH_SIZE,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False,
+        )
+        # fp16 output from a GPU model is widened so dot products stay precise
+        self._embeddings = np.asarray(embeddings, dtype=np.float32)
+        self._rows = {text: row for row, text in enumerate(texts)}
 
     def _get_model(self):
-        """Lazy-load the sentence transformer model."""
+        """Lazy-load the sentence transformer model (shared across instances)."""
         if self._model is None:
-            from sentence_transformers import SentenceTransformer
-            self._model = SentenceTransformer("all-MiniLM-L6-v2")
+            self._model = _load_model(self.MODEL_NAME)
         return self._model
 
-    async def check(self, example: dict) -> tuple[float, str]:
+    async def acheck(self, example: dict) -> tuple[float, str]:
+        """Score pre-encoded pairs inline; encode anything else in a worker thread."""
+        if (
+            example.get("input", "").strip() in self._rows
+            and example.get("output", "").strip() in self._rows
+        ):
+            return self.check(example)
+        return await asyncio.to_thread(self.check, example)
+
+    def check(self, example: dict) -> tuple[float, str]:
         input_text = example.get("input", "").strip()
         output_text = example.get("output", "").strip()
 
         if not input_text or not output_text:
             return 0.5, "missing input or output text"
 
-        model = self._get_model()
-        embeddings = model.encode([input_text, output_text])
+        row_in = self._rows.get(input_text)
+        row_out = self._rows.get(output_text)
+        if row_in is not None and row_out is not None:
+            # Pre-encoded vectors are unit length: the dot product is the cosine
+            cos_sim = float(self._embeddings[row_in] @ self._embeddings[row_out])
+        else:
+            import numpy as np
+            model = self._get_model()
+            embeddings = np.asarray(model.encode([input_text, output_text]), dtype=np.float32)
 
-        # Cosine similarity between input and output embeddings
-        import numpy as np
-        cos_sim = float(np.dot(embeddings[0], embeddings[1]) / (
-            np.linalg.norm(embeddings[0]) * np.linalg.norm(embeddings[1])
-        ))
+            # Cosine similarity between input and output embeddings
+            cos_sim = float(np.dot(embeddings[0], embeddings[1]) / (
+                np.linalg.norm(embeddings[0]) * np.linalg.norm(embeddings[1])
+            ))
 
         # Clamp to [0, 1]
         score = max(0.0, min(1.0, cos_sim))
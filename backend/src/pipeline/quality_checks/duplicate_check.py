@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
-import math
 from collections import Counter
+from itertools import chain
 
+import numpy as np
+from datasketch import LeanMinHash, MinHashLSH
+from scipy.sparse import csr_matrix
+
+from pipeline.minhash import signatures
 from pipeline.quality_checks import QualityChecker
 
 
@@ -13,21 +18,8 @@ def _word_vector(text: str) -> Counter:
     return Counter(text.lower().split())
 
 
-def _cosine_similarity(a: Counter, b: Counter) -> float:
-    """Compute cosine similarity between two Counter-based word vectors."""
-    if not a or not b:
-        return 0.0
-
-    common_keys = set(a.keys()) & set(b.keys())
-    dot = sum(a[k] * b[k] for k in common_keys)
-
-    norm_a = math.sqrt(sum(v * v for v in a.values()))
-    norm_b = math.sqrt(sum(v * v for v in b.values()))
-
-    if norm_a == 0.0 or norm_b == 0.0:
-        return 0.0
-
-    return dot / (norm_a * norm_b)
+def _example_text(example: dict) -> str:
+    return f"{example.get('input', '')} {example.get('output', '')}"
 
 
 class DuplicateChecker(QualityChecker):
@@ -40,35 +32,111 @@ class DuplicateChecker(QualityChecker):
     Examples with cosine similarity >= ``threshold`` (default 0.9) against
     any *earlier* example in the list are considered duplicates and receive
     a lower score.
+
+    The example set is held as a sparse matrix of L2-normalised TF rows, so
+    each check is one sparse matrix-vector product instead of a Python loop
+    over every earlier example.  For large sets a MinHash LSH index over the
+    word sets first narrows the comparison to candidate neighbours.
     """
 
     name = "duplicate"
+    cacheable = False  # depends on the rest of the example set
+
+    # Below this many examples the exact all-pairs product is cheap enough.
+    LSH_MIN_EXAMPLES = 2000
+    # Jaccard threshold for LSH candidates; set well below ``threshold``
+    # because TF cosine >= 0.9 can still mean a word-set Jaccard near 0.7.
+    LSH_THRESHOLD = 0.5
+    NUM_PERM = 128
 
     def __init__(self, threshold: float = 0.9) -> None:
         self._threshold = threshold
         self._examples: list[dict] = []
-        self._vectors: list[Counter] = []
+        self._vocab: dict[str, int] = {}
+        self._matrix: csr_matrix | None = None
+        self._lsh: MinHashLSH | None = None
+        self._minhashes: list[LeanMinHash] = []
 
     def set_examples(self, examples: list[dict]) -> None:
-        """Pre-compute word vectors for the full example set."""
-        self._examples = examples
-        self._vectors = [
-            _word_vector(f"{ex.get('input', '')} {ex.get('output', '')}")
-            for ex in examples
-        ]
+        """Pre-compute the normalised TF matrix for the full example set.
 
-    async def check(
+        All examples are tokenized into one flat word list; vocabulary ids
+        are then looked up with C-level ``map`` and per-row counts come from
+        summing duplicate matrix entries, so no per-example Counter is built.
+        """
+        self._examples = examples
+        docs = [_example_text(ex).lower().split() for ex in examples]
+        tokens = list(chain.from_iterable(docs))
+        self._vocab = {word: col for col, word in enumerate(dict.fromkeys(tokens))}
+        cols = np.fromiter(
+            map(self._vocab.__getitem__, tokens), dtype=np.int64, count=len(tokens)
+        )
+        rows = np.repeat(np.arange(len(docs)), np.fromiter(map(len, docs), dtype=np.int64))
+        matrix = csr_matrix(
+            (np.ones(len(tokens)), (rows, cols)), shape=(len(docs), len(self._vocab))
+        )
+        matrix.sum_duplicates()
+        norms = np.sqrt(matrix.multiply(matrix).sum(axis=1).A1)
+        matrix.data /= np.repeat(norms, np.diff(matrix.indptr))
+        self._matrix = matrix
+
+        self._lsh = None
+        self._minhashes = []
+        if len(examples) >= self.LSH_MIN_EXAMPLES:
+            self._lsh = MinHashLSH(threshold=self.LSH_THRESHOLD, num_perm=self.NUM_PERM)
+            self._minhashes = signatures(
+                ({word.encode("utf-8") for word in doc} for doc in docs), self.NUM_PERM
+            )
+            for idx, m in enumerate(self._minhashes):
+                self._lsh.insert(idx, m)
+
+    def _minhash(self, text: str) -> LeanMinHash:
+        (m,) = signatures(
+            [{word.encode("utf-8") for word in text.lower().split()}], self.NUM_PERM
+        )
+        return m
+
+    def _query_vector(self, text: str) -> np.ndarray:
+        """Dense normalised TF vector for *text* over the example vocabulary."""
+        vec = np.zeros(len(self._vocab))
+        counts = _word_vector(text)
+        if not counts:
+            return vec
+        # Words outside the vocabulary add nothing to any dot product but
+        # still count towards this vector's norm.
+        values = np.fromiter(counts.values(), dtype=np.float64, count=len(counts))
+        norm = np.sqrt(values @ values)
+        for word, count in zip(counts, values / norm):
+            col = self._vocab.get(word)
+            if col is not None:
+                vec[col] = count
+        return vec
+
+    def check(
         self, example: dict, *, index: int | None = None
     ) -> tuple[float, str]:
-        text = f"{example.get('input', '')} {example.get('output', '')}"
-        vec = _word_vector(text)
-
         max_sim = 0.0
-        # Compare only against earlier examples to avoid double-flagging
-        compare_range = range(index) if index is not None else range(len(self._vectors))
-        for i in compare_range:
-            sim = _cosine_similarity(vec, self._vectors[i])
-            max_sim = max(max_sim, sim)
+        if self._matrix is not None:
+            # Compare only against earlier examples to avoid double-flagging
+            if self._lsh is not None:
+                query = (
+                    self._minhashes[index]
+                    if index is not None
+                    else self._minhash(_example_text(example))
+                )
+                candidates = sorted(
+                    i for i in self._lsh.query(query) if index is None or i < index
+                )
+                rows = self._matrix[candidates]
+            else:
+                rows = self._matrix[:index] if index is not None else self._matrix
+            if rows.shape[0]:
+                if index is not None:
+                    # The example's own row is already a normalised TF vector
+                    sims = (rows @ self._matrix[index].T).toarray()
+                else:
+                    sims = rows @ self._query_vector(_example_text(example))
+                max_sim = float(sims.max())
 
         if max_sim >= self._threshold:
             score = 1.0 - max_sim
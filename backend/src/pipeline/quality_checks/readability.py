@@ -1,28 +1,96 @@
-"""Readability quality checker using the textstat library."""
+"""Readability quality checker using the Flesch Reading Ease formula."""
 
 from __future__ import annotations
 
-import textstat
+import re
+
+import numpy as np
 
 from pipeline.quality_checks import QualityChecker
 
+_SENTENCE_END = re.compile(r"[.!?]+")
+_WORD = re.compile(r"[^\W\d_]+(?:'[^\W\d_]+)*")
+_VOWEL_GROUP = re.compile(r"[aeiouy]+", re.IGNORECASE)
+
+
+def _text_counts(text: str) -> tuple[int, int, int, bool]:
+    """Return ``(words, sentences, syllables, measurable)`` for *text*.
+
+    Syllables are estimated as vowel groups per word, less a silent
+    trailing ``e``, with at least one per word.  Text is *measurable* only
+    if some word has a Latin vowel; the estimate means nothing for digits,
+    CJK or Cyrillic.
+    """
+    words = _WORD.findall(text)
+    sentences = max(1, len(_SENTENCE_END.findall(text)))
+    groups = [len(_VOWEL_GROUP.findall(w)) for w in words]
+    syllables = sum(max(1, g - w.lower().endswith("e")) for g, w in zip(groups, words))
+    return len(words), sentences, syllables, any(groups)
+
+
+def _flesch(words: np.ndarray, sentences: np.ndarray, syllables: np.ndarray) -> np.ndarray:
+    words = np.maximum(words, 1)
+    return 206.835 - 1.015 * (words / sentences) - 84.6 * (syllables / words)
+
 
 class ReadabilityChecker(QualityChecker):
     """Scores text readability using the Flesch Reading Ease metric.
 
     Flesch scores range from 0 to 100+ (higher = more readable).  We
     normalise to the 0--1 range by dividing by 100 and clamping.
+
+    Word, sentence and syllable counts come from precompiled regexes; the
+    syllable count is a vowel-group estimate rather than a dictionary lookup.
+    Text without any word the estimate applies to (numbers, non-Latin
+    scripts) gets the neutral :attr:`UNMEASURABLE_SCORE`.
     """
 
     name = "readability"
+    # A batch pass is cheaper than the cache round trip
+    cacheable = False
+
+    UNMEASURABLE_SCORE = 0.5
+    UNMEASURABLE_DETAIL = "no words Flesch can measure"
 
-    async def check(self, example: dict) -> tuple[float, str]:
+    @classmethod
+    def check_batch(cls, examples: list[dict]) -> tuple[np.ndarray, list[str]]:
+        """Score every example at once.
+
+        Returns:
+            A ``(scores, details)`` pair aligned with *examples*.
+        """
+        texts = [ex.get("output", "") for ex in examples]
+        present = np.fromiter(
+            (bool(t and t.strip()) for t in texts), dtype=bool, count=len(texts)
+        )
+        counts = np.array(
+            [_text_counts(t) if t else (0, 1, 0, False) for t in texts], dtype=np.int64
+        ).reshape(len(texts), 4)
+        measurable = counts[:, 3].astype(bool)
+        flesch = _flesch(counts[:, 0], counts[:, 1], counts[:, 2])
+        scores = np.where(
+            measurable, np.clip(flesch / 100.0, 0.0, 1.0), cls.UNMEASURABLE_SCORE
+        )
+        scores = np.where(present, scores, 0.0)
+        details = [
+            "no output text to evaluate" if not ok
+            else f"Flesch: {f:.1f}" if m
+            else cls.UNMEASURABLE_DETAIL
+            for ok, m, f in zip(present, measurable, flesch.tolist())
+        ]
+        return scores, details
+
+    def check(self, example: dict) -> tuple[float, str]:
         text = example.get("output", "")
 
         if not text or not text.strip():
             return 0.0, "no output text to evaluate"
 
-        flesch = textstat.flesch_reading_ease(text)
+        words, sentences, syllables, measurable = _text_counts(text)
+        if not measurable:
+            return self.UNMEASURABLE_SCORE, self.UNMEASURABLE_DETAIL
+
+        flesch = float(_flesch(words, sentences, syllables))
         score = min(max(flesch / 100.0, 0.0), 1.0)
         detail = f"Flesch: {flesch:.1f}"
 
@@ -2,9 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
+
 from detoxify import Detoxify
 
-from pipeline.quality_checks import QualityChecker
+from pipeline.quality_checks import QualityChecker, load_once
+
+
+@load_once
+def _load_detoxify(model_type: str) -> Detoxify:
+    """Load a Detoxify model once per process; inference does not mutate it."""
+    return Detoxify(model_type)
 
 
 class ToxicityChecker(QualityChecker):
@@ -13,23 +21,52 @@ class ToxicityChecker(QualityChecker):
     The detoxify model returns toxicity probabilities in the range 0 (clean)
     to 1 (toxic).  We **invert** the maximum score so that our quality score
     is 1.0 for clean text and 0.0 for very toxic text.
+
+    Call :meth:`set_examples` with the full example list to score every text
+    in batched forward passes; :meth:`check` then reads the cached result.
     """
 
     name = "toxicity"
 
+    BATCH_SIZE = 32
+    MODEL_TYPE = "original"
+
     def __init__(self) -> None:
-        self._model = Detoxify("original")
+        self._model = _load_detoxify(self.MODEL_TYPE)
+        self._max_toxicity: dict[str, float] = {}
 
-    async def check(self, example: dict) -> tuple[float, str]:
-        input_text = example.get("input", "")
-        output_text = example.get("output", "")
-        combined = f"{input_text} {output_text}".strip()
+    @classmethod
+    def preload(cls) -> None:
+        """Load the shared model ahead of the first check (blocking)."""
+        _load_detoxify(cls.MODEL_TYPE)
+
+    def set_examples(self, examples: list[dict]) -> None:
+        """Score every distinct example text, BATCH_SIZE texts per model call."""
+        texts = list(dict.fromkeys(text for text in map(_combined_text, examples) if text))
+        for start in range(0, len(texts), self.BATCH_SIZE):
+            batch = texts[start:start + self.BATCH_SIZE]
+            # A list input returns one list of per-text scores for each label
+            results = self._model.predict(batch)
+            for i, text in enumerate(batch):
+                self._max_toxicity[text] = max(float(scores[i]) for scores in results.values())
+
+    async def acheck(self, example: dict) -> tuple[float, str]:
+        """Read pre-scored texts inline; run the model in a worker thread otherwise."""
+        combined = _combined_text(example)
+        if not combined or combined in self._max_toxicity:
+            return self.check(example)
+        return await asyncio.to_thread(self.check, example)
+
+    def check(self, example: dict) -> tuple[float, str]:
+        combined = _combined_text(example)
 
         if not combined:
             return 1.0, "no text to check"
 
-        results = self._model.predict(combined)
-        max_toxicity = max(results.values())
+        max_toxicity = self._max_toxicity.get(combined)
+        if max_toxicity is None:
+            results = self._model.predict(combined)
+            max_toxicity = max(results.values())
         score = 1.0 - max_toxicity
 
         if score >= 0.9:
@@ -40,3 +77,7 @@ class ToxicityChecker(QualityChecker):
             detail = f"toxic (max toxicity: {max_toxicity:.3f})"
 
         return score, detail
+
+
+def _combined_text(example: dict) -> str:
+    return f"{example.get('input', '')} {example.get('output', '')}".strip()
@@ -2,17 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
 import csv
-import io
-import json
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+import orjson
 from loguru import logger
 
 from pipeline.base import PipelineStage, StageResult
 
+# Lower edges of the fair / good / excellent quality score bins
+SCORE_BIN_EDGES = (0.5, 0.7, 0.9)
+
 
 class ShipperStage(PipelineStage):
     """Stage 5 (Shipper): export training examples that passed QC.
@@ -37,6 +41,8 @@ class ShipperStage(PipelineStage):
 
     stage_name = "shipper"
 
+    WRITE_BUFFER_SIZE = 1 << 20  # bytes
+
     # ------------------------------------------------------------------
     # Validation
     # ------------------------------------------------------------------
@@ -84,9 +90,6 @@ class ShipperStage(PipelineStage):
             else:
                 filtered_out += 1
 
-        # --- Format output ---
-        formatted = self._format_examples(passed_examples, export_format)
-
         # --- Generate dataset card ---
         dataset_card = self._generate_dataset_card(
             job_id=job_id,
@@ -105,7 +108,9 @@ class ShipperStage(PipelineStage):
         file_path = export_dir / f"{version}.{export_format}"
         card_path = export_dir / f"{version}_card.md"
 
-        file_path.write_text(formatted, encoding="utf-8")
+        await asyncio.to_thread(
+            self._write_examples, passed_examples, export_format, file_path
+        )
         card_path.write_text(dataset_card, encoding="utf-8")
 
         logger.info(
@@ -130,27 +135,36 @@ class ShipperStage(PipelineStage):
     # Formatting helpers
     # ------------------------------------------------------------------
 
-    def _format_examples(
-        self, examples: list[dict], export_format: str
-    ) -> str:
-        """Format passed examples into the target format string."""
-        # Extract only input/output fields
-        records = [{"input": ex["input"], "output": ex["output"]} for ex in examples]
+    def _write_examples(
+        self, examples: list[dict], export_format: str, path: Path
+    ) -> None:
+        """Stream passed examples to *path* in the target format.
 
+        Records are serialized one at a time straight into a buffered file,
+        so peak memory does not grow with a second copy of the export.
+        """
         if export_format == "json":
-            return json.dumps(records, indent=2, ensure_ascii=False)
+            # Extract only input/output fields
+            records = [{"input": ex["input"], "output": ex["output"]} for ex in examples]
+            path.write_bytes(orjson.dumps(records, option=orjson.OPT_INDENT_2))
+            return
 
         if export_format == "jsonl":
-            lines = [json.dumps(r, ensure_ascii=False) for r in records]
-            return "\n".join(lines) + ("\n" if lines else "")
+            with path.open("wb", buffering=self.WRITE_BUFFER_SIZE) as f:
+                for ex in examples:
+                    f.write(orjson.dumps(
+                        {"input": ex["input"], "output": ex["output"]},
+                        option=orjson.OPT_APPEND_NEWLINE,
+                    ))
+            return
 
         # csv
-        buf = io.StringIO(newline="")
-        writer = csv.writer(buf, quoting=csv.QUOTE_ALL, lineterminator="\n")
-        writer.writerow(["input", "output"])
-        for r in records:
-            writer.writerow([r["input"], r["output"]])
-        return buf.getvalue()
+        with path.open(
+            "w", encoding="utf-8", newline="", buffering=self.WRITE_BUFFER_SIZE
+        ) as f:
+            writer = csv.writer(f, quoting=csv.QUOTE_ALL, lineterminator="\n")
+            writer.writerow(["input", "output"])
+            writer.writerows([ex["input"], ex["output"]] for ex in examples)
 
     # ------------------------------------------------------------------
     # Dataset card
@@ -168,18 +182,17 @@ class ShipperStage(PipelineStage):
         examples: list[dict],
     ) -> str:
         """Generate a Markdown dataset card with statistics."""
-        # Quality score distribution
-        scores = [
-            ex.get("quality_score", 0.0)
-            for ex in examples
-            if "quality_score" in ex
-        ]
-        avg_score = sum(scores) / len(scores) if scores else 0.0
-
-        excellent = sum(1 for s in scores if s >= 0.9)
-        good = sum(1 for s in scores if 0.7 <= s < 0.9)
-        fair = sum(1 for s in scores if 0.5 <= s < 0.7)
-        poor = sum(1 for s in scores if s < 0.5)
+        # Quality score distribution, gathered in a single pass
+        scores = np.fromiter(
+            (ex["quality_score"] for ex in examples if "quality_score" in ex),
+            dtype=np.float64,
+        )
+        avg_score = float(scores.mean()) if scores.size else 0.0
+
+        # Bins: poor (< 0.5), fair, good, excellent (>= 0.9)
+        poor, fair, good, excellent = np.bincount(
+            np.digitize(scores, SCORE_BIN_EDGES), minlength=len(SCORE_BIN_EDGES) + 1
+        ).tolist()
 
         export_date = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
@@ -5,10 +5,14 @@ from __future__ import annotations
 import asyncio
 from typing import Any
 
+from datasketch import LeanMinHash, MinHashLSH
 from loguru import logger
 
+from clients.batch_llm_client import BatchLLMClient
+from clients.llm_cache import DEFAULT_TTL, LLMCache
 from clients.llm_client import LLMClient
 from pipeline.base import PipelineStage, StageResult
+from pipeline.minhash import shingles, signatures
 from templates import TemplateRegistry
 
 
@@ -28,12 +32,43 @@ class FactoryStage(PipelineStage):
     * ``model`` -- LLM model identifier (default ``"gpt-4o-mini"``).
     * ``examples_per_chunk`` -- hint passed to the template (default ``3``).
     * ``temperature`` -- sampling temperature (default ``0.7``).
+    * ``cache_ttl_seconds`` -- how long an *llm_cache* keeps responses
+      (default one week).
+    * ``max_in_flight`` -- chunks being generated at once (default ``32``);
+      the LLMClient semaphore still bounds concurrent provider calls.
+    * ``use_batch_api`` -- submit all prompts as one provider batch
+      (default ``False``); see below.
+
+    With an *llm_cache*, temperature-0 completions are reused when the same
+    prompt recurs, e.g. on retries or overlapping URL sets; hits add no
+    tokens or cost.
+
+    The Refiner only deduplicates chunks within a document, so boilerplate
+    shared by several pages of a site reaches this stage once per page.
+    Chunks whose MinHash Jaccard similarity with an earlier chunk of the job
+    is at least :attr:`NEAR_DUPLICATE_THRESHOLD` are skipped rather than
+    generated again, so the dataset does not repeat near-identical material;
+    they are counted as ``near_duplicates_skipped``.
+
+    Jobs that can wait may set ``use_batch_api`` to send every prompt
+    through :class:`BatchLLMClient` at half the token price. Models the
+    Batch API does not serve keep using the online client.
     """
 
     stage_name = "factory"
 
-    def __init__(self, llm_client: LLMClient | None = None) -> None:
+    NEAR_DUPLICATE_THRESHOLD = 0.9
+    NUM_PERM = 128
+
+    def __init__(
+        self,
+        llm_client: LLMClient | None = None,
+        llm_cache: LLMCache | None = None,
+        batch_llm_client: BatchLLMClient | None = None,
+    ) -> None:
         self._llm = llm_client or LLMClient()
+        self._cache = llm_cache
+        self._batch_llm = batch_llm_client or BatchLLMClient()
 
     # ------------------------------------------------------------------
     # Validation
@@ -60,6 +95,9 @@ class FactoryStage(PipelineStage):
         model = config.get("model", "gpt-4o-mini")
         examples_per_chunk = config.get("examples_per_chunk", 3)
         temperature = config.get("temperature", 0.7)
+        cache_ttl = config.get("cache_ttl_seconds", DEFAULT_TTL)
+        max_in_flight = config.get("max_in_flight", 32)
+        use_batch_api = config.get("use_batch_api", False)
 
         template = TemplateRegistry.get(template_name)
 
@@ -68,29 +106,54 @@ class FactoryStage(PipelineStage):
         total_tokens = 0
         total_cost = 0.0
 
-        # Build one task per chunk across all documents
-        tasks: list[asyncio.Task] = []
-        for doc in input_data:
-            for chunk in doc["chunks"]:
-                tasks.append(
-                    self._generate_examples(
-                        chunk, template, model, examples_per_chunk, temperature
-                    )
-                )
+        all_chunks = [chunk for doc in input_data for chunk in doc["chunks"]]
+        duplicates = self._find_near_duplicates(all_chunks)
+        chunks = [chunk for idx, chunk in enumerate(all_chunks) if idx not in duplicates]
+
+        llm: LLMClient | BatchLLMClient = self._llm
+        if use_batch_api:
+            if BatchLLMClient.supports(model):
+                # Every prompt must be queued before the batch is submitted
+                llm = self._batch_llm
+                max_in_flight = max(len(chunks), 1)
+            else:
+                logger.warning(f"Batch API does not support {model}; generating online")
+        semaphore = asyncio.Semaphore(max_in_flight)
 
-        # Process concurrently (bounded by LLMClient's internal semaphore)
-        responses = await asyncio.gather(*tasks, return_exceptions=True)
+        async def generate_one(idx: int) -> tuple[int, Any]:
+            # The prompt is only rendered once a slot is free, so at most
+            # max_in_flight prompts and pending responses are held at once.
+            async with semaphore:
+                try:
+                    return idx, await self._generate_examples(
+                        chunks[idx],
+                        template,
+                        model,
+                        examples_per_chunk,
+                        temperature,
+                        cache_ttl,
+                        llm=llm,
+                    )
+                except Exception as exc:
+                    return idx, exc
 
-        for response in responses:
-            if isinstance(response, Exception):
-                errors.append(str(response))
-                logger.warning(f"Factory chunk error: {response}")
+        # Aggregate each distinct chunk as soon as its examples arrive
+        generated: dict[int, list[dict[str, Any]]] = {}
+        pending = [generate_one(idx) for idx in range(len(chunks))]
+        for next_done in asyncio.as_completed(pending):
+            idx, outcome = await next_done
+            if isinstance(outcome, Exception):
+                errors.append(str(outcome))
+                logger.warning(f"Factory chunk error: {outcome}")
                 continue
-            examples, tokens, cost = response
-            results.extend(examples)
+            generated[idx], tokens, cost = outcome
             total_tokens += tokens
             total_cost += cost
 
+        # Emit examples in chunk order
+        for idx in range(len(chunks)):
+            results.extend(generated.get(idx, []))
+
         return StageResult(
             success=True,
             data=results,
@@ -99,11 +162,41 @@ class FactoryStage(PipelineStage):
                 "total_examples": len(results),
                 "total_tokens": total_tokens,
                 "total_cost": total_cost,
+                "near_duplicates_skipped": len(duplicates),
                 "template": template_name,
                 "model": model,
             },
         )
 
+    # ------------------------------------------------------------------
+    # Near-duplicate chunks
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def _find_near_duplicates(cls, chunks: list[dict[str, Any]]) -> set[int]:
+        """Indices of chunks that nearly repeat an earlier chunk of the job.
+
+        Only kept chunks are indexed, so the first chunk of each group of
+        near-identical chunks is the one that is generated.
+        """
+        duplicates: set[int] = set()
+        if len(chunks) < 2:
+            return duplicates
+
+        lsh = MinHashLSH(threshold=cls.NEAR_DUPLICATE_THRESHOLD, num_perm=cls.NUM_PERM)
+        signed = signatures((shingles(chunk["content"]) for chunk in chunks), cls.NUM_PERM)
+        minhashes: dict[int, LeanMinHash] = {}
+        for idx, m in enumerate(signed):
+            if any(
+                m.jaccard(minhashes[int(key)]) >= cls.NEAR_DUPLICATE_THRESHOLD
+                for key in lsh.query(m)
+            ):
+                duplicates.add(idx)
+            else:
+                minhashes[idx] = m
+                lsh.insert(str(idx), m)
+        return duplicates
+
     # ------------------------------------------------------------------
     # Per-chunk generation
     # ------------------------------------------------------------------
@@ -115,39 +208,54 @@ class FactoryStage(PipelineStage):
         model: str,
         examples_per_chunk: int,
         temperature: float,
+        cache_ttl: int = DEFAULT_TTL,
+        llm: LLMClient | BatchLLMClient | None = None,
     ) -> tuple[list[dict[str, Any]], int, float]:
         """Generate training examples for a single chunk.
 
+        *llm* defaults to the online client.
+
         Returns ``(enriched_examples, total_tokens, cost)``.
         """
         metadata = dict(chunk.get("metadata", {}))
         metadata["num_examples"] = examples_per_chunk
 
-        prompt = template.render(content=chunk["content"], metadata=metadata)
-        response = await self._llm.complete(
-            prompt=prompt,
-            model=model,
-            temperature=temperature,
-            system_prompt=template.system_prompt,
-        )
+        # The prefix (instructions up to the chunk) does not vary between
+        # chunks of a job, so providers can serve it from the prompt cache.
+        prefix, prompt = template.render_parts(content=chunk["content"], metadata=metadata)
+        cache_key = None
+        response = None
+        if self._cache is not None and LLMCache.cacheable(temperature):
+            cache_key = LLMCache.cache_key(
+                model, temperature, template.system_prompt, prefix, prompt
+            )
+            response = await self._cache.get(cache_key)
+
+        if response is None:
+            response = await (llm or self._llm).complete(
+                prompt=prompt,
+                model=model,
+                temperature=temperature,
+                system_prompt=template.system_prompt,
+                prompt_prefix=prefix,
+            )
+            if cache_key is not None:
+                await self._cache.set(cache_key, response, ttl=cache_ttl)
 
         examples = template.parse_response(response.content)
 
-        # Enrich each example with provenance metadata
-        enriched: list[dict[str, Any]] = []
-        num_examples = max(len(examples), 1)
-        for ex in examples:
-            enriched.append(
-                {
-                    "input": ex["input"],
-                    "output": ex["output"],
-                    "template_type": template.template_type,
-                    "model_used": response.model,
-                    "token_count": response.total_tokens,
-                    "cost": response.cost / num_examples,
-                    "source_chunk": chunk["content"][:200],
-                    "source_url": metadata.get("source_url", ""),
-                }
-            )
+        # Enrich each example with provenance metadata; the per-chunk values
+        # are the same for every example, so build them once.
+        provenance = {
+            "template_type": template.template_type,
+            "model_used": response.model,
+            "token_count": response.total_tokens,
+            "cost": response.cost / max(len(examples), 1),
+            "source_chunk": chunk["content"][:200],
+            "source_url": metadata.get("source_url", ""),
+        }
+        enriched = [
+            {"input": ex["input"], "output": ex["output"], **provenance} for ex in examples
+        ]
 
         return enriched, response.total_tokens, response.cost
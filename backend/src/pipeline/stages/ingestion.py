@@ -30,8 +30,18 @@ class SpiderStage(PipelineStage):
                 return False
         return True
 
-    async def process(self, input_data: list[str], config: dict) -> StageResult:
-        """Scrape all URLs and return raw documents."""
+    async def process(
+        self,
+        input_data: list[str],
+        config: dict,
+        documents: asyncio.Queue[dict | None] | None = None,
+    ) -> StageResult:
+        """Scrape all URLs and return raw documents.
+
+        With a *documents* queue, each saved document is also put on it as
+        soon as it is scraped, followed by ``None`` once scraping ends, so
+        the Refiner can start before the last page arrives.
+        """
         scraping_config = config.get("scraping", {})
         job_id = config.get("job_id", 0)
 
@@ -57,17 +67,25 @@ class SpiderStage(PipelineStage):
 
         semaphore = asyncio.Semaphore(max_concurrent)
 
+        # Check robots.txt for every URL up front, outside the scrape
+        # semaphore: the scraper fetches each site's file once, so all
+        # domains are fetched in parallel instead of max_concurrent at a time
+        allowed: dict[str, bool] = {}
+        if respect_robots:
+            unique_urls = list(dict.fromkeys(input_data))
+            checks = await asyncio.gather(
+                *(self._scraper.check_robots_txt(url) for url in unique_urls)
+            )
+            allowed = dict(zip(unique_urls, checks))
+
         async def scrape_one(url: str) -> None:
             async with semaphore:
                 domain = urlparse(url).netloc
 
-                # Check robots.txt
-                if respect_robots:
-                    allowed = await self._scraper.check_robots_txt(url)
-                    if not allowed:
-                        logger.info(f"Blocked by robots.txt: {url}")
-                        stats["robots_blocked"] += 1
-                        return
+                if not allowed.get(url, True):
+                    logger.info(f"Blocked by robots.txt: {url}")
+                    stats["robots_blocked"] += 1
+                    return
 
                 # Rate limit
                 await limiter.acquire(domain)
@@ -85,9 +103,9 @@ class SpiderStage(PipelineStage):
                     return
 
                 # Save HTML to file
-                url_hash = hashlib.sha256(url.encode()).hexdigest()[:16]
+                url_hash = hashlib.blake2b(url.encode(), digest_size=8).hexdigest()
                 html_path = raw_dir / f"{url_hash}.html"
-                html_path.write_text(result.html, encoding="utf-8")
+                await asyncio.to_thread(html_path.write_text, result.html, encoding="utf-8")
 
                 doc = {
                     "url": url,
@@ -98,12 +116,19 @@ class SpiderStage(PipelineStage):
                     "language": result.language,
                 }
                 results.append(doc)
+                if documents is not None:
+                    documents.put_nowait(doc)
                 stats["successful"] += 1
                 logger.info(f"Scraped {url} ({result.method}, {result.status_code})")
 
-        # Scrape all URLs concurrently
+        # Scrape all URLs concurrently over the scraper's pooled connections
         tasks = [scrape_one(url) for url in input_data]
-        await asyncio.gather(*tasks, return_exceptions=True)
+        try:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            await self._scraper.aclose()
+            if documents is not None:
+                documents.put_nowait(None)
 
         return StageResult(
             success=True,  # Partial success counts
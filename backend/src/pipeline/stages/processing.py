@@ -2,19 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
-import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import tiktoken
 import trafilatura
 from bs4 import BeautifulSoup
-from datasketch import MinHash, MinHashLSH
+from datasketch import MinHashLSH
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from loguru import logger
 
 from pipeline.base import PipelineStage, StageResult
+from pipeline.minhash import shingles, signatures
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -23,12 +29,14 @@ from pipeline.base import PipelineStage, StageResult
 _REQUIRED_INPUT_KEYS = {"url", "html_path", "status_code", "method", "title", "language"}
 
 
+@lru_cache(maxsize=1)
 def _get_encoding() -> tiktoken.Encoding:
     """Return the cl100k_base encoding used for token counting.
 
     We use ``cl100k_base`` explicitly so that the splitter and the token
     counter share the same vocabulary (``from_tiktoken_encoder`` also
-    receives ``encoding_name="cl100k_base"``).
+    receives ``encoding_name="cl100k_base"``).  Cached so each Refiner
+    worker process loads the BPE ranks once.
     """
     return tiktoken.get_encoding("cl100k_base")
 
@@ -51,30 +59,21 @@ def _extract_content(html: str) -> tuple[str | None, dict[str, Any]]:
     Returns ``(text, metadata_dict)``.  If trafilatura returns nothing the
     text will be ``None`` (caller should fall back to BS4).
 
-    Uses a single ``output_format="json"`` call to get both text and metadata,
-    falling back to a plain-text call only if JSON parsing fails.
+    A single ``bare_extraction`` call parses the page once and returns text
+    and metadata (title, language, ...) as Python objects, with no JSON
+    round-trip.
     """
-    metadata: dict[str, Any] = {}
-    text: str | None = None
-
     try:
-        json_result = trafilatura.extract(
-            html, output_format="json", include_comments=False, include_tables=True
+        document = trafilatura.bare_extraction(
+            html, include_comments=False, include_tables=True, with_metadata=True
         )
-        if json_result:
-            parsed = json.loads(json_result)
-            text = parsed.get("text")
-            metadata = parsed
     except Exception:
-        pass
-
-    # Fallback to plain-text extraction if JSON approach failed
-    if text is None:
-        text = trafilatura.extract(
-            html, include_comments=False, include_tables=True, output_format="txt"
-        )
+        return None, {}
+    if document is None:
+        return None, {}
 
-    return text, metadata
+    metadata = document.as_dict()
+    return metadata.get("text"), metadata
 
 
 def _bs4_fallback(html: str) -> str:
@@ -83,6 +82,7 @@ def _bs4_fallback(html: str) -> str:
     return soup.get_text(separator="\n", strip=True)
 
 
+@lru_cache(maxsize=8)
 def _build_splitter(chunk_size: int, chunk_overlap: int) -> RecursiveCharacterTextSplitter:
     """Build a RecursiveCharacterTextSplitter backed by tiktoken."""
     return RecursiveCharacterTextSplitter.from_tiktoken_encoder(
@@ -92,22 +92,21 @@ def _build_splitter(chunk_size: int, chunk_overlap: int) -> RecursiveCharacterTe
     )
 
 
-def _count_tokens(text: str, enc: tiktoken.Encoding) -> int:
-    return len(enc.encode(text))
+# Threads per encode_ordinary_batch call; pool workers drop this to 1 so a
+# full pool does not run cpu_count threads in every process
+_ENCODE_THREADS = os.cpu_count() or 1
+
+
+def _count_tokens(texts: list[str], enc: tiktoken.Encoding) -> list[int]:
+    """Token count of each text, encoded in parallel threads outside the GIL."""
+    encoded = enc.encode_ordinary_batch(texts, num_threads=_ENCODE_THREADS)
+    return [len(tokens) for tokens in encoded]
 
 
 # ---------------------------------------------------------------------------
 # Deduplication
 # ---------------------------------------------------------------------------
 
-def _shingle(text: str, k: int = 3) -> set[str]:
-    """Return the set of word-level k-shingles for *text*."""
-    words = text.lower().split()
-    if len(words) < k:
-        return {" ".join(words)}
-    return {" ".join(words[i : i + k]) for i in range(len(words) - k + 1)}
-
-
 def _deduplicate_chunks(
     chunks: list[dict[str, Any]],
     jaccard_threshold: float = 0.8,
@@ -125,7 +124,7 @@ def _deduplicate_chunks(
 
     # --- exact deduplication ---
     for chunk in chunks:
-        h = hashlib.sha256(chunk["content"].encode("utf-8")).hexdigest()
+        h = hashlib.blake2b(chunk["content"].encode("utf-8"), digest_size=16).hexdigest()
         if h not in seen_hashes:
             seen_hashes.add(h)
             unique_after_exact.append(chunk)
@@ -137,13 +136,11 @@ def _deduplicate_chunks(
         return unique_after_exact, exact_removed
 
     lsh = MinHashLSH(threshold=jaccard_threshold, num_perm=num_perm)
-    minhashes: list[MinHash] = []
+    minhashes = signatures(
+        (shingles(chunk["content"]) for chunk in unique_after_exact), num_perm
+    )
 
-    for idx, chunk in enumerate(unique_after_exact):
-        m = MinHash(num_perm=num_perm)
-        for s in _shingle(chunk["content"]):
-            m.update(s.encode("utf-8"))
-        minhashes.append(m)
+    for idx, m in enumerate(minhashes):
         try:
             lsh.insert(str(idx), m)
         except ValueError:
@@ -169,6 +166,118 @@ def _deduplicate_chunks(
     return unique_final, exact_removed + near_removed
 
 
+# ---------------------------------------------------------------------------
+# Per-document refining
+# ---------------------------------------------------------------------------
+
+def _refine_one(
+    doc: dict[str, Any], chunk_size: int, chunk_overlap: int
+) -> tuple[dict[str, Any] | None, int, str | None]:
+    """Extract, chunk and deduplicate one Spider document.
+
+    Runs in a worker process, so it is a plain top-level function.  Returns
+    ``(refined_doc, duplicates_removed, error)``; *refined_doc* is ``None``
+    when the HTML file cannot be read (*error* says why) or the page has no
+    extractable text.
+    """
+    url = doc["url"]
+    html_path = doc["html_path"]
+
+    # --- read file ---
+    try:
+        html = Path(html_path).read_text(encoding="utf-8")
+    except Exception as exc:
+        return None, 0, f"Cannot read {html_path}: {exc}"
+
+    # --- extract content ---
+    text, metadata = _extract_content(html)
+
+    if text is None or text.strip() == "":
+        # Fallback to BS4
+        text = _bs4_fallback(html)
+        if not text.strip():
+            logger.info(f"No extractable content for {url}")
+            return None, 0, None
+
+    # --- language detection ---
+    language = metadata.get("language") or _detect_language(text)
+    if not language:
+        language = doc.get("language") or "en"
+
+    # --- title ---
+    title = metadata.get("title") or doc.get("title", "")
+
+    # --- chunk ---
+    raw_chunks_text = _build_splitter(chunk_size, chunk_overlap).split_text(text)
+    token_counts = _count_tokens(raw_chunks_text, _get_encoding())
+    raw_chunks = [
+        {
+            "content": c,
+            "token_count": n_tokens,
+            "chunk_index": i,
+            "metadata": {
+                "source_url": url,
+                "language": language,
+                "title": title,
+            },
+        }
+        for i, (c, n_tokens) in enumerate(zip(raw_chunks_text, token_counts))
+    ]
+
+    # --- deduplicate ---
+    unique_chunks, n_removed = _deduplicate_chunks(raw_chunks)
+
+    refined = {
+        "url": url,
+        "title": title,
+        "language": language,
+        "content": text,
+        "chunks": unique_chunks,
+    }
+    return refined, n_removed, None
+
+
+# ---------------------------------------------------------------------------
+# Worker processes
+# ---------------------------------------------------------------------------
+
+_process_pool: ProcessPoolExecutor | None = None
+
+
+def _init_pool_worker() -> None:
+    """Run in each pool process: the pool already uses every core."""
+    global _ENCODE_THREADS
+    _ENCODE_THREADS = 1
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Return the process-wide refining pool, starting it on first use.
+
+    Shared by every job in this process and sized once to the CPU count;
+    forkserver, so a threaded parent is never forked.
+    """
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(
+            max_workers=os.cpu_count() or 1,
+            mp_context=multiprocessing.get_context("forkserver"),
+            initializer=_init_pool_worker,
+        )
+    return _process_pool
+
+
+def _discard_process_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop *pool* once a worker died in it, so the next job starts a fresh one.
+
+    A broken pool fails every call, so without this the Refiner would stay
+    down until the worker process restarts.
+    """
+    global _process_pool
+    if _process_pool is pool:
+        _process_pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
 # ---------------------------------------------------------------------------
 # RefinerStage
 # ---------------------------------------------------------------------------
@@ -193,82 +302,82 @@ class RefinerStage(PipelineStage):
 
     async def process(self, input_data: list[dict], config: dict) -> StageResult:
         """Process raw HTML documents into chunked, deduplicated text."""
+        documents: asyncio.Queue[dict | None] = asyncio.Queue()
+        for doc in input_data:
+            documents.put_nowait(doc)
+        documents.put_nowait(None)
+        return await self.process_stream(documents, config)
+
+    async def process_stream(
+        self, documents: asyncio.Queue[dict | None], config: dict
+    ) -> StageResult:
+        """Refine documents as they arrive on *documents*, until a ``None``.
+
+        Lets the orchestrator refine pages while the Spider is still
+        scraping.  Documents are independent and refining is CPU-bound, so
+        they are spread over the process-wide worker pool.  The first
+        document runs in a thread and the pool is only used once a second
+        one arrives; single-page jobs never pay its start-up cost.  Setting
+        ``refiner_workers`` to 1 keeps the whole job in the thread.
+        """
         chunk_size = config.get("chunk_size", 512)
         chunk_overlap = config.get("chunk_overlap", 50)
-
-        enc = _get_encoding()
-        splitter = _build_splitter(chunk_size, chunk_overlap)
+        workers = config.get("refiner_workers", os.cpu_count() or 1)
 
         results: list[dict[str, Any]] = []
         errors: list[str] = []
         total_chunks = 0
         total_duplicates_removed = 0
 
-        for doc in input_data:
-            url = doc["url"]
-            html_path = doc["html_path"]
-
-            # --- read file ---
-            try:
-                html = Path(html_path).read_text(encoding="utf-8")
-            except Exception as exc:
-                msg = f"Cannot read {html_path}: {exc}"
-                logger.warning(msg)
-                errors.append(msg)
+        loop = asyncio.get_running_loop()
+        thread = ThreadPoolExecutor(max_workers=1)
+        pool: ProcessPoolExecutor | None = None
+        docs: list[dict] = []
+        pending: list[asyncio.Future] = []
+        try:
+            while (doc := await documents.get()) is not None:
+                if pending and workers > 1 and pool is None:
+                    pool = _get_process_pool()
+                try:
+                    future = loop.run_in_executor(
+                        pool or thread, _refine_one, doc, chunk_size, chunk_overlap
+                    )
+                except BrokenProcessPool:
+                    # A worker died under another job; carry on in a fresh pool
+                    _discard_process_pool(pool)
+                    pool = _get_process_pool()
+                    future = loop.run_in_executor(
+                        pool, _refine_one, doc, chunk_size, chunk_overlap
+                    )
+                docs.append(doc)
+                pending.append(future)
+            outcomes = await asyncio.gather(*pending, return_exceptions=True)
+        finally:
+            # Never block the event loop on leftover work after a failure.
+            # The pool is shared with other jobs, so only this job's queued
+            # documents are dropped from it.
+            for future in pending:
+                future.cancel()
+            thread.shutdown(wait=False, cancel_futures=True)
+
+        for doc, outcome in zip(docs, outcomes):
+            if isinstance(outcome, Exception):
+                if isinstance(outcome, BrokenProcessPool):
+                    _discard_process_pool(pool)
+                outcome = (None, 0, f"Refining {doc['url']} failed: {outcome!r}")
+            refined, n_removed, error = outcome
+            if error is not None:
+                logger.warning(error)
+                errors.append(error)
                 continue
-
-            # --- extract content ---
-            text, metadata = _extract_content(html)
-
-            if text is None or text.strip() == "":
-                # Fallback to BS4
-                text = _bs4_fallback(html)
-                if not text.strip():
-                    logger.info(f"No extractable content for {url}")
-                    continue
-
-            # --- language detection ---
-            language = metadata.get("language") or _detect_language(text)
-            if not language:
-                language = doc.get("language") or "en"
-
-            # --- title ---
-            title = metadata.get("title") or doc.get("title", "")
-
-            # --- chunk ---
-            raw_chunks_text = splitter.split_text(text)
-            raw_chunks = [
-                {
-                    "content": c,
-                    "token_count": _count_tokens(c, enc),
-                    "chunk_index": i,
-                    "metadata": {
-                        "source_url": url,
-                        "language": language,
-                        "title": title,
-                    },
-                }
-                for i, c in enumerate(raw_chunks_text)
-            ]
-
-            # --- deduplicate ---
-            unique_chunks, n_removed = _deduplicate_chunks(raw_chunks)
             total_duplicates_removed += n_removed
-
-            total_chunks += len(unique_chunks)
-
-            results.append(
-                {
-                    "url": url,
-                    "title": title,
-                    "language": language,
-                    "content": text,
-                    "chunks": unique_chunks,
-                }
-            )
+            if refined is None:
+                continue
+            total_chunks += len(refined["chunks"])
+            results.append(refined)
 
         stats = {
-            "total_documents": len(input_data),
+            "total_documents": len(pending),
             "processed": len(results),
             "failed": len(errors),
             "total_chunks": total_chunks,
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import hashlib
+from typing import TYPE_CHECKING, Any
 
+import numpy as np
 from loguru import logger
 
 from pipeline.base import PipelineStage, StageResult
@@ -15,6 +18,9 @@ from pipeline.quality_checks.duplicate_check import DuplicateChecker
 from pipeline.quality_checks.coherence import CoherenceChecker
 from pipeline.quality_checks.length_balance import LengthBalanceChecker
 
+if TYPE_CHECKING:
+    from clients.redis_client import RedisClient
+
 
 # Registry mapping config names to checker classes
 _CHECKER_REGISTRY: dict[str, type[QualityChecker]] = {
@@ -45,10 +51,58 @@ class InspectorStage(PipelineStage):
       ``["toxicity", "readability", "format"]``).
     * ``weights`` -- dict mapping checker name to weight (default ``1.0``
       for each checker).  Example: ``{"toxicity": 2.0, "readability": 1.0}``.
+
+    With a *redis_client*, results of cacheable checkers are memoized by
+    checker name and example content for :attr:`CACHE_TTL` seconds, so
+    repeated examples skip model inference in later runs.
     """
 
     stage_name = "inspector"
 
+    CACHE_TTL = 7 * 24 * 3600  # seconds
+    DEFAULT_CHECKS = ["toxicity", "readability", "format"]
+
+    def __init__(self, redis_client: RedisClient | None = None) -> None:
+        self._redis = redis_client
+
+    @staticmethod
+    def preload_models(check_names: list[str]) -> None:
+        """Load the models behind *check_names* into the shared model caches.
+
+        Blocking; meant to run in a worker thread while earlier stages are
+        still scraping and generating.
+        """
+        for name in check_names:
+            cls = _CHECKER_REGISTRY.get(name)
+            if cls in (CoherenceChecker, ToxicityChecker):
+                cls.preload()
+
+    @staticmethod
+    def _cache_key(checker: QualityChecker, example: dict) -> str:
+        content = f"{example.get('input', '')}\x00{example.get('output', '')}"
+        digest = hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+        return f"qc:{checker.name}:{digest}"
+
+    async def _load_cached(
+        self, checkers: list[QualityChecker], examples: list[dict]
+    ) -> dict[str, list]:
+        """Look up memoized results for every cacheable checker in one MGET.
+
+        Returns ``{checker_name: [[score, detail] | None, ...]}`` aligned with
+        *examples*; empty when there is no cache or it is unreachable.
+        """
+        cacheable = [c for c in checkers if c.cacheable]
+        if self._redis is None or not cacheable:
+            return {}
+        keys = [self._cache_key(c, ex) for c in cacheable for ex in examples]
+        try:
+            values = await self._redis.get_many(keys)
+        except Exception as exc:
+            logger.warning(f"Quality check cache unavailable: {exc}")
+            return {}
+        n = len(examples)
+        return {c.name: values[i * n:(i + 1) * n] for i, c in enumerate(cacheable)}
+
     # ------------------------------------------------------------------
     # Validation
     # ------------------------------------------------------------------
@@ -71,9 +125,7 @@ class InspectorStage(PipelineStage):
     async def process(self, input_data: list[dict], config: dict) -> StageResult:
         """Run quality checks on every example in *input_data*."""
         min_score: float = config.get("min_score", 0.7)
-        check_names: list[str] = config.get(
-            "checks", ["toxicity", "readability", "format"]
-        )
+        check_names: list[str] = config.get("checks", self.DEFAULT_CHECKS)
         weights_cfg: dict[str, float] = config.get("weights", {})
 
         # Instantiate configured checkers
@@ -85,64 +137,122 @@ class InspectorStage(PipelineStage):
                 continue
             checkers.append(cls())
 
-        # Pre-populate duplicate checker with the full example list
-        for checker in checkers:
+        cached = await self._load_cached(checkers, input_data)
+        new_results: dict[str, list] = {}
+
+        # Pre-populate dataset-level checkers with the full example list
+        # (duplicate: word vectors; coherence/toxicity: batched model passes,
+        # limited to examples without a cached result).  These are blocking
+        # calls, so they run side by side in worker threads; torch releases
+        # the GIL during forward passes.  A failed precompute only errors out
+        # its own checker's column.
+        precompute: dict[int, Any] = {}
+        for col, checker in enumerate(checkers):
             if isinstance(checker, DuplicateChecker):
-                checker.set_examples(input_data)
+                precompute[col] = asyncio.to_thread(checker.set_examples, input_data)
+            elif isinstance(checker, (CoherenceChecker, ToxicityChecker)):
+                hits = cached.get(checker.name)
+                pending = [
+                    ex for idx, ex in enumerate(input_data) if not hits or hits[idx] is None
+                ]
+                precompute[col] = asyncio.to_thread(checker.set_examples, pending)
+        outcomes = await asyncio.gather(*precompute.values(), return_exceptions=True)
+        precompute_errors = {
+            col: exc
+            for col, exc in zip(precompute, outcomes)
+            if isinstance(exc, Exception)
+        }
 
-        enriched: list[dict] = []
+        # Score column by column: one score array and one detail list per
+        # checker.  Cheap text-statistics checkers fill their column in one
+        # array pass; the rest fall back to per-example calls.
+        n = len(input_data)
+        scores = np.zeros((n, len(checkers)))
+        details: list[list[str]] = []
         errors: list[str] = []
-        passed_count = 0
-        failed_count = 0
+        batch_types = (FormatChecker, LengthBalanceChecker, ReadabilityChecker)
 
-        for idx, example in enumerate(input_data):
-            quality_details: dict[str, dict[str, Any]] = {}
-            weighted_scores: list[tuple[float, float]] = []
+        for col, checker in enumerate(checkers):
+            if col in precompute_errors:
+                exc = precompute_errors[col]
+                logger.warning(f"Checker {checker.name!r} failed to prepare: {exc}")
+                errors.append(f"{checker.name}: {exc}")
+                details.append([f"error: {exc}"] * n)
+                continue
+
+            if isinstance(checker, batch_types):
+                try:
+                    column, column_details = checker.check_batch(input_data)
+                except Exception as exc:
+                    # A malformed example breaks the array pass; score one by
+                    # one below so only that example is marked as an error
+                    logger.warning(
+                        f"Checker {checker.name!r} batch failed, scoring per example: {exc}"
+                    )
+                else:
+                    scores[:, col] = column
+                    details.append(column_details)
+                    continue
 
-            for checker in checkers:
-                weight = weights_cfg.get(checker.name, 1.0)
+            hits = cached.get(checker.name)
+            column_details = []
+            for idx, example in enumerate(input_data):
+                hit = hits[idx] if hits else None
                 try:
+                    if hit is not None:
+                        score, detail = hit
                     # Pass index to DuplicateChecker for reliable lookup
-                    if isinstance(checker, DuplicateChecker):
-                        score, detail = await checker.check(example, index=idx)
+                    elif isinstance(checker, DuplicateChecker):
+                        score, detail = checker.check(example, index=idx)
                     else:
-                        score, detail = await checker.check(example)
-                    quality_details[checker.name] = {
-                        "score": score,
-                        "detail": detail,
-                    }
-                    weighted_scores.append((score, weight))
+                        # Checkers that override acheck may block on inference;
+                        # the rest are plain function calls.
+                        if type(checker).acheck is not QualityChecker.acheck:
+                            score, detail = await checker.acheck(example)
+                        else:
+                            score, detail = checker.check(example)
+                        if checker.cacheable:
+                            new_results[self._cache_key(checker, example)] = [float(score), detail]
                 except Exception as exc:
                     logger.warning(
                         f"Checker {checker.name!r} failed on example: {exc}"
                     )
                     errors.append(f"{checker.name}: {exc}")
-                    quality_details[checker.name] = {
-                        "score": 0.0,
-                        "detail": f"error: {exc}",
-                    }
-                    weighted_scores.append((0.0, weight))
-
-            total_weight = sum(w for _, w in weighted_scores)
-            quality_score = float(
-                sum(s * w for s, w in weighted_scores) / total_weight
-                if total_weight > 0
-                else 0.0
-            )
-            passed_qc = bool(quality_score >= min_score)
-
-            if passed_qc:
-                passed_count += 1
-            else:
-                failed_count += 1
+                    score, detail = 0.0, f"error: {exc}"
+                scores[idx, col] = score
+                column_details.append(detail)
+            details.append(column_details)
+
+        # Weighted average of every example's scores in one matrix product
+        weights = np.array([weights_cfg.get(c.name, 1.0) for c in checkers], dtype=np.float64)
+        total_weight = weights.sum()
+        if total_weight > 0:
+            quality_scores = scores @ weights / total_weight
+        else:
+            quality_scores = np.zeros(n)
+        passed = quality_scores >= min_score
+        passed_count = int(passed.sum())
+        failed_count = n - passed_count
 
+        score_rows = scores.tolist()
+        enriched: list[dict] = []
+        for idx, example in enumerate(input_data):
             # Build enriched example (preserving all original fields)
             enriched_example = {**example}
-            enriched_example["quality_score"] = quality_score
-            enriched_example["quality_details"] = quality_details
-            enriched_example["passed_qc"] = passed_qc
+            enriched_example["quality_score"] = float(quality_scores[idx])
+            enriched_example["quality_details"] = {
+                checker.name: {"score": score_rows[idx][col], "detail": details[col][idx]}
+                for col, checker in enumerate(checkers)
+            }
+            enriched_example["passed_qc"] = bool(passed[idx])
             enriched.append(enriched_example)
 
+        if self._redis is not None and new_results:
+            try:
+                await self._redis.set_many(new_results, ttl=self.CACHE_TTL)
+            except Exception as exc:
+                logger.warning(f"Failed to cache quality check results: {exc}")
+
         return StageResult(
             success=True,
             data=enriched,
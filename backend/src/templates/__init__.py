@@ -17,7 +17,7 @@ from loguru import logger
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from templates.base import PromptTemplate
+from templates.base import PromptTemplate, _compile
 from templates.classification import ClassificationTemplate
 from templates.instruction_following import InstructionTemplate
 from templates.qa_generation import QATemplate
@@ -37,21 +37,9 @@ class DynamicTemplate(PromptTemplate):
     ) -> None:
         self.template_type = template_type
         self._name = name
-        self._system_prompt = system_prompt_text
-        self._user_prompt_template = user_prompt_template_text
-        self._output_schema = output_schema_data or {}
-
-    @property
-    def system_prompt(self) -> str:
-        return self._system_prompt
-
-    @property
-    def user_prompt_template(self) -> str:
-        return self._user_prompt_template
-
-    @property
-    def output_schema(self) -> dict[str, Any]:
-        return self._output_schema
+        self.system_prompt = system_prompt_text
+        self.user_prompt_template = user_prompt_template_text
+        self.output_schema = output_schema_data or {}
 
 
 # Built-in template classes (immutable)
@@ -62,16 +50,25 @@ _BUILTIN_TEMPLATES: dict[str, type[PromptTemplate]] = {
     "instruction": InstructionTemplate,
 }
 
+# Compile the built-in prompts at import so no job pays Jinja's parse and
+# codegen cost on its first chunk
+for _template_cls in _BUILTIN_TEMPLATES.values():
+    _compile(_template_cls.user_prompt_template)
+
 
 class TemplateRegistry:
     """Registry that maps short names to prompt-template classes or instances."""
 
     _templates: dict[str, type[PromptTemplate]] = dict(_BUILTIN_TEMPLATES)
+    _instances: dict[str, PromptTemplate] = {}
     _custom_instances: dict[str, DynamicTemplate] = {}
 
     @classmethod
     def get(cls, name: str) -> PromptTemplate:
-        """Return a fresh template instance for *name*.
+        """Return the template instance for *name*.
+
+        Templates are stateless and their Jinja2 sources are compiled once
+        per process, so each name maps to one shared instance.
 
         Raises :class:`ValueError` if the name is not registered.
         """
@@ -81,7 +78,9 @@ class TemplateRegistry:
         if name not in cls._templates:
             available = cls.list_templates()
             raise ValueError(f"Unknown template: {name}. Available: {available}")
-        return cls._templates[name]()
+        if name not in cls._instances:
+            cls._instances[name] = cls._templates[name]()
+        return cls._instances[name]
 
     @classmethod
     def list_templates(cls) -> list[str]:
@@ -120,11 +119,22 @@ class TemplateRegistry:
         """Load all custom templates from the database into the registry."""
         from db.models import CustomTemplate
 
-        result = await session.execute(select(CustomTemplate))
-        templates = result.scalars().all()
-        for tmpl in templates:
-            cls.register_custom(tmpl)
-        logger.info(f"Loaded {len(templates)} custom template(s) from database")
+        # Plain column rows, streamed in batches: registration only reads them,
+        # so there is no need to build ORM objects or hold the full result
+        result = await session.stream(
+            select(
+                CustomTemplate.name,
+                CustomTemplate.template_type,
+                CustomTemplate.system_prompt,
+                CustomTemplate.user_prompt_template,
+                CustomTemplate.output_schema,
+            ).execution_options(yield_per=100)
+        )
+        count = 0
+        async for row in result:
+            cls.register_custom(row)
+            count += 1
+        logger.info(f"Loaded {count} custom template(s) from database")
 
 
 __all__ = [
@@ -2,14 +2,42 @@
 
 from __future__ import annotations
 
-import json
-from abc import ABC, abstractmethod
+import re
+from functools import lru_cache
 from typing import Any
 
+import orjson
 from jinja2 import Template
 
+# Stand-in for the chunk content when locating where it starts in a prompt
+_CONTENT_MARKER = "\x00content\x00"
 
-class PromptTemplate(ABC):
+# A bare ``{{ content }}`` output; when it is a template's only reference to
+# ``content``, rendering any chunk is plain substitution into that slot
+_CONTENT_SLOT = re.compile(r"{{-?\s*content\s*-?}}")
+_CONTENT_NAME = re.compile(r"\bcontent\b")
+
+# Rendered ``(before, after)`` the content slot, keyed by template source and
+# metadata repr; chunks of one document share their metadata
+_SKELETONS: dict[tuple[str, str], tuple[str, str]] = {}
+_MAX_SKELETONS = 1024
+
+
+@lru_cache(maxsize=64)
+def _compile(source: str) -> Template:
+    """Compile a Jinja2 template string once per distinct source."""
+    return Template(source)
+
+
+@lru_cache(maxsize=64)
+def _has_single_slot(source: str) -> bool:
+    """Whether *source* uses ``content`` only in one bare ``{{ content }}``."""
+    if len(_CONTENT_SLOT.findall(source)) != 1:
+        return False
+    return _CONTENT_NAME.search(_CONTENT_SLOT.sub("", source)) is None
+
+
+class PromptTemplate:
     """Base class for all prompt templates.
 
     Each concrete template defines a *system_prompt* (sent as the system
@@ -20,27 +48,10 @@ class PromptTemplate(ABC):
 
     template_type: str  # "qa", "summarization", "classification", "instruction"
 
-    # ------------------------------------------------------------------
-    # Abstract properties that every template must implement
-    # ------------------------------------------------------------------
-
-    @property
-    @abstractmethod
-    def system_prompt(self) -> str:
-        """System prompt sent to the LLM."""
-        ...
-
-    @property
-    @abstractmethod
-    def user_prompt_template(self) -> str:
-        """Jinja2 template string for the user prompt."""
-        ...
-
-    @property
-    @abstractmethod
-    def output_schema(self) -> dict[str, Any]:
-        """JSON-schema-like description of the expected output."""
-        ...
+    # Plain attributes rather than properties: they are read for every chunk
+    system_prompt: str  # sent as the system message
+    user_prompt_template: str  # Jinja2 source for the user prompt
+    output_schema: dict[str, Any]  # JSON-schema-like description of the output
 
     # ------------------------------------------------------------------
     # Concrete helpers shared by all templates
@@ -60,8 +71,61 @@ class PromptTemplate(ABC):
         # Flatten metadata keys into the top-level context so templates can
         # use e.g. {{ num_examples }} instead of {{ metadata.num_examples }}.
         ctx.update(metadata or {})
-        template = Template(self.user_prompt_template)
-        return template.render(**ctx)
+        return _compile(self.user_prompt_template).render(**ctx)
+
+    def render_prefix(self, metadata: dict[str, Any] | None = None) -> tuple[str, str]:
+        """Return ``(system_prompt, user_prefix)``: the prompt up to the content.
+
+        For a fixed *metadata* the prefix is byte-identical across chunks, so
+        providers with prompt caching can reuse it.  Templates that place
+        per-chunk metadata before ``{{ content }}`` still work, just with
+        fewer cache hits.
+        """
+        marked = self.render(_CONTENT_MARKER, metadata)
+        prefix, found, _ = marked.partition(_CONTENT_MARKER)
+        return self.system_prompt, prefix if found else ""
+
+    def render_parts(
+        self, content: str, metadata: dict[str, Any] | None = None
+    ) -> tuple[str, str]:
+        """Render the user prompt split into ``(static_prefix, dynamic_suffix)``.
+
+        The two parts always concatenate to :meth:`render`.  If *content*
+        changes the text before it, the prefix is empty.
+
+        Templates whose only use of ``content`` is a bare ``{{ content }}``
+        render once per distinct *metadata*; later chunks only splice their
+        content between the cached halves.
+        """
+        skeleton = self._skeleton(metadata)
+        if skeleton is not None:
+            prefix, suffix = skeleton
+            return prefix, content + suffix
+
+        full = self.render(content, metadata)
+        _, prefix = self.render_prefix(metadata)
+        if not full.startswith(prefix):
+            return "", full
+        return prefix, full[len(prefix):]
+
+    def _skeleton(self, metadata: dict[str, Any] | None) -> tuple[str, str] | None:
+        """Rendered text before and after the content slot, if it has one."""
+        source = self.user_prompt_template
+        if not _has_single_slot(source) or (metadata and "content" in metadata):
+            return None
+        key = (source, repr(metadata))
+        skeleton = _SKELETONS.get(key)
+        if skeleton is None:
+            before, found, after = self.render(_CONTENT_MARKER, metadata).partition(
+                _CONTENT_MARKER
+            )
+            # Missing or repeated (e.g. inside a loop): not a single slot
+            if not found or _CONTENT_MARKER in after:
+                return None
+            if len(_SKELETONS) >= _MAX_SKELETONS:
+                _SKELETONS.clear()
+            skeleton = _SKELETONS[key] = (before, after)
+        return skeleton
 
     def parse_response(self, response: str) -> list[dict[str, str]]:
         """Parse an LLM response into structured training examples.
@@ -77,7 +141,7 @@ class PromptTemplate(ABC):
         """
         text = self._extract_json(response)
         try:
-            data = json.loads(text)
+            data = orjson.loads(text)
             if isinstance(data, list):
                 return [
                     {"input": str(item.get("input", "")), "output": str(item.get("output", ""))}
@@ -86,7 +150,7 @@ class PromptTemplate(ABC):
                 ]
             elif isinstance(data, dict):
                 return [{"input": str(data.get("input", "")), "output": str(data.get("output", ""))}]
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             return []
         return []
 
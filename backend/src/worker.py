@@ -15,19 +15,33 @@ from db.database import init_db, close_db
 from logging_config import setup_logging
 from pipeline.orchestrator import PipelineOrchestrator
 
+try:
+    import uvloop  # installed with uvicorn[standard] (not on Windows)
+except ImportError:
+    uvloop = None
+
 
 class Worker:
     """Pipeline worker that consumes jobs from a Redis queue."""
 
+    # Jobs popped per Redis round-trip. Pipeline jobs run for minutes, so this
+    # stays small to leave queued work for other workers.
+    DEQUEUE_BATCH_SIZE = 4
+    # Seconds a BLMPOP blocks. A stop request waits out the pending pop rather
+    # than cancel it, so this bounds how long shutdown takes to notice.
+    DEQUEUE_TIMEOUT = 1
+
     def __init__(self) -> None:
         self._running = True
+        self._stop = asyncio.Event()
         self._redis: RedisClient | None = None
 
     async def start(self) -> None:
         """Initialize services and start the job processing loop."""
         settings = get_settings()
-        setup_logging(level=settings.log_level)
+        setup_logging(level=settings.log_level, log_dir=settings.data_dir / "logs")
         logger.info("Worker starting...")
+        self._install_signal_handlers()
 
         # Initialize DB
         await init_db()
@@ -57,33 +71,93 @@ class Worker:
 
         logger.info("Worker ready, waiting for jobs...")
 
-        # Main loop
+        await self._run_jobs(orchestrator, max(1, settings.worker_concurrency))
+        await self._shutdown()
+
+    async def _run_jobs(self, orchestrator: PipelineOrchestrator, concurrency: int) -> None:
+        """Run dequeued jobs, up to *concurrency* at a time, until stopped.
+
+        Jobs spend most of their time waiting on the network and the
+        database, so several run side by side.  A stop lets running jobs
+        finish; cancelling this coroutine cancels them instead.
+        """
+        in_flight: set[asyncio.Task] = set()
         while self._running:
             try:
-                payload = await self._redis.dequeue_job(timeout=5)
-                if payload is None:
-                    continue  # timeout, loop back
-
-                job_id = payload.get("job_id")
-                if job_id is None:
-                    logger.warning(f"Invalid job payload (no job_id): {payload}")
+                if len(in_flight) >= concurrency:
+                    await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
                     continue
 
-                logger.info(f"Processing job {job_id}")
-                try:
-                    await orchestrator.run(job_id)
-                    logger.info(f"Job {job_id} completed successfully")
-                except Exception as exc:
-                    logger.error(f"Job {job_id} failed: {exc}")
+                # Only take as many jobs as there are free slots; the rest stay
+                # queued for other workers
+                payloads = await self._dequeue(
+                    min(self.DEQUEUE_BATCH_SIZE, concurrency - len(in_flight))
+                )
+                for payload in payloads:
+                    task = asyncio.create_task(self._process_payload(orchestrator, payload))
+                    in_flight.add(task)
+                    task.add_done_callback(in_flight.discard)
 
             except asyncio.CancelledError:
                 logger.info("Worker cancelled")
+                for task in in_flight:
+                    task.cancel()
                 break
             except Exception as exc:
                 logger.error(f"Worker loop error: {exc}")
                 await asyncio.sleep(1)  # avoid tight error loops
 
-        await self._shutdown()
+        if in_flight:
+            logger.info(f"Waiting for {len(in_flight)} running job(s) to finish")
+            await asyncio.gather(*in_flight, return_exceptions=True)
+
+    async def _dequeue(self, max_count: int) -> list[dict]:
+        """Pop up to *max_count* jobs, or nothing once a stop is requested.
+
+        A pending BLMPOP is never cancelled: Redis may already have popped
+        jobs for it, and they would be lost with the reply.  On stop the pop
+        is allowed to finish and whatever it returns goes back on the queue.
+        """
+        dequeue = asyncio.create_task(
+            self._redis.dequeue_jobs(max_count=max_count, timeout=self.DEQUEUE_TIMEOUT)
+        )
+        stopped = asyncio.create_task(self._stop.wait())
+        try:
+            await asyncio.wait((dequeue, stopped), return_when=asyncio.FIRST_COMPLETED)
+        except asyncio.CancelledError:
+            dequeue.cancel()
+            raise
+        finally:
+            stopped.cancel()
+        if not self._stop.is_set():
+            return dequeue.result()
+
+        payloads = await dequeue
+        if payloads:
+            await self._redis.requeue_jobs(payloads)
+        return []
+
+    async def _process_payload(self, orchestrator: PipelineOrchestrator, payload: dict) -> None:
+        """Run a single dequeued pipeline job or HuggingFace push."""
+        push_id = payload.get("hf_push_id")
+        if push_id is not None:
+            try:
+                await run_hf_push(push_id)
+            except Exception as exc:
+                logger.error(f"HuggingFace push {push_id} failed: {exc}")
+            return
+
+        job_id = payload.get("job_id")
+        if job_id is None:
+            logger.warning(f"Invalid job payload (no job_id): {payload}")
+            return
+
+        logger.info(f"Processing job {job_id}")
+        try:
+            await orchestrator.run(job_id)
+            logger.info(f"Job {job_id} completed successfully")
+        except Exception as exc:
+            logger.error(f"Job {job_id} failed: {exc}")
 
     async def _shutdown(self) -> None:
         """Clean up resources."""
@@ -92,27 +166,78 @@ class Worker:
             await self._redis.close()
         await close_db()
         logger.info("Worker stopped")
+        await logger.complete()  # drain the enqueued log sinks
 
     def request_stop(self) -> None:
-        """Signal the worker to stop after the current job finishes."""
+        """Signal the worker to stop once its running jobs finish."""
         logger.info("Shutdown requested")
         self._running = False
+        self._stop.set()
+
+    def _install_signal_handlers(self) -> None:
+        """Stop on SIGINT/SIGTERM, handled on the event loop.
+
+        Loop handlers run as ordinary callbacks, so the stop request wakes
+        the dequeue wait right away instead of interrupting arbitrary code.
+        """
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self.request_stop)
+            except NotImplementedError:
+                # Windows event loops: fall back to a plain handler that hands
+                # the request to the loop thread
+                signal.signal(sig, lambda *_: loop.call_soon_threadsafe(self.request_stop))
 
 
-def _handle_signal(worker: Worker) -> None:
-    """Register signal handlers for graceful shutdown."""
-    def handler(sig, frame):
-        worker.request_stop()
+async def run_hf_push(push_id: int) -> None:
+    """Upload an export to HuggingFace Hub and record the outcome on its HFPushJob."""
+    from datetime import datetime, timezone
+
+    from db.database import get_async_session
+    from db.models import Export, HFPushJob
+
+    async with get_async_session() as session:
+        push_job = await session.get(HFPushJob, push_id)
+        if push_job is None:
+            logger.warning(f"HuggingFace push {push_id} not found")
+            return
+        export = await session.get(Export, push_job.export_id)
+
+        push_job.status = "running"
+        await session.commit()
+
+        logger.info(f"Pushing export {push_job.export_id} to {push_job.repo_id}")
+        try:
+            if export is None:
+                raise FileNotFoundError(f"Export {push_job.export_id} no longer exists")
+            from clients.hf_client import HFClient
+            client = HFClient(token=get_settings().huggingface_token)
+            result = await client.push_dataset(
+                file_path=export.file_path,
+                repo_id=push_job.repo_id,
+                private=push_job.private,
+            )
+            push_job.status = "completed"
+            push_job.url = result["url"]
+            push_job.files_uploaded = result["files_uploaded"]
+        except Exception as exc:
+            logger.error(f"HuggingFace push {push_id} failed: {exc}")
+            push_job.status = "failed"
+            push_job.error = str(exc)
 
-    signal.signal(signal.SIGINT, handler)
-    signal.signal(signal.SIGTERM, handler)
+        push_job.completed_at = datetime.now(timezone.utc)
+        await session.commit()
 
 
 def main() -> None:
     """Entry point for the worker process."""
     worker = Worker()
-    _handle_signal(worker)
-    asyncio.run(worker.start())
+    # Same libuv loop uvicorn picks for the API process
+    if uvloop is not None:
+        uvloop.run(worker.start())
+    else:
+        asyncio.run(worker.start())
 
 
 if __name__ == "__main__":
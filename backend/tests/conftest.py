@@ -1,3 +1,5 @@
+from unittest.mock import AsyncMock
+
 import pytest
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
@@ -21,6 +23,16 @@ async def session_factory(engine):
     return async_sessionmaker(engine, expire_on_commit=False)
 
 
+@pytest.fixture
+def memory_redis() -> AsyncMock:
+    """RedisClient stand-in whose get_many/set_many read and write a dict."""
+    store: dict = {}
+    redis = AsyncMock()
+    redis.get_many.side_effect = lambda keys: [store.get(k) for k in keys]
+    redis.set_many.side_effect = lambda items, ttl: store.update(items)
+    return redis
+
+
 @pytest.fixture
 async def client(session_factory) -> AsyncClient:
     async def override_get_session():
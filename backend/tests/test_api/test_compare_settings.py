@@ -43,6 +43,55 @@ async def test_compare_jobs_success(client: AsyncClient) -> None:
     assert data["jobs"][0]["pass_rate"] == 0.0
 
 
+async def test_compare_jobs_aggregates_examples(client: AsyncClient, session_factory) -> None:
+    """Per-job example counts and scores are aggregated in request order."""
+    from db.models import TrainingExample
+
+    job1 = await _create_job(client)
+    job2 = await _create_job(client)
+
+    async with session_factory() as session:
+        for passed, score in [(True, 0.9), (True, 0.8), (False, 0.4)]:
+            session.add(TrainingExample(
+                chunk_id=0, job_id=job2, template_type="qa", input_text="q",
+                output_text="a", model_used="m", quality_score=score, passed_qc=passed,
+            ))
+        await session.commit()
+
+    response = await client.get(f"/api/jobs/compare?ids={job2},{job1}")
+    assert response.status_code == 200
+    first, second = response.json()["jobs"]
+    assert first["job_id"] == job2
+    assert first["total_examples"] == 3
+    assert first["passed_examples"] == 2
+    assert first["failed_examples"] == 1
+    assert first["avg_quality_score"] == 0.7
+    assert first["pass_rate"] == 0.6667
+    assert second["job_id"] == job1
+    assert second["total_examples"] == 0
+
+
+async def test_compare_jobs_uses_constant_queries(client: AsyncClient, engine) -> None:
+    """Comparing N jobs issues the same two SELECTs regardless of N."""
+    from sqlalchemy import event
+
+    job_ids = [await _create_job(client) for _ in range(5)]
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _record)
+    try:
+        response = await client.get(f"/api/jobs/compare?ids={','.join(map(str, job_ids))}")
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _record)
+
+    assert response.status_code == 200
+    assert len(response.json()["jobs"]) == 5
+    assert len([s for s in statements if s.lstrip().upper().startswith("SELECT")]) == 2
+
+
 async def test_compare_jobs_too_few(client: AsyncClient) -> None:
     """Comparing fewer than 2 jobs returns 400."""
     job1 = await _create_job(client)
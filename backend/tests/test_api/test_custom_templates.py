@@ -90,6 +90,11 @@ async def test_delete_custom_template(client: AsyncClient) -> None:
     # Verify deleted
     response = await client.get(f"/api/custom-templates/{template_id}")
     assert response.status_code == 404
+    assert "my-custom-qa" not in TemplateRegistry.list_templates()
+
+    # Deleting again reports not found
+    response = await client.delete(f"/api/custom-templates/{template_id}")
+    assert response.status_code == 404
 
 
 async def test_duplicate_name_rejected(client: AsyncClient) -> None:
@@ -119,3 +124,67 @@ async def test_template_appears_in_registry(client: AsyncClient) -> None:
     assert response.status_code == 200
     names = [t["name"] for t in response.json()]
     assert "my-custom-qa" in names
+
+
+async def test_jinja2_validation_is_cached(client: AsyncClient) -> None:
+    """Re-submitting the same template string reuses the cached parse result."""
+    from api.routes.custom_templates import _parse_cached
+
+    bad_template = {
+        **VALID_TEMPLATE,
+        "name": "cached-bad-jinja",
+        "user_prompt_template": "{% for x in %}",
+    }
+    first = await client.post("/api/custom-templates", json=bad_template)
+    hits_before = _parse_cached.cache_info().hits
+    second = await client.post("/api/custom-templates", json=bad_template)
+
+    assert first.status_code == 422
+    assert second.status_code == 422
+    assert first.json()["detail"] == second.json()["detail"]
+    assert _parse_cached.cache_info().hits == hits_before + 1
+
+
+async def test_rename_to_existing_name_rejected(client: AsyncClient) -> None:
+    """Renaming onto another template's name returns 409 and keeps the registry intact."""
+    await client.post("/api/custom-templates", json=VALID_TEMPLATE)
+    other = await client.post("/api/custom-templates", json={
+        **VALID_TEMPLATE,
+        "name": "other-template",
+    })
+
+    response = await client.put(
+        f"/api/custom-templates/{other.json()['id']}",
+        json={"name": "my-custom-qa"},
+    )
+    assert response.status_code == 409
+
+    assert "other-template" in TemplateRegistry.list_templates()
+    fetched = await client.get(f"/api/custom-templates/{other.json()['id']}")
+    assert fetched.json()["name"] == "other-template"
+
+
+async def test_unchanged_update_skips_write(client: AsyncClient) -> None:
+    """Resubmitting identical values leaves the row and registry entry untouched."""
+    create = await client.post("/api/custom-templates", json=VALID_TEMPLATE)
+    template_id = create.json()["id"]
+    registered = TemplateRegistry.get("my-custom-qa")
+
+    response = await client.put(f"/api/custom-templates/{template_id}", json=VALID_TEMPLATE)
+    assert response.status_code == 200
+    assert response.json()["updated_at"] == create.json()["updated_at"]
+    assert TemplateRegistry.get("my-custom-qa") is registered
+
+
+async def test_load_custom_templates_from_database(client: AsyncClient, session_factory) -> None:
+    """Stored templates are registered again when the registry is rebuilt."""
+    await client.post("/api/custom-templates", json=VALID_TEMPLATE)
+    TemplateRegistry._custom_instances.clear()
+
+    async with session_factory() as session:
+        await TemplateRegistry.load_custom_templates(session)
+
+    loaded = TemplateRegistry.get("my-custom-qa")
+    assert loaded.system_prompt == VALID_TEMPLATE["system_prompt"]
+    assert loaded.user_prompt_template == VALID_TEMPLATE["user_prompt_template"]
+    assert loaded.output_schema == VALID_TEMPLATE["output_schema"]
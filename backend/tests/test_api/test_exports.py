@@ -0,0 +1,124 @@
+"""Tests for export download endpoints."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+
+from httpx import AsyncClient
+from sqlalchemy import select
+
+from api.routes.exports import ZeroCopyFileResponse, _hf_token
+from clients.redis_client import get_redis_client
+from db.models import Export, HFPushJob
+from main import app
+
+
+async def _create_export(session_factory, file_path: str) -> int:
+    async with session_factory() as session:
+        export = Export(job_id=1, format="jsonl", file_path=file_path, version="v1")
+        session.add(export)
+        await session.commit()
+        return export.id
+
+
+async def test_download_export(client: AsyncClient, session_factory, tmp_path) -> None:
+    data_file = tmp_path / "v1.jsonl"
+    data_file.write_text('{"input": "q", "output": "a"}\n', encoding="utf-8")
+    export_id = await _create_export(session_factory, str(data_file))
+
+    response = await client.get(f"/api/exports/{export_id}/download")
+    assert response.status_code == 200
+    assert response.content == data_file.read_bytes()
+    assert response.headers["content-length"] == str(data_file.stat().st_size)
+    assert 'filename="v1.jsonl"' in response.headers["content-disposition"]
+
+
+async def test_download_export_missing_file(client: AsyncClient, session_factory, tmp_path) -> None:
+    export_id = await _create_export(session_factory, str(tmp_path / "gone.jsonl"))
+
+    response = await client.get(f"/api/exports/{export_id}/download")
+    assert response.status_code == 404
+
+
+async def test_zerocopysend_used_when_server_supports_it(tmp_path) -> None:
+    data_file = tmp_path / "v1.jsonl"
+    data_file.write_bytes(b"x" * 100)
+    sent: list[dict] = []
+
+    async def send(message: dict) -> None:
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "headers": [],
+        "extensions": {"http.response.zerocopysend": {}},
+    }
+    await ZeroCopyFileResponse(path=str(data_file), filename="v1.jsonl")(scope, None, send)
+
+    assert [m["type"] for m in sent] == ["http.response.start", "http.response.zerocopysend"]
+    assert (b"content-length", b"100") in sent[0]["headers"]
+    assert isinstance(sent[1]["file"], int)
+    assert sent[1]["more_body"] is False
+
+
+async def test_push_to_hf_without_token(client: AsyncClient, session_factory, tmp_path) -> None:
+    data_file = tmp_path / "v1.jsonl"
+    data_file.write_text("{}\n", encoding="utf-8")
+    export_id = await _create_export(session_factory, str(data_file))
+    app.dependency_overrides[_hf_token] = lambda: ""
+
+    response = await client.post(
+        f"/api/exports/{export_id}/push-to-hf",
+        json={"repo_id": "user/test", "private": False},
+    )
+    assert response.status_code == 400
+
+
+async def test_push_to_hf_is_queued(client: AsyncClient, session_factory, tmp_path) -> None:
+    data_file = tmp_path / "v1.jsonl"
+    data_file.write_text("{}\n", encoding="utf-8")
+    export_id = await _create_export(session_factory, str(data_file))
+    mock_redis = AsyncMock()
+    app.dependency_overrides[_hf_token] = lambda: "hf_test"
+    app.dependency_overrides[get_redis_client] = lambda: mock_redis
+
+    response = await client.post(
+        f"/api/exports/{export_id}/push-to-hf",
+        json={"repo_id": "user/test", "private": True},
+    )
+    assert response.status_code == 202
+    push = response.json()
+    assert push["status"] == "pending"
+    assert push["repo_id"] == "user/test"
+    mock_redis.enqueue_hf_push.assert_awaited_once_with(push["id"])
+
+    status = await client.get(f"/api/exports/{export_id}/push-status/{push['id']}")
+    assert status.status_code == 200
+    assert status.json()["status"] == "pending"
+
+    other = await client.get(f"/api/exports/{export_id + 1}/push-status/{push['id']}")
+    assert other.status_code == 404
+
+
+async def test_push_to_hf_enqueue_failure_marks_push_failed(
+    client: AsyncClient, session_factory, tmp_path
+) -> None:
+    data_file = tmp_path / "v1.jsonl"
+    data_file.write_text("{}\n", encoding="utf-8")
+    export_id = await _create_export(session_factory, str(data_file))
+    mock_redis = AsyncMock()
+    mock_redis.enqueue_hf_push.side_effect = ConnectionError("redis down")
+    app.dependency_overrides[_hf_token] = lambda: "hf_test"
+    app.dependency_overrides[get_redis_client] = lambda: mock_redis
+
+    response = await client.post(
+        f"/api/exports/{export_id}/push-to-hf",
+        json={"repo_id": "user/test", "private": False},
+    )
+    assert response.status_code == 503
+
+    async with session_factory() as session:
+        push = (await session.scalars(select(HFPushJob))).one()
+    assert push.status == "failed"
+    assert push.completed_at is not None
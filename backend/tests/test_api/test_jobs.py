@@ -154,3 +154,62 @@ async def test_retry_nonexistent_job(client: AsyncClient) -> None:
     """Retrying a non-existent job returns 404."""
     response = await client.post("/api/jobs/99999/retry")
     assert response.status_code == 404
+
+
+async def test_create_job_enqueues_on_shared_redis(client: AsyncClient) -> None:
+    """Job creation enqueues through the injected shared Redis client."""
+    from unittest.mock import AsyncMock
+
+    from clients.redis_client import get_redis_client
+    from main import app
+
+    mock_redis = AsyncMock()
+    app.dependency_overrides[get_redis_client] = lambda: mock_redis
+
+    project_resp = await client.post("/api/projects", json={"name": "Enqueue"})
+    project_id = project_resp.json()["id"]
+    response = await client.post(f"/api/projects/{project_id}/jobs", json={
+        "urls": ["https://example.com"],
+    })
+
+    assert response.status_code == 201
+    mock_redis.enqueue_job.assert_awaited_once()
+    assert mock_redis.enqueue_job.await_args.args[0] == response.json()["id"]
+    mock_redis.close.assert_not_called()
+
+
+async def test_list_jobs_pagination(client: AsyncClient) -> None:
+    project_resp = await client.post("/api/projects", json={"name": "Paginate"})
+    project_id = project_resp.json()["id"]
+    for i in range(3):
+        await client.post(f"/api/projects/{project_id}/jobs", json={"urls": [f"https://{i}.com"]})
+
+    first_page = await client.get(f"/api/projects/{project_id}/jobs?limit=2")
+    second_page = await client.get(f"/api/projects/{project_id}/jobs?limit=2&offset=2")
+
+    assert len(first_page.json()) == 2
+    assert len(second_page.json()) == 1
+    ids = {j["id"] for j in first_page.json()} | {j["id"] for j in second_page.json()}
+    assert len(ids) == 3
+
+    bad = await client.get(f"/api/projects/{project_id}/jobs?limit=0")
+    assert bad.status_code == 422
+
+
+async def test_cancel_job_twice_rejected(client: AsyncClient) -> None:
+    project_resp = await client.post("/api/projects", json={"name": "CancelTwice"})
+    project_id = project_resp.json()["id"]
+    job_resp = await client.post(f"/api/projects/{project_id}/jobs", json={
+        "urls": ["https://example.com"],
+    })
+    job_id = job_resp.json()["id"]
+
+    assert (await client.post(f"/api/jobs/{job_id}/cancel")).status_code == 200
+    response = await client.post(f"/api/jobs/{job_id}/cancel")
+    assert response.status_code == 400
+    assert "cancelled" in response.json()["detail"]
+
+
+async def test_cancel_nonexistent_job(client: AsyncClient) -> None:
+    response = await client.post("/api/jobs/99999/cancel")
+    assert response.status_code == 404
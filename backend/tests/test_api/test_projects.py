@@ -46,3 +46,25 @@ async def test_delete_project(client: AsyncClient) -> None:
 
     response = await client.get(f"/api/projects/{project_id}")
     assert response.status_code == 404
+
+
+async def test_update_project(client: AsyncClient) -> None:
+    create = await client.post("/api/projects", json={"name": "Before", "description": "keep"})
+    project_id = create.json()["id"]
+
+    response = await client.put(f"/api/projects/{project_id}", json={"name": "After"})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["name"] == "After"
+    assert data["description"] == "keep"
+    assert data["updated_at"] >= create.json()["updated_at"]
+
+
+async def test_update_nonexistent_project(client: AsyncClient) -> None:
+    response = await client.put("/api/projects/99999", json={"name": "Nope"})
+    assert response.status_code == 404
+
+
+async def test_delete_nonexistent_project(client: AsyncClient) -> None:
+    response = await client.delete("/api/projects/99999")
+    assert response.status_code == 404
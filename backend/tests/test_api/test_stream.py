@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -23,11 +22,11 @@ def _redis_message(data: dict) -> dict:
 
 
 def _make_mock_pubsub(messages: list[dict | None]):
-    """Create a mock PubSub that returns messages from a list, then blocks.
+    """Create a mock PubSub that returns messages from a list, then times out.
 
     Once all pre-loaded messages have been consumed, subsequent calls to
-    ``get_message`` will raise ``asyncio.TimeoutError`` (simulating the
-    keepalive timeout path).
+    ``get_message`` return ``None`` (what redis-py does when its blocking
+    ``timeout`` elapses, i.e. the keepalive path).
     """
     pubsub = AsyncMock()
     pubsub.subscribe = AsyncMock()
@@ -36,14 +35,14 @@ def _make_mock_pubsub(messages: list[dict | None]):
 
     call_count = 0
 
-    async def get_message(ignore_subscribe_messages=True):
+    async def get_message(ignore_subscribe_messages=True, timeout=None):
         nonlocal call_count
         if call_count < len(messages):
             msg = messages[call_count]
             call_count += 1
             return msg
         # After all messages consumed, simulate timeout
-        raise asyncio.TimeoutError
+        return None
 
     pubsub.get_message = AsyncMock(side_effect=get_message)
     return pubsub
@@ -130,7 +129,7 @@ async def test_event_generator_stops_on_failed():
 @pytest.mark.asyncio
 async def test_event_generator_keepalive():
     """A keepalive comment is emitted when get_message times out."""
-    # No real messages -- the mock will immediately raise TimeoutError
+    # No real messages -- the mock will immediately return None
     pubsub = _make_mock_pubsub([])
     mock_redis = _make_mock_redis(pubsub)
 
@@ -145,6 +144,9 @@ async def test_event_generator_keepalive():
                 break
 
     assert all(ev == ": keepalive\n\n" for ev in events)
+    pubsub.get_message.assert_awaited_with(
+        ignore_subscribe_messages=True, timeout=KEEPALIVE_INTERVAL
+    )
 
 
 @pytest.mark.asyncio
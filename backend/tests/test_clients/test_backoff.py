@@ -0,0 +1,25 @@
+from email.utils import formatdate
+import time
+
+import httpx
+
+from clients import backoff
+
+
+def test_next_delay_stays_within_bounds() -> None:
+    delay = backoff.BASE_DELAY
+    for _ in range(50):
+        delay = backoff.next_delay(delay)
+        assert backoff.BASE_DELAY <= delay <= backoff.MAX_DELAY
+
+
+def test_retry_after_parses_header_forms() -> None:
+    assert backoff.retry_after(None) is None
+    assert backoff.retry_after(httpx.Response(429)) is None
+    assert backoff.retry_after(httpx.Response(429, headers={"retry-after": "4"})) == 4.0
+    assert backoff.retry_after(httpx.Response(429, headers={"retry-after-ms": "250"})) == 0.25
+    assert backoff.retry_after(httpx.Response(429, headers={"retry-after": "3600"})) == backoff.MAX_DELAY
+
+    http_date = formatdate(time.time() + 10, usegmt=True)
+    hinted = backoff.retry_after(httpx.Response(503, headers={"retry-after": http_date}))
+    assert 8.0 <= hinted <= 10.0
@@ -0,0 +1,153 @@
+import asyncio
+
+import orjson
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from clients.batch_llm_client import BatchLLMClient
+from clients.llm_client import LLMResponse
+
+
+def _output_line(custom_id: str, content: str, status_code: int = 200) -> bytes:
+    body = {
+        "model": "gpt-4o-mini-2024-07-18",
+        "choices": [{"message": {"role": "assistant", "content": content}}],
+        "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+    }
+    if status_code != 200:
+        body = {"error": {"message": "bad request"}}
+    return orjson.dumps(
+        {
+            "custom_id": custom_id,
+            "response": {"status_code": status_code, "body": body},
+            "error": None,
+        }
+    )
+
+
+def _mock_litellm(mock_litellm: MagicMock, answer=lambda row: f"echo {row['custom_id']}"):
+    """Wire the batch endpoints so each request is answered from the uploaded file."""
+    uploaded: list[dict] = []
+
+    async def acreate_file(file, purpose):
+        uploaded.extend(orjson.loads(line) for line in file[1].splitlines())
+        return MagicMock(id="file-in")
+
+    async def afile_content(file_id):
+        lines = [answer(row) for row in uploaded]
+        return MagicMock(content=b"\n".join(line for line in lines if line is not None))
+
+    mock_litellm.acreate_file = AsyncMock(side_effect=acreate_file)
+    mock_litellm.acreate_batch = AsyncMock(return_value=MagicMock(id="batch-1"))
+    mock_litellm.aretrieve_batch = AsyncMock(
+        side_effect=[
+            MagicMock(id="batch-1", status="in_progress"),
+            MagicMock(id="batch-1", status="completed", output_file_id="file-out"),
+        ]
+    )
+    mock_litellm.afile_content = AsyncMock(side_effect=afile_content)
+    mock_litellm.cost_per_token.return_value = (0.002, 0.004)
+    return uploaded
+
+
+def test_supports_openai_models_only() -> None:
+    assert BatchLLMClient.supports("gpt-4o-mini")
+    assert BatchLLMClient.supports("openai/gpt-4o")
+    assert not BatchLLMClient.supports("claude-3-5-haiku-20241022")
+    assert not BatchLLMClient.supports("ollama/llama3")
+
+
+@patch("clients.batch_llm_client.litellm")
+async def test_concurrent_calls_submitted_as_one_batch(mock_litellm: MagicMock) -> None:
+    def echo_prompt(row: dict) -> bytes:
+        return _output_line(row["custom_id"], row["body"]["messages"][-1]["content"])
+
+    uploaded = _mock_litellm(mock_litellm, answer=echo_prompt)
+    client = BatchLLMClient(collect_window_ms=10)
+
+    with patch("clients.batch_llm_client.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        results = await asyncio.gather(
+            *(client.complete(f"Prompt {i}", model="gpt-4o-mini") for i in range(3))
+        )
+
+    mock_litellm.acreate_batch.assert_awaited_once()
+    assert mock_litellm.acreate_batch.call_args.kwargs["endpoint"] == "/v1/chat/completions"
+    assert len(uploaded) == 3
+    assert all(row["body"]["model"] == "gpt-4o-mini" for row in uploaded)
+    assert [r.content for r in results] == ["Prompt 0", "Prompt 1", "Prompt 2"]
+    mock_sleep.assert_awaited_once_with(30.0)  # one poll before completion
+
+
+@patch("clients.batch_llm_client.litellm")
+async def test_batch_cost_is_discounted(mock_litellm: MagicMock) -> None:
+    _mock_litellm(mock_litellm, answer=lambda row: _output_line(row["custom_id"], "ok"))
+    client = BatchLLMClient(collect_window_ms=1)
+
+    with patch("clients.batch_llm_client.asyncio.sleep", new_callable=AsyncMock):
+        result = await client.complete("Hello", model="gpt-4o-mini", system_prompt="Be brief")
+
+    assert isinstance(result, LLMResponse)
+    assert result.total_tokens == 15
+    assert result.cost == pytest.approx(0.003)
+
+
+@patch("clients.batch_llm_client.litellm")
+async def test_failed_request_raises_for_its_caller_only(mock_litellm: MagicMock) -> None:
+    _mock_litellm(
+        mock_litellm,
+        answer=lambda row: _output_line(
+            row["custom_id"], "ok", status_code=400 if row["custom_id"] == "req-0" else 200
+        ),
+    )
+    client = BatchLLMClient(collect_window_ms=1)
+
+    with patch("clients.batch_llm_client.asyncio.sleep", new_callable=AsyncMock):
+        results = await asyncio.gather(
+            client.complete("Bad", model="gpt-4o-mini"),
+            client.complete("Good", model="gpt-4o-mini"),
+            return_exceptions=True,
+        )
+
+    assert isinstance(results[0], RuntimeError)
+    assert results[1].content == "ok"
+
+
+@patch("clients.batch_llm_client.litellm")
+async def test_failed_batch_raises_for_every_caller(mock_litellm: MagicMock) -> None:
+    _mock_litellm(mock_litellm)
+    mock_litellm.aretrieve_batch = AsyncMock(
+        return_value=MagicMock(id="batch-1", status="expired", output_file_id=None)
+    )
+    client = BatchLLMClient(collect_window_ms=1)
+
+    results = await asyncio.gather(
+        client.complete("A", model="gpt-4o-mini"),
+        client.complete("B", model="gpt-4o-mini"),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(r, RuntimeError) and "expired" in str(r) for r in results)
+
+
+async def test_unsupported_model_rejected() -> None:
+    client = BatchLLMClient()
+
+    with pytest.raises(ValueError):
+        await client.complete("Hello", model="claude-3-5-haiku-20241022")
+
+
+@patch("clients.batch_llm_client.litellm")
+async def test_cancelled_owner_cancels_provider_batch(mock_litellm: MagicMock) -> None:
+    _mock_litellm(mock_litellm)
+    mock_litellm.acancel_batch = AsyncMock()
+    on_submit = AsyncMock()
+    client = BatchLLMClient(
+        collect_window_ms=1, on_submit=on_submit, is_cancelled=AsyncMock(return_value=True)
+    )
+
+    with pytest.raises(RuntimeError, match="cancelled"):
+        await client.complete("Hello", model="gpt-4o-mini")
+
+    on_submit.assert_awaited_once_with("batch-1")
+    mock_litellm.acancel_batch.assert_awaited_once_with(batch_id="batch-1")
+    mock_litellm.afile_content.assert_not_awaited()
@@ -0,0 +1,53 @@
+from unittest.mock import AsyncMock
+
+from clients.llm_cache import LLMCache
+from clients.llm_client import LLMResponse
+
+
+def _response(content: str = "[]") -> LLMResponse:
+    return LLMResponse(
+        content=content, model="gpt-4o-mini",
+        prompt_tokens=10, completion_tokens=20, total_tokens=30, cost=0.01,
+    )
+
+
+def test_cache_key_covers_every_request_field() -> None:
+    base = ("gpt-4o-mini", 0.0, "sys", "prefix", "prompt")
+    key = LLMCache.cache_key(*base)
+
+    assert key.startswith("llm:")
+    assert LLMCache.cache_key(*base) == key
+    for i, changed in enumerate(("gpt-4o", 0.5, "other", "other", "other")):
+        variant = list(base)
+        variant[i] = changed
+        assert LLMCache.cache_key(*variant) != key
+    # Field boundaries matter: moving text between prefix and prompt is a new key
+    assert LLMCache.cache_key("gpt-4o-mini", 0.0, "sys", "prefixp", "rompt") != key
+
+
+def test_only_temperature_zero_is_cacheable() -> None:
+    assert LLMCache.cacheable(0)
+    assert LLMCache.cacheable(0.0)
+    assert not LLMCache.cacheable(0.7)
+
+
+async def test_hit_returns_response_without_usage(memory_redis) -> None:
+    cache = LLMCache(memory_redis)
+
+    assert await cache.get("llm:k") is None
+    await cache.set("llm:k", _response('[{"input":"Q","output":"A"}]'), ttl=60)
+    hit = await cache.get("llm:k")
+
+    assert hit.content == '[{"input":"Q","output":"A"}]'
+    assert hit.model == "gpt-4o-mini"
+    assert (hit.total_tokens, hit.cost) == (0, 0.0)
+
+
+async def test_redis_errors_are_misses() -> None:
+    redis = AsyncMock()
+    redis.get_many.side_effect = ConnectionError("down")
+    redis.set_many.side_effect = ConnectionError("down")
+    cache = LLMCache(redis)
+
+    await cache.set("llm:k", _response())
+    assert await cache.get("llm:k") is None
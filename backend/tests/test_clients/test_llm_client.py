@@ -1,8 +1,11 @@
 import asyncio
 
+import httpx
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 
+from litellm.exceptions import UnsupportedParamsError
+
 from clients.llm_client import LLMClient, LLMResponse
 
 
@@ -54,6 +57,40 @@ async def test_complete_with_system_prompt(mock_litellm: MagicMock) -> None:
     assert messages[1] == {"role": "user", "content": "Hello"}
 
 
+@patch("clients.llm_client.litellm")
+async def test_prompt_prefix_prepended_for_automatic_caching(mock_litellm: MagicMock) -> None:
+    """Non-Claude models get the prefix as the byte-identical start of the user message."""
+    mock_litellm.acompletion = AsyncMock(return_value=_make_mock_response())
+    mock_litellm.completion_cost.return_value = 0.001
+
+    await LLMClient().complete("chunk", model="gpt-4o-mini", prompt_prefix="Instructions: ")
+
+    messages = mock_litellm.acompletion.call_args.kwargs["messages"]
+    assert messages == [{"role": "user", "content": "Instructions: chunk"}]
+
+
+@patch("clients.llm_client.litellm")
+async def test_prompt_prefix_marked_cacheable_for_claude(mock_litellm: MagicMock) -> None:
+    """Claude models get cache_control markers on the system prompt and prefix."""
+    mock_litellm.acompletion = AsyncMock(return_value=_make_mock_response())
+    mock_litellm.completion_cost.return_value = 0.001
+
+    await LLMClient().complete(
+        "chunk",
+        model="anthropic/claude-3-5-haiku-latest",
+        system_prompt="sys",
+        prompt_prefix="Instructions: ",
+    )
+
+    system, user = mock_litellm.acompletion.call_args.kwargs["messages"]
+    cache = {"type": "ephemeral"}
+    assert system["content"] == [{"type": "text", "text": "sys", "cache_control": cache}]
+    assert user["content"] == [
+        {"type": "text", "text": "Instructions: ", "cache_control": cache},
+        {"type": "text", "text": "chunk"},
+    ]
+
+
 @patch("clients.llm_client.litellm")
 async def test_complete_without_system_prompt(mock_litellm: MagicMock) -> None:
     """Without system_prompt, messages should contain only the user message."""
@@ -124,7 +161,30 @@ async def test_retry_on_rate_limit(mock_litellm: MagicMock) -> None:
 
     assert result.content == "Retry success"
     assert mock_litellm.acompletion.call_count == 2
-    mock_sleep.assert_called_once_with(1)  # first backoff = 1s
+    mock_sleep.assert_called_once()
+    assert 1.0 <= mock_sleep.call_args.args[0] <= 3.0  # first jittered backoff
+
+
+@patch("clients.llm_client.litellm")
+async def test_retry_honors_retry_after_header(mock_litellm: MagicMock) -> None:
+    """A Retry-After hint on the error's response replaces the jittered delay."""
+    rate_limit_error = Exception("Rate limit exceeded")
+    rate_limit_error.status_code = 429
+    rate_limit_error.response = httpx.Response(429, headers={"retry-after": "7"})
+
+    mock_litellm.RateLimitError = type("RateLimitError", (Exception,), {})
+    mock_litellm.acompletion = AsyncMock(
+        side_effect=[rate_limit_error, _make_mock_response(content="ok")],
+    )
+    mock_litellm.completion_cost.return_value = 0.001
+
+    client = LLMClient(max_retries=3)
+
+    with patch("clients.llm_client.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        result = await client.complete("Hello", model="gpt-4o-mini")
+
+    assert result.content == "ok"
+    mock_sleep.assert_called_once_with(7.0)
 
 
 @patch("clients.llm_client.litellm")
@@ -180,6 +240,38 @@ async def test_concurrency_limited(mock_litellm: MagicMock) -> None:
     assert max_concurrent_seen <= max_concurrent
 
 
+@patch("clients.llm_client.litellm")
+async def test_concurrent_backoffs_do_not_block_event_loop(mock_litellm: MagicMock) -> None:
+    """Retry backoff must yield to the loop so concurrent retries overlap."""
+    rate_limit_error = Exception("Rate limit exceeded")
+    rate_limit_error.status_code = 429
+    failed: set[str] = set()
+
+    async def mock_acompletion(**kwargs):
+        prompt = kwargs["messages"][-1]["content"]
+        if prompt not in failed:
+            failed.add(prompt)
+            raise rate_limit_error
+        return _make_mock_response()
+
+    mock_litellm.acompletion = mock_acompletion
+    mock_litellm.completion_cost.return_value = 0.001
+    mock_litellm.RateLimitError = type("RateLimitError", (Exception,), {})
+
+    client = LLMClient(max_concurrent=50)
+    loop = asyncio.get_running_loop()
+
+    with patch("clients.llm_client.backoff.next_delay", return_value=0.2):
+        start = loop.time()
+        results = await asyncio.gather(
+            *(client.complete(f"Prompt {i}", model="gpt-4o-mini") for i in range(50))
+        )
+        elapsed = loop.time() - start
+
+    assert len(results) == 50
+    assert elapsed < 0.5  # ~10s if each 200ms backoff blocked the loop
+
+
 @patch("clients.llm_client.litellm")
 async def test_default_model(mock_litellm: MagicMock) -> None:
     """When no model is specified, gpt-4o-mini should be used by default."""
@@ -193,3 +285,87 @@ async def test_default_model(mock_litellm: MagicMock) -> None:
     call_kwargs = mock_litellm.acompletion.call_args.kwargs
     assert call_kwargs["model"] == "gpt-4o-mini"
     assert result.model == "gpt-4o-mini"
+
+
+@patch("clients.llm_client.litellm")
+async def test_identical_requests_coalesced(mock_litellm: MagicMock) -> None:
+    """Concurrent identical prompts share one call with n set to the caller count."""
+    mock_response = _make_mock_response(prompt_tokens=10, completion_tokens=41, total_tokens=51)
+    mock_response.choices = [
+        MagicMock(message=MagicMock(content=f"Answer {i}")) for i in range(3)
+    ]
+    mock_litellm.acompletion = AsyncMock(return_value=mock_response)
+    mock_litellm.completion_cost.return_value = 0.003
+    mock_litellm.get_supported_openai_params.return_value = ["temperature", "n"]
+
+    client = LLMClient()
+    results = await asyncio.gather(
+        *(client.complete("Same prompt", model="gpt-4o-mini") for _ in range(3)),
+        client.complete("Other prompt", model="gpt-4o-mini"),
+    )
+
+    assert mock_litellm.acompletion.call_count == 2
+    batched_call = next(
+        c for c in mock_litellm.acompletion.call_args_list
+        if c.kwargs["messages"][0]["content"] == "Same prompt"
+    )
+    assert batched_call.kwargs["n"] == 3
+    assert [r.content for r in results[:3]] == ["Answer 0", "Answer 1", "Answer 2"]
+    assert sum(r.completion_tokens for r in results[:3]) == 41
+    assert sum(r.cost for r in results[:3]) == pytest.approx(0.003)
+
+
+@patch("clients.llm_client.litellm")
+async def test_identical_requests_not_coalesced_without_n_support(mock_litellm: MagicMock) -> None:
+    mock_litellm.acompletion = AsyncMock(return_value=_make_mock_response())
+    mock_litellm.completion_cost.return_value = 0.001
+    mock_litellm.get_supported_openai_params.return_value = ["temperature", "max_tokens"]
+
+    client = LLMClient()
+    await asyncio.gather(
+        *(client.complete("Same prompt", model="claude-3-5-haiku-20241022") for _ in range(2))
+    )
+
+    assert mock_litellm.acompletion.call_count == 2
+    assert all("n" not in c.kwargs for c in mock_litellm.acompletion.call_args_list)
+
+
+@patch("clients.llm_client.litellm")
+async def test_provider_rejecting_n_falls_back_to_single_calls(mock_litellm: MagicMock) -> None:
+    async def acompletion(**kwargs):
+        if "n" in kwargs:
+            raise UnsupportedParamsError(message="n is not supported", llm_provider="anthropic")
+        return _make_mock_response()
+
+    mock_litellm.acompletion = AsyncMock(side_effect=acompletion)
+    mock_litellm.completion_cost.return_value = 0.001
+    mock_litellm.RateLimitError = type("RateLimitError", (Exception,), {})
+    mock_litellm.get_supported_openai_params.return_value = ["temperature", "n"]
+
+    client = LLMClient()
+    results = await asyncio.gather(
+        *(client.complete("Same prompt", model="some-model") for _ in range(3))
+    )
+
+    assert [r.content for r in results] == ["Test response"] * 3
+    assert mock_litellm.acompletion.call_count == 4  # the rejected batch + 3 singles
+
+
+@patch("clients.llm_client.litellm")
+async def test_empty_choices_fail_callers_instead_of_retrying_forever(
+    mock_litellm: MagicMock,
+) -> None:
+    mock_response = _make_mock_response()
+    mock_response.choices = []
+    mock_litellm.acompletion = AsyncMock(return_value=mock_response)
+    mock_litellm.completion_cost.return_value = 0.0
+    mock_litellm.get_supported_openai_params.return_value = ["temperature", "n"]
+
+    client = LLMClient()
+    results = await asyncio.gather(
+        *(client.complete("Same prompt", model="gpt-4o-mini") for _ in range(2)),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(r, RuntimeError) and "no completion choices" in str(r) for r in results)
+    assert mock_litellm.acompletion.call_count == 3  # the batch + one top-up per caller
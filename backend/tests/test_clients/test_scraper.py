@@ -1,3 +1,7 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import httpx
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 from dataclasses import dataclass
@@ -5,6 +9,17 @@ from dataclasses import dataclass
 from clients.scraper_client import ScraperClient, ScrapeResult
 
 
+def _streaming_client(response: httpx.Response) -> AsyncMock:
+    """Mock AsyncClient whose stream() yields `response`."""
+    @asynccontextmanager
+    async def stream(method, url):
+        yield response
+
+    mock_instance = AsyncMock()
+    mock_instance.stream = MagicMock(side_effect=stream)
+    return mock_instance
+
+
 def test_scrape_result_dataclass() -> None:
     result = ScrapeResult(
         url="https://example.com",
@@ -34,22 +49,20 @@ async def test_scrape_url_with_httpx_success() -> None:
     """httpx succeeds with good HTML content — no Playwright needed."""
     client = ScraperClient()
 
-    mock_response = AsyncMock()
-    mock_response.status_code = 200
-    mock_response.text = "<html><body><h1>Article</h1><p>Content here</p></body></html>"
-    mock_response.headers = {"content-type": "text/html"}
+    mock_response = httpx.Response(
+        200,
+        content=b"<html><body><h1>Article</h1><p>Content here</p></body></html>",
+        headers={"content-type": "text/html"},
+    )
 
     with patch("clients.scraper_client.httpx.AsyncClient") as mock_httpx:
-        mock_instance = AsyncMock()
-        mock_instance.get.return_value = mock_response
-        mock_instance.__aenter__ = AsyncMock(return_value=mock_instance)
-        mock_instance.__aexit__ = AsyncMock(return_value=False)
-        mock_httpx.return_value = mock_instance
+        mock_httpx.return_value = _streaming_client(mock_response)
 
         result = await client.scrape_url("https://example.com", use_playwright="never")
 
     assert result.status_code == 200
     assert result.method == "httpx"
+    assert result.content_type == "text/html"
     assert "Article" in result.html
 
 
@@ -59,12 +72,11 @@ async def test_scrape_url_httpx_failure_returns_error() -> None:
 
     with patch("clients.scraper_client.httpx.AsyncClient") as mock_httpx:
         mock_instance = AsyncMock()
-        mock_instance.get.side_effect = Exception("Connection refused")
-        mock_instance.__aenter__ = AsyncMock(return_value=mock_instance)
-        mock_instance.__aexit__ = AsyncMock(return_value=False)
+        mock_instance.stream = MagicMock(side_effect=Exception("Connection refused"))
         mock_httpx.return_value = mock_instance
 
-        result = await client.scrape_url("https://example.com", use_playwright="never")
+        with patch("clients.scraper_client.asyncio.sleep", new_callable=AsyncMock):
+            result = await client.scrape_url("https://example.com", use_playwright="never")
 
     assert result.error is not None
     assert result.html is None
@@ -77,3 +89,227 @@ async def test_robots_txt_check() -> None:
     allowed = await client.check_robots_txt("https://example.com/page")
     # Without mocking the robots.txt fetch, this should default to True
     assert isinstance(allowed, bool)
+
+
+async def test_httpx_client_reused_across_scrapes() -> None:
+    """All scrapes share one pooled AsyncClient until aclose()."""
+    client = ScraperClient()
+
+    mock_response = httpx.Response(200, content=b"<html><body><p>" + b"x" * 600 + b"</p></body></html>")
+
+    with patch("clients.scraper_client.httpx.AsyncClient") as mock_httpx:
+        mock_instance = _streaming_client(mock_response)
+        mock_httpx.return_value = mock_instance
+
+        await client.scrape_url("https://example.com/a", use_playwright="never")
+        await client.scrape_url("https://example.com/b", use_playwright="never")
+        await client.aclose()
+
+    assert mock_httpx.call_count == 1
+    assert mock_instance.stream.call_count == 2
+    mock_instance.aclose.assert_awaited_once()
+
+
+async def test_httpx_body_capped_at_max_size() -> None:
+    """Oversized bodies are truncated instead of buffered whole."""
+    client = ScraperClient()
+    client.MAX_BODY_BYTES = 1024
+    response = httpx.Response(
+        200,
+        content=b"<html><body><p>" + b"x" * 4096 + b"</p></body></html>",
+        headers={"content-type": "text/html; charset=utf-8"},
+    )
+
+    with patch("clients.scraper_client.httpx.AsyncClient") as mock_httpx:
+        mock_httpx.return_value = _streaming_client(response)
+        result = await client.scrape_url("https://example.com", use_playwright="never")
+
+    assert result.status_code == 200
+    assert len(result.html) == 1024
+
+
+async def test_playwright_browser_shared_across_scrapes() -> None:
+    """Playwright scrapes reuse one browser and open a fresh context per URL."""
+    client = ScraperClient()
+
+    page = AsyncMock()
+    page.goto.return_value = MagicMock(status=200)
+    page.content.return_value = "<html><body><p>Rendered</p></body></html>"
+    page.title.return_value = "Rendered"
+    context = AsyncMock()
+    context.new_page.return_value = page
+    browser = AsyncMock()
+    browser.new_context.return_value = context
+    client._browser = browser
+
+    first = await client.scrape_url("https://example.com/a", use_playwright="always")
+    second = await client.scrape_url("https://example.com/b", use_playwright="always")
+
+    assert first.html == second.html == "<html><body><p>Rendered</p></body></html>"
+    assert browser.new_context.await_count == 2
+    assert context.close.await_count == 2
+    browser.close.assert_not_awaited()
+
+    await client.aclose()
+    browser.close.assert_awaited_once()
+
+
+def test_needs_playwright_heuristic() -> None:
+    """JS mount points without paragraph content trigger the fallback, in any case."""
+    client = ScraperClient()
+    padding = "<script>" + "x" * 600 + "</script>"
+
+    def needs(html: str) -> bool:
+        return client._needs_playwright(
+            ScrapeResult(url="https://example.com", html=html, status_code=200, method="httpx")
+        )
+
+    assert needs("<html><body><p>short</p></body></html>")
+    assert needs(f'<HTML><BODY><DIV ID="ROOT"></DIV>{padding}</BODY></HTML>')
+    assert not needs(f'<html><body><div id="root"><P>Text</P></div>{padding}</body></html>')
+    assert not needs(f"<html><body><div>{padding}</div></body></html>")
+
+
+def test_needs_playwright_skips_non_html_content() -> None:
+    client = ScraperClient()
+
+    def needs(content_type: str) -> bool:
+        return client._needs_playwright(ScrapeResult(
+            url="https://example.com/data",
+            html='{"ok": true}',
+            status_code=200,
+            method="httpx",
+            content_type=content_type,
+        ))
+
+    assert not needs("application/json")
+    assert not needs("application/pdf")
+    # Short bodies still fall back when the page is (or may be) HTML
+    assert needs("text/html")
+    assert needs("")
+
+
+async def test_robots_txt_shared_across_clients() -> None:
+    """Concurrent checks from separate clients fetch and parse robots.txt once."""
+    from clients import scraper_client
+
+    robots = MagicMock(text="User-agent: *\nDisallow: /private\n")
+    http = AsyncMock()
+    http.get.return_value = robots
+    first, second = ScraperClient(), ScraperClient()
+    first._client = second._client = http
+
+    with patch.dict(scraper_client._robots_cache, clear=True):
+        allowed = await asyncio.gather(
+            first.check_robots_txt("https://robots.example/page"),
+            second.check_robots_txt("https://robots.example/private/x"),
+        )
+        assert await ScraperClient().check_robots_txt("https://robots.example/other")
+
+    assert allowed == [True, False]
+    http.get.assert_awaited_once()
+
+
+async def test_robots_txt_fetches_never_overlap_after_a_failed_fetch() -> None:
+    """A check arriving while a retry is in flight waits instead of fetching too."""
+    from clients import scraper_client
+
+    robots = MagicMock(text="User-agent: *\nDisallow: /private\n")
+    calls = active = peak = 0
+
+    async def get(url, timeout):
+        nonlocal calls, active, peak
+        calls += 1
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        if calls == 1:
+            raise RuntimeError("connection reset")
+        return robots
+
+    client = ScraperClient()
+    client._client = AsyncMock()
+    client._client.get.side_effect = get
+
+    async def late_check() -> bool:
+        await asyncio.sleep(0.015)  # after the first fetch failed
+        return await client.check_robots_txt("https://flaky.example/private/x")
+
+    with (
+        patch.dict(scraper_client._robots_cache, clear=True),
+        patch.dict(scraper_client._robots_locks, clear=True),
+    ):
+        allowed = await asyncio.gather(
+            client.check_robots_txt("https://flaky.example/page"),
+            client.check_robots_txt("https://flaky.example/page"),
+            late_check(),
+        )
+
+    assert allowed == [True, True, False]
+    assert peak == 1
+    assert calls == 2
+
+
+async def test_pooled_client_sends_default_headers() -> None:
+    client = ScraperClient()
+    headers = client._get_client().headers
+    await client.aclose()
+
+    assert headers["user-agent"] == ScraperClient.USER_AGENT
+    assert headers["accept"].startswith("text/html")
+    assert "gzip" in headers["accept-encoding"]
+
+
+async def test_httpx_throttled_response_waits_for_retry_after() -> None:
+    """A 429 is retried after the server's Retry-After delay."""
+    client = ScraperClient()
+    responses = iter([
+        httpx.Response(429, headers={"retry-after": "2"}),
+        httpx.Response(200, content=b"<html><body><p>ok</p></body></html>"),
+    ])
+
+    @asynccontextmanager
+    async def stream(method, url):
+        yield next(responses)
+
+    with patch("clients.scraper_client.httpx.AsyncClient") as mock_httpx:
+        mock_instance = AsyncMock()
+        mock_instance.stream = MagicMock(side_effect=stream)
+        mock_httpx.return_value = mock_instance
+        with patch("clients.scraper_client.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            result = await client.scrape_url("https://example.com", use_playwright="never")
+
+    assert result.status_code == 200
+    mock_sleep.assert_awaited_once_with(2.0)
+
+
+async def test_concurrent_throttle_backoffs_do_not_block_event_loop() -> None:
+    """Throttled scrapes wait concurrently instead of serialising the loop."""
+    client = ScraperClient()
+    throttled: set[str] = set()
+
+    @asynccontextmanager
+    async def stream(method, url):
+        if url not in throttled:
+            throttled.add(url)
+            yield httpx.Response(429, headers={"retry-after-ms": "200"})
+        else:
+            yield httpx.Response(200, content=b"<html><body><p>ok</p></body></html>")
+
+    loop = asyncio.get_running_loop()
+    with patch("clients.scraper_client.httpx.AsyncClient") as mock_httpx:
+        mock_instance = AsyncMock()
+        mock_instance.stream = MagicMock(side_effect=stream)
+        mock_httpx.return_value = mock_instance
+        start = loop.time()
+        results = await asyncio.gather(
+            *(
+                client.scrape_url(f"https://example.com/{i}", use_playwright="never")
+                for i in range(50)
+            )
+        )
+        elapsed = loop.time() - start
+
+    assert all(r.status_code == 200 for r in results)
+    assert elapsed < 0.5  # ~10s if each 200ms backoff blocked the loop
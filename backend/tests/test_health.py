@@ -1,6 +1,11 @@
 import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
 from httpx import AsyncClient
 
+from api.routes import health
+from clients.redis_client import get_redis_client
+from main import app
+
 
 async def test_health_returns_status(client: AsyncClient) -> None:
     response = await client.get("/health")
@@ -9,3 +14,45 @@ async def test_health_returns_status(client: AsyncClient) -> None:
     assert "status" in data
     assert "components" in data
     assert data["components"]["database"] in ("ok", "not_initialized")
+
+
+async def test_health_reuses_shared_redis_and_recent_db_ping(client: AsyncClient) -> None:
+    mock_redis = AsyncMock()
+    mock_redis.ping.return_value = True
+    app.dependency_overrides[get_redis_client] = lambda: mock_redis
+
+    conn_cm = MagicMock()
+    conn_cm.__aenter__ = AsyncMock(return_value=AsyncMock())
+    conn_cm.__aexit__ = AsyncMock(return_value=False)
+    engine = MagicMock()
+    engine.connect.return_value = conn_cm
+
+    with patch("db.database._engine", engine), patch.object(health, "_last_db_ok", None):
+        first = await client.get("/health")
+        second = await client.get("/health")
+
+    assert first.json() == {"status": "ok", "components": {"database": "ok", "redis": "ok"}}
+    assert second.json() == first.json()
+    assert engine.connect.call_count == 1
+    assert mock_redis.ping.await_count == 2
+    mock_redis.close.assert_not_called()
+
+
+async def test_health_redis_failure_does_not_affect_database(client: AsyncClient) -> None:
+    mock_redis = AsyncMock()
+    mock_redis.ping.side_effect = ConnectionError("down")
+    app.dependency_overrides[get_redis_client] = lambda: mock_redis
+
+    conn_cm = MagicMock()
+    conn_cm.__aenter__ = AsyncMock(return_value=AsyncMock())
+    conn_cm.__aexit__ = AsyncMock(return_value=False)
+    engine = MagicMock()
+    engine.connect.return_value = conn_cm
+
+    with patch("db.database._engine", engine), patch.object(health, "_last_db_ok", None):
+        response = await client.get("/health")
+
+    assert response.json() == {
+        "status": "ok",
+        "components": {"database": "ok", "redis": "unavailable"},
+    }
@@ -1,15 +1,27 @@
+import sys
+from pathlib import Path
+
+import pytest
 from loguru import logger
 
 from logging_config import setup_logging
 
 
-def test_setup_logging_configures_loguru() -> None:
-    setup_logging(level="DEBUG")
+@pytest.fixture(autouse=True)
+def _restore_default_sink():
+    yield
+    logger.remove()
+    logger.add(sys.stderr)
+
+
+def test_setup_logging_configures_loguru(tmp_path: Path) -> None:
+    setup_logging(level="DEBUG", log_dir=tmp_path)
     with logger.catch():
         logger.info("Test message")
-    assert True
+    logger.complete()
+    assert list(tmp_path.glob("factory_*.log"))
 
 
-def test_setup_logging_accepts_level() -> None:
-    setup_logging(level="WARNING")
+def test_setup_logging_accepts_level(tmp_path: Path) -> None:
+    setup_logging(level="WARNING", log_dir=tmp_path)
     assert True
@@ -148,6 +148,17 @@ class TestShipperFormats:
             assert "input" in obj
             assert "output" in obj
 
+    async def test_process_jsonl_keeps_unicode_unescaped(self, tmp_path):
+        """Non-ASCII text is written as UTF-8, one record per line."""
+        stage = ShipperStage()
+        examples = [_qc_example(passed=True, input="Grüße?", output="こんにちは\nworld")]
+        config = {"job_id": 13, "version": "v1", "format": "jsonl", "data_dir": str(tmp_path)}
+
+        await stage.process(examples, config)
+
+        content = (tmp_path / "exports" / "13" / "v1.jsonl").read_text(encoding="utf-8")
+        assert content == '{"input":"Grüße?","output":"こんにちは\\nworld"}\n'
+
     async def test_process_json_format(self, tmp_path):
         """JSON output should be a valid JSON array."""
         stage = ShipperStage()
@@ -224,6 +235,22 @@ class TestShipperDatasetCard:
         assert "Fair" in card
         assert "Poor" in card
 
+    def test_dataset_card_score_bins(self):
+        """Bin edges are inclusive on the lower bound; unscored examples are skipped."""
+        examples = [_qc_example(score=s) for s in (0.95, 0.9, 0.7, 0.69, 0.5, 0.1)]
+        examples.append({"input": "q", "output": "a"})
+
+        card = ShipperStage()._generate_dataset_card(
+            job_id=1, version="v1", export_format="jsonl",
+            total=7, passed=7, filtered=0, examples=examples,
+        )
+
+        assert "- Excellent (>= 0.9): 2" in card
+        assert "- Good (>= 0.7): 1" in card
+        assert "- Fair (>= 0.5): 2" in card
+        assert "- Poor (< 0.5): 1" in card
+        assert "**Average quality score**: 0.640" in card
+
 
 # ---------------------------------------------------------------------------
 # ShipperStage -- process: file creation and stats
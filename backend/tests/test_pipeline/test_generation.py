@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from clients.llm_cache import LLMCache
 from clients.llm_client import LLMResponse
 from pipeline.base import StageResult
 from pipeline.stages.generation import FactoryStage
@@ -191,7 +193,7 @@ class TestProcessUsesConfiguredTemplate:
             mock_template = MagicMock()
             mock_template.template_type = "summarization"
             mock_template.system_prompt = "System prompt"
-            mock_template.render.return_value = "rendered prompt"
+            mock_template.render_parts.return_value = ("", "rendered prompt")
             mock_template.parse_response.return_value = [
                 {"input": "Q", "output": "A"}
             ]
@@ -214,7 +216,7 @@ class TestProcessUsesConfiguredTemplate:
             mock_template = MagicMock()
             mock_template.template_type = "qa"
             mock_template.system_prompt = "System prompt"
-            mock_template.render.return_value = "rendered prompt"
+            mock_template.render_parts.return_value = ("", "rendered prompt")
             mock_template.parse_response.return_value = [
                 {"input": "Q", "output": "A"}
             ]
@@ -311,6 +313,42 @@ class TestProcessHandlesLLMError:
         assert len(result.errors) == 1
 
 
+class TestMaxInFlight:
+    async def test_max_in_flight_bounds_concurrent_chunks(self) -> None:
+        in_flight = 0
+        peak = 0
+
+        async def complete(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return LLMResponse(
+                content='[{"input":"Q","output":"A"}]',
+                model="gpt-4o-mini",
+                prompt_tokens=100,
+                completion_tokens=50,
+                total_tokens=150,
+                cost=0.001,
+            )
+
+        llm = MagicMock()
+        llm.complete = AsyncMock(side_effect=complete)
+        stage = FactoryStage(llm_client=llm)
+
+        result = await stage.process(
+            _sample_input(num_docs=3, chunks_per_doc=2), config={"max_in_flight": 2}
+        )
+
+        assert peak == 2
+        assert result.stats["total_examples"] == 6
+        assert result.stats["total_tokens"] == 900
+        assert [ex["source_url"] for ex in result.data] == [
+            f"https://example.com/doc-{d}" for d in range(3) for _ in range(2)
+        ]
+
+
 # ---------------------------------------------------------------------------
 # process -- parse failure
 # ---------------------------------------------------------------------------
@@ -460,3 +498,126 @@ class TestConfigPassthrough:
             call_kwargs.kwargs.get("temperature") == 0.3
             or call_kwargs[1].get("temperature") == 0.3
         )
+
+    async def test_static_prompt_prefix_passed_to_llm(self) -> None:
+        """Every chunk shares the template prefix; only the suffix carries the chunk."""
+        llm = _mock_llm_client()
+        stage = FactoryStage(llm_client=llm)
+
+        await stage.process(_sample_input(), config={"template": "qa"})
+
+        calls = llm.complete.call_args_list
+        prefixes = {c.kwargs["prompt_prefix"] for c in calls}
+        assert len(prefixes) == 1 and prefixes.pop()
+        assert len({c.kwargs["prompt"] for c in calls}) == len(calls)
+
+
+# ---------------------------------------------------------------------------
+# LLM response cache
+# ---------------------------------------------------------------------------
+
+class TestLLMCache:
+    async def test_deterministic_rerun_served_from_cache(self, memory_redis) -> None:
+        llm = _mock_llm_client()
+        stage = FactoryStage(llm_client=llm, llm_cache=LLMCache(memory_redis))
+        config = {"temperature": 0, "cache_ttl_seconds": 60}
+
+        first = await stage.process(_sample_input(), config=config)
+        calls = llm.complete.call_count
+        second = await stage.process(_sample_input(), config=config)
+
+        assert llm.complete.call_count == calls
+        assert second.stats["total_examples"] == first.stats["total_examples"]
+        assert second.stats["total_cost"] == 0.0
+        assert all(c.kwargs["ttl"] == 60 for c in memory_redis.set_many.call_args_list)
+
+    async def test_sampled_generation_bypasses_cache(self, memory_redis) -> None:
+        llm = _mock_llm_client()
+        stage = FactoryStage(llm_client=llm, llm_cache=LLMCache(memory_redis))
+
+        await stage.process(_sample_input(), config={"temperature": 0.7})
+
+        memory_redis.get_many.assert_not_called()
+        memory_redis.set_many.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# process -- near-duplicate chunks across documents
+# ---------------------------------------------------------------------------
+
+class TestNearDuplicateChunks:
+    BOILERPLATE = (
+        "Our company has been providing reliable solar panel installation and "
+        "maintenance services to homeowners and businesses across the region "
+        "for more than twenty years with a focus on quality and safety."
+    )
+
+    def _shared_chunk_input(self, content: str) -> list[dict]:
+        data = _sample_input(num_docs=2, chunks_per_doc=1)
+        data[0]["chunks"][0]["content"] = self.BOILERPLATE
+        data[1]["chunks"][0]["content"] = content
+        return data
+
+    async def test_identical_chunk_is_skipped(self) -> None:
+        llm = _mock_llm_client()
+        stage = FactoryStage(llm_client=llm)
+
+        result = await stage.process(self._shared_chunk_input(self.BOILERPLATE), config={})
+
+        assert llm.complete.call_count == 1
+        assert result.stats["near_duplicates_skipped"] == 1
+        assert [ex["source_url"] for ex in result.data] == ["https://example.com/doc-0"]
+
+    async def test_near_identical_chunk_is_skipped(self) -> None:
+        llm = _mock_llm_client()
+        stage = FactoryStage(llm_client=llm)
+        # A trailing word changes only the last shingle.
+        content = self.BOILERPLATE + " Contact"
+
+        result = await stage.process(self._shared_chunk_input(content), config={})
+
+        assert llm.complete.call_count == 1
+        assert result.stats["near_duplicates_skipped"] == 1
+        assert len(result.data) == 1
+
+    async def test_distinct_chunks_generated_separately(self) -> None:
+        llm = _mock_llm_client()
+        stage = FactoryStage(llm_client=llm)
+
+        result = await stage.process(_sample_input(num_docs=2, chunks_per_doc=2), config={})
+
+        assert llm.complete.call_count == 4
+        assert result.stats["near_duplicates_skipped"] == 0
+
+
+# ---------------------------------------------------------------------------
+# process -- provider batch API
+# ---------------------------------------------------------------------------
+
+class TestBatchAPI:
+    async def test_use_batch_api_routes_through_batch_client(self) -> None:
+        llm = _mock_llm_client()
+        batch_llm = _mock_llm_client(cost=0.0005)
+        stage = FactoryStage(llm_client=llm, batch_llm_client=batch_llm)
+
+        result = await stage.process(
+            _sample_input(num_docs=2, chunks_per_doc=2),
+            config={"use_batch_api": True, "max_in_flight": 1},
+        )
+
+        llm.complete.assert_not_called()
+        assert batch_llm.complete.call_count == 4
+        assert result.stats["total_cost"] == pytest.approx(0.002)
+
+    async def test_unsupported_model_falls_back_to_online(self) -> None:
+        llm = _mock_llm_client()
+        batch_llm = _mock_llm_client()
+        stage = FactoryStage(llm_client=llm, batch_llm_client=batch_llm)
+
+        await stage.process(
+            _sample_input(),
+            config={"use_batch_api": True, "model": "claude-3-5-haiku-20241022"},
+        )
+
+        batch_llm.complete.assert_not_called()
+        llm.complete.assert_called_once()
@@ -41,6 +41,7 @@ async def test_spider_process_success() -> None:
         )
 
         with patch.object(stage, '_scraper') as mock_scraper:
+            mock_scraper.aclose = AsyncMock()
             mock_scraper.scrape_url = AsyncMock(return_value=mock_result)
             mock_scraper.check_robots_txt = AsyncMock(return_value=True)
 
@@ -63,6 +64,7 @@ async def test_spider_process_success() -> None:
         assert result.data[0]["status_code"] == 200
         assert result.stats["total_urls"] == 1
         assert result.stats["successful"] == 1
+        mock_scraper.aclose.assert_awaited_once()
 
 
 async def test_spider_process_with_robots_blocked() -> None:
@@ -71,6 +73,7 @@ async def test_spider_process_with_robots_blocked() -> None:
         stage = SpiderStage(data_dir=Path(tmpdir))
 
         with patch.object(stage, '_scraper') as mock_scraper:
+            mock_scraper.aclose = AsyncMock()
             mock_scraper.check_robots_txt = AsyncMock(return_value=False)
 
             result = await stage.process(
@@ -105,6 +108,7 @@ async def test_spider_process_scrape_failure() -> None:
         )
 
         with patch.object(stage, '_scraper') as mock_scraper:
+            mock_scraper.aclose = AsyncMock()
             mock_scraper.scrape_url = AsyncMock(return_value=mock_result)
             mock_scraper.check_robots_txt = AsyncMock(return_value=True)
 
@@ -125,3 +129,69 @@ async def test_spider_process_scrape_failure() -> None:
         assert len(result.data) == 0
         assert result.stats["failed"] == 1
         assert len(result.errors) == 1
+
+
+async def test_spider_process_streams_documents() -> None:
+    """Scraped documents are queued as they are saved, then a None sentinel."""
+    import asyncio
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        stage = SpiderStage(data_dir=Path(tmpdir))
+        documents: asyncio.Queue = asyncio.Queue()
+
+        mock_result = ScrapeResult(
+            url="https://example.com/article",
+            html="<html><body><p>Content</p></body></html>",
+            status_code=200,
+            method="httpx",
+        )
+
+        with patch.object(stage, '_scraper') as mock_scraper:
+            mock_scraper.aclose = AsyncMock()
+            mock_scraper.scrape_url = AsyncMock(return_value=mock_result)
+            mock_scraper.check_robots_txt = AsyncMock(return_value=True)
+
+            result = await stage.process(
+                input_data=["https://example.com/article"],
+                config={"job_id": 1, "scraping": {"rate_limit": 100.0}},
+                documents=documents,
+            )
+
+        assert documents.get_nowait() == result.data[0]
+        assert documents.get_nowait() is None
+        assert documents.empty()
+
+
+async def test_spider_checks_robots_for_all_domains_concurrently() -> None:
+    """robots.txt checks run up front, not throttled by max_concurrent."""
+    import asyncio
+
+    urls = [f"https://site{i}.example/page" for i in range(4)]
+    in_flight = peak = 0
+
+    async def check(url: str) -> bool:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return not url.startswith("https://site0.")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        stage = SpiderStage(data_dir=Path(tmpdir))
+
+        with patch.object(stage, '_scraper') as mock_scraper:
+            mock_scraper.aclose = AsyncMock()
+            mock_scraper.scrape_url = AsyncMock(side_effect=lambda url, **_: ScrapeResult(
+                url=url, html="<html></html>", status_code=200, method="httpx",
+            ))
+            mock_scraper.check_robots_txt = AsyncMock(side_effect=check)
+
+            result = await stage.process(
+                input_data=urls,
+                config={"job_id": 1, "scraping": {"max_concurrent": 1, "rate_limit": 100.0}},
+            )
+
+        assert peak == len(urls)
+        assert result.stats["robots_blocked"] == 1
+        assert result.stats["successful"] == 3
@@ -0,0 +1,32 @@
+from datasketch import LeanMinHash, MinHash
+
+from pipeline.minhash import shingles, signatures
+
+
+def test_shingles_are_lowercased_word_trigrams() -> None:
+    assert shingles("The quick Brown fox") == {b"the quick brown", b"quick brown fox"}
+
+
+def test_short_text_is_a_single_shingle() -> None:
+    assert shingles("Hello world") == {b"hello world"}
+
+
+def test_signatures_match_incremental_minhash() -> None:
+    token_sets = [{b"a", b"b", b"c"}, {b"b", b"c", b"d"}, set()]
+
+    signed = signatures(token_sets, num_perm=64)
+
+    assert len(signed) == 3
+    assert all(isinstance(m, LeanMinHash) for m in signed)
+    for tokens, m in zip(token_sets, signed):
+        expected = MinHash(num_perm=64)
+        for token in tokens:
+            expected.update(token)
+        assert m.jaccard(LeanMinHash(expected)) == 1.0
+
+
+def test_shingles_lowercase_and_encode_non_ascii_words() -> None:
+    assert shingles("Straße ÜBER Köln am Rhein", k=4) == {
+        "straße über köln am".encode(),
+        "über köln am rhein".encode(),
+    }
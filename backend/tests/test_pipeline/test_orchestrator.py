@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -34,9 +35,19 @@ async def db_setup():
 
 @pytest.fixture
 def redis_mock():
-    """Return an AsyncMock RedisClient."""
+    """Return an AsyncMock RedisClient.
+
+    Batched progress events are forwarded to ``publish`` so tests can
+    inspect every event in order.
+    """
     mock = AsyncMock()
     mock.publish = AsyncMock()
+
+    async def publish_many(events):
+        for channel, data in events:
+            await mock.publish(channel, data)
+
+    mock.publish_many = AsyncMock(side_effect=publish_many)
     return mock
 
 
@@ -898,6 +909,35 @@ class TestOrchestratorCancellationPolling:
         mock_stages["refiner"].process.assert_not_awaited()
         mock_stages["factory"].process.assert_not_awaited()
 
+    async def test_stage_failure_keeps_cancelled_status(
+        self, db_setup, redis_mock, llm_mock, job_config
+    ):
+        """A stage that fails because its job was cancelled leaves it cancelled."""
+        job_id = await _create_pending_job(db_setup, job_config)
+        mock_stages = _patch_stages()
+        orchestrator = PipelineOrchestrator(
+            session_factory=db_setup, redis_client=redis_mock, llm_client=llm_mock
+        )
+
+        async def factory_batch_cancelled(*args, **kwargs):
+            await orchestrator._record_llm_batch(job_id, "batch-1")
+            async with db_setup() as session:
+                job = await session.get(Job, job_id)
+                job.status = "cancelled"
+                await session.commit()
+            assert await orchestrator._is_cancelled(job_id)
+            raise RuntimeError("LLM batch batch-1 cancelled")
+
+        mock_stages["factory"].process = AsyncMock(side_effect=factory_batch_cancelled)
+
+        with patch.object(orchestrator, "_build_stages", return_value=mock_stages):
+            await orchestrator.run(job_id)
+
+        async with db_setup() as session:
+            job = await session.get(Job, job_id)
+            assert job.status == "cancelled"
+            assert job.llm_batch_id == "batch-1"
+
     async def test_normal_flow_unaffected(
         self, db_setup, redis_mock, llm_mock, job_config
     ):
@@ -991,3 +1031,169 @@ class TestOrchestratorCostLimit:
             res = await session.execute(select(Job).where(Job.id == job_id))
             job = res.scalar_one()
             assert job.status == "completed"
+
+
+async def test_progress_events_are_batched_until_terminal(redis_mock) -> None:
+    orchestrator = PipelineOrchestrator(redis_client=redis_mock)
+
+    await orchestrator._publish_progress(1, "spider", 0.1, "running")
+    await orchestrator._publish_progress(1, "refiner", 0.3, "running")
+    redis_mock.publish.assert_not_called()  # still buffered
+
+    await orchestrator._publish_progress(1, "refiner", 0.3, "failed", error="boom")
+
+    redis_mock.publish_many.assert_awaited_once()
+    events = redis_mock.publish_many.await_args.args[0]
+    assert [data["status"] for _, data in events] == ["running", "running", "failed"]
+    assert all(channel == "pipeline:progress:1" for channel, _ in events)
+
+
+async def test_inspector_models_preloaded_before_inspector(
+    db_setup, redis_mock, llm_mock, job_config
+) -> None:
+    job_id = await _create_pending_job(db_setup, job_config)
+    mock_stages = _patch_stages()
+    order: list[str] = []
+    mock_stages["inspector"].preload_models.side_effect = lambda checks: order.append("preload")
+    mock_stages["inspector"].process.side_effect = (
+        lambda *args: order.append("inspector") or _INSPECTOR_RESULT
+    )
+
+    orchestrator = PipelineOrchestrator(
+        session_factory=db_setup, redis_client=redis_mock, llm_client=llm_mock
+    )
+    with patch.object(orchestrator, "_build_stages", return_value=mock_stages):
+        await orchestrator.run(job_id)
+
+    mock_stages["inspector"].preload_models.assert_called_once_with(["toxicity", "readability"])
+    assert order.index("preload") < order.index("inspector")
+
+
+async def test_failed_model_preload_does_not_fail_job(
+    db_setup, redis_mock, llm_mock, job_config
+) -> None:
+    job_id = await _create_pending_job(db_setup, job_config)
+    mock_stages = _patch_stages()
+    mock_stages["inspector"].preload_models.side_effect = OSError("no weights")
+
+    orchestrator = PipelineOrchestrator(
+        session_factory=db_setup, redis_client=redis_mock, llm_client=llm_mock
+    )
+    with patch.object(orchestrator, "_build_stages", return_value=mock_stages):
+        await orchestrator.run(job_id)
+
+    async with db_setup() as session:
+        job = await session.get(Job, job_id)
+        assert job.status == "completed"
+
+
+async def test_model_preload_cancelled_when_job_stops_early(
+    db_setup, redis_mock, llm_mock, job_config
+) -> None:
+    job_id = await _create_pending_job(db_setup, job_config)
+    mock_stages = _patch_stages()
+    mock_stages["spider"].process.side_effect = RuntimeError("network down")
+    preloads: list[asyncio.Task] = []
+
+    async def slow_preload(inspector, checks) -> None:
+        preloads.append(asyncio.current_task())
+        await asyncio.Event().wait()
+
+    orchestrator = PipelineOrchestrator(
+        session_factory=db_setup, redis_client=redis_mock, llm_client=llm_mock
+    )
+    with (
+        patch.object(orchestrator, "_build_stages", return_value=mock_stages),
+        patch.object(orchestrator, "_preload_models", slow_preload),
+    ):
+        await orchestrator.run(job_id)
+    await asyncio.sleep(0)
+
+    assert len(preloads) == 1 and preloads[0].cancelled()
+
+
+async def test_dataset_card_stored_on_export(
+    db_setup, redis_mock, llm_mock, job_config, tmp_path
+) -> None:
+    card_path = tmp_path / "v1_card.md"
+    card_path.write_text("# Dataset Card\n", encoding="utf-8")
+    job_id = await _create_pending_job(db_setup, job_config)
+    mock_stages = _patch_stages()
+    mock_stages["shipper"].process.return_value = StageResult(
+        success=True,
+        data=_SHIPPER_RESULT.data,
+        stats={**_SHIPPER_RESULT.stats, "dataset_card_path": str(card_path)},
+    )
+
+    orchestrator = PipelineOrchestrator(
+        session_factory=db_setup, redis_client=redis_mock, llm_client=llm_mock
+    )
+    with patch.object(orchestrator, "_build_stages", return_value=mock_stages):
+        await orchestrator.run(job_id)
+
+    async with db_setup() as session:
+        export = await session.scalar(select(Export).where(Export.job_id == job_id))
+        assert export.dataset_card == "# Dataset Card\n"
+
+
+async def test_persisted_quality_details_accept_numpy_scalars(db_setup) -> None:
+    import numpy as np
+    from db.models import TrainingExample
+
+    orchestrator = PipelineOrchestrator(session_factory=db_setup)
+    await orchestrator._persist_examples(1, [{
+        "input": "q",
+        "output": "a",
+        "quality_score": np.float64(0.75),
+        "quality_details": {"coherence": {"score": np.float32(0.5), "detail": "ok"}},
+    }])
+
+    async with db_setup() as session:
+        row = await session.scalar(select(TrainingExample))
+        assert row.quality_details == {"coherence": {"score": 0.5, "detail": "ok"}}
+        assert row.quality_score == 0.75
+
+
+async def test_refiner_streams_pages_while_spider_scrapes(
+    db_setup, redis_mock, llm_mock, job_config
+) -> None:
+    import asyncio
+
+    from pipeline.stages.ingestion import SpiderStage
+    from pipeline.stages.processing import RefinerStage
+
+    job_id = await _create_pending_job(db_setup, job_config)
+    mock_stages = _patch_stages()
+    spider = MagicMock(spec=SpiderStage)
+    refiner = MagicMock(spec=RefinerStage)
+    received: list[dict] = []
+    refined_during_scrape: list[int] = []
+
+    async def scrape(urls, config, documents):
+        documents.put_nowait(_SPIDER_RESULT.data[0])
+        await asyncio.sleep(0.01)  # still scraping the next page
+        refined_during_scrape.append(len(received))
+        documents.put_nowait(None)
+        return _SPIDER_RESULT
+
+    async def refine(documents, config):
+        while (doc := await documents.get()) is not None:
+            received.append(doc)
+        return _REFINER_RESULT
+
+    spider.process = AsyncMock(side_effect=scrape)
+    refiner.process_stream = AsyncMock(side_effect=refine)
+    mock_stages["spider"], mock_stages["refiner"] = spider, refiner
+
+    orchestrator = PipelineOrchestrator(
+        session_factory=db_setup, redis_client=redis_mock, llm_client=llm_mock
+    )
+    with patch.object(orchestrator, "_build_stages", return_value=mock_stages):
+        await orchestrator.run(job_id)
+
+    refiner.process.assert_not_awaited()
+    assert refined_during_scrape == [1]
+    assert mock_stages["factory"].process.call_args[0][0] == _REFINER_RESULT.data
+    async with db_setup() as session:
+        job = await session.get(Job, job_id)
+        assert job.status == "completed"
@@ -4,6 +4,7 @@ from unittest.mock import patch
 import pytest
 
 from pipeline.base import StageResult
+from pipeline.stages import processing
 from pipeline.stages.processing import RefinerStage
 
 
@@ -138,7 +139,7 @@ class TestBeautifulSoupFallback:
         docs = _spider_docs([html_path])
 
         with patch("pipeline.stages.processing.trafilatura") as mock_traf:
-            mock_traf.extract.return_value = None
+            mock_traf.bare_extraction.return_value = None
             result = await stage.process(docs, config={})
 
         assert result.success is True
@@ -152,7 +153,7 @@ class TestBeautifulSoupFallback:
         docs = _spider_docs([html_path])
 
         with patch("pipeline.stages.processing.trafilatura") as mock_traf:
-            mock_traf.extract.return_value = None
+            mock_traf.bare_extraction.return_value = None
             result = await stage.process(docs, config={})
 
         content = result.data[0]["content"]
@@ -280,7 +281,7 @@ class TestDeduplication:
         docs = _spider_docs([html_path])
 
         with patch("pipeline.stages.processing.trafilatura") as mock_traf:
-            mock_traf.extract.return_value = repeated
+            mock_traf.bare_extraction.return_value.as_dict.return_value = {"text": repeated}
             result = await stage.process(
                 docs, config={"chunk_size": 512, "chunk_overlap": 0}
             )
@@ -310,7 +311,7 @@ class TestDeduplication:
         docs = _spider_docs([html_path])
 
         with patch("pipeline.stages.processing.trafilatura") as mock_traf:
-            mock_traf.extract.return_value = text
+            mock_traf.bare_extraction.return_value.as_dict.return_value = {"text": text}
             result = await stage.process(
                 docs, config={"chunk_size": 1024, "chunk_overlap": 0}
             )
@@ -329,7 +330,7 @@ class TestDeduplication:
         docs = _spider_docs([html_path])
 
         with patch("pipeline.stages.processing.trafilatura") as mock_traf:
-            mock_traf.extract.return_value = repeated
+            mock_traf.bare_extraction.return_value.as_dict.return_value = {"text": repeated}
             result = await stage.process(
                 docs, config={"chunk_size": 512, "chunk_overlap": 0}
             )
@@ -364,7 +365,7 @@ class TestLanguageDetection:
 
         # Force trafilatura to return some text but no language
         with patch("pipeline.stages.processing.trafilatura") as mock_traf:
-            mock_traf.extract.return_value = "..."
+            mock_traf.bare_extraction.return_value.as_dict.return_value = {"text": "..."}
             with patch(
                 "pipeline.stages.processing._detect_language", return_value=None
             ):
@@ -469,6 +470,84 @@ class TestFullProcessFlow:
         assert len(result.data) == 0
         assert len(result.errors) >= 1
 
+    async def test_worker_process_errors_reported_per_document(self, tmp_path: Path) -> None:
+        """With several workers, each document's failure comes back from its process."""
+        stage = RefinerStage()
+        docs = [
+            {
+                "url": f"https://example.com/gone-{i}",
+                "html_path": str(tmp_path / f"missing-{i}.html"),
+                "status_code": 200,
+                "method": "httpx",
+                "title": "Gone",
+                "language": "en",
+            }
+            for i in range(2)
+        ]
+
+        result = await stage.process(docs, config={"refiner_workers": 2})
+
+        assert result.success is True
+        assert result.stats["failed"] == 2
+        assert all(err.startswith("Cannot read") for err in result.errors)
+
+    async def test_worker_pool_is_shared_across_jobs(self, tmp_path: Path) -> None:
+        """Later jobs reuse the process pool the first one started."""
+        docs = [
+            {
+                "url": f"https://example.com/gone-{i}",
+                "html_path": str(tmp_path / f"missing-{i}.html"),
+                "status_code": 200,
+                "method": "httpx",
+                "title": "Gone",
+                "language": "en",
+            }
+            for i in range(2)
+        ]
+
+        await RefinerStage().process(docs, config={"refiner_workers": 2})
+        pool = processing._get_process_pool()
+        result = await RefinerStage().process(docs, config={"refiner_workers": 2})
+
+        assert processing._get_process_pool() is pool
+        assert result.stats["failed"] == 2
+
+    async def test_dead_pool_worker_fails_its_document_and_resets_pool(
+        self, tmp_path: Path
+    ) -> None:
+        """A crashed worker process is reported per document, not for the stage."""
+        from concurrent.futures import Executor, Future
+        from concurrent.futures.process import BrokenProcessPool
+
+        class DeadPool(Executor):
+            def submit(self, fn, *args, **kwargs):
+                future = Future()
+                future.set_exception(BrokenProcessPool("worker died"))
+                return future
+
+        docs = _spider_docs([str(tmp_path / "missing-0.html"), str(tmp_path / "missing-1.html")])
+
+        with patch.object(processing, "_process_pool", DeadPool()):
+            result = await RefinerStage().process(docs, config={"refiner_workers": 2})
+            assert processing._process_pool is None
+
+        assert result.success is True
+        assert result.stats["failed"] == 2
+        assert result.errors[0].startswith("Cannot read")
+        assert "BrokenProcessPool" in result.errors[1]
+
+    async def test_refiner_exception_recorded_per_document(self, tmp_path: Path) -> None:
+        docs = _spider_docs([str(tmp_path / "a.html"), str(tmp_path / "b.html")])
+
+        with patch.object(
+            processing, "_refine_one", side_effect=[ValueError("bad html"), (None, 0, None)]
+        ):
+            result = await RefinerStage().process(docs, config={"refiner_workers": 1})
+
+        assert result.success is True
+        assert result.stats["failed"] == 1
+        assert "bad html" in result.errors[0]
+
     async def test_process_skips_empty_content(self, tmp_path: Path) -> None:
         """Documents with no extractable text should be skipped."""
         stage = RefinerStage()
@@ -477,7 +556,7 @@ class TestFullProcessFlow:
         docs = _spider_docs([html_path])
 
         with patch("pipeline.stages.processing.trafilatura") as mock_traf:
-            mock_traf.extract.return_value = None
+            mock_traf.bare_extraction.return_value = None
             result = await stage.process(docs, config={})
 
         # BS4 fallback on empty body returns empty string; document skipped
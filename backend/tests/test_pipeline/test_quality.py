@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from pipeline.base import StageResult
+from pipeline.quality_checks import toxicity
 from pipeline.quality_checks.toxicity import ToxicityChecker
 from pipeline.quality_checks.readability import ReadabilityChecker
 from pipeline.quality_checks.format_check import FormatChecker
@@ -42,6 +43,26 @@ def _bad_example_short_output() -> dict:
     return _good_example(output="Too short.")
 
 
+@pytest.fixture(autouse=True)
+def _fresh_detoxify_cache():
+    """Each test patches Detoxify; drop models cached by earlier tests."""
+    toxicity._load_detoxify.cache_clear()
+    yield
+    toxicity._load_detoxify.cache_clear()
+
+
+def _batched_predict(*per_text: dict):
+    """Detoxify.predict side effect: a list input gets one score list per label."""
+    def predict(text):
+        if isinstance(text, str):
+            return per_text[0]
+        return {
+            label: [per_text[i % len(per_text)][label] for i in range(len(text))]
+            for label in per_text[0]
+        }
+    return predict
+
+
 # ---------------------------------------------------------------------------
 # ToxicityChecker
 # ---------------------------------------------------------------------------
@@ -62,7 +83,7 @@ class TestToxicityChecker:
 
         checker = ToxicityChecker()
         example = _good_example()
-        score, detail = await checker.check(example)
+        score, detail = checker.check(example)
 
         assert score == pytest.approx(0.99, abs=0.02)
         assert "clean" in detail.lower() or score > 0.9
@@ -82,11 +103,58 @@ class TestToxicityChecker:
 
         checker = ToxicityChecker()
         example = _good_example()
-        score, detail = await checker.check(example)
+        score, detail = checker.check(example)
 
         assert score < 0.15
         assert score >= 0.0
 
+    @patch("pipeline.quality_checks.toxicity.Detoxify")
+    async def test_toxicity_model_shared_across_checkers(self, mock_detoxify_cls):
+        ToxicityChecker()
+        ToxicityChecker()
+        mock_detoxify_cls.assert_called_once_with("original")
+
+    @patch("pipeline.quality_checks.toxicity.Detoxify")
+    async def test_toxicity_checker_batches_set_examples(self, mock_detoxify_cls):
+        clean = {"toxicity": 0.01, "insult": 0.0}
+        toxic = {"toxicity": 0.2, "insult": 0.9}
+        mock_model = MagicMock()
+        mock_model.predict.side_effect = _batched_predict(clean, toxic)
+        mock_detoxify_cls.return_value = mock_model
+
+        checker = ToxicityChecker()
+        checker.BATCH_SIZE = 2
+        examples = [
+            _good_example(input="q1"),
+            _good_example(input="q2"),
+            _good_example(input="q1"),  # repeated text is scored once
+            _good_example(input="q3"),
+        ]
+        checker.set_examples(examples)
+        scores = [checker.check(ex)[0] for ex in examples]
+
+        # Three distinct texts in batches of two
+        assert [len(c.args[0]) for c in mock_model.predict.call_args_list] == [2, 1]
+        assert scores == pytest.approx([0.99, 0.1, 0.99, 0.99])
+
+    @patch("pipeline.quality_checks.toxicity.Detoxify")
+    async def test_toxicity_acheck_runs_uncached_inference_in_thread(self, mock_detoxify_cls):
+        import threading
+
+        threads = []
+        mock_model = MagicMock()
+        mock_detoxify_cls.return_value = mock_model
+
+        def predict(text):
+            threads.append(threading.current_thread())
+            return {"toxicity": 0.0, "insult": 0.0}
+
+        mock_model.predict.side_effect = predict
+        score, detail = await ToxicityChecker().acheck(_good_example())
+
+        assert (score, detail) == (1.0, "clean")
+        assert threads and threads[0] is not threading.main_thread()
+
 
 # ---------------------------------------------------------------------------
 # ReadabilityChecker
@@ -98,7 +166,7 @@ class TestReadabilityChecker:
         example = _good_example(
             output="The cat sat on the mat. The dog ran in the park. It was a sunny day."
         )
-        score, detail = await checker.check(example)
+        score, detail = checker.check(example)
 
         assert score > 0.6
         assert "Flesch" in detail
@@ -114,12 +182,35 @@ class TestReadabilityChecker:
                 "and poststructuralist interpretive frameworks."
             )
         )
-        score, detail = await checker.check(example)
+        score, detail = checker.check(example)
 
         # Complex academic text should have lower readability
         assert score < 0.5
         assert "Flesch" in detail
 
+    @pytest.mark.parametrize("text", ["这是一个关于机器学习的句子。", "Это простой текст.", "12345 67890"])
+    async def test_readability_unmeasurable_text_is_neutral(self, text):
+        checker = ReadabilityChecker()
+
+        score, detail = checker.check(_good_example(output=text))
+
+        assert score == ReadabilityChecker.UNMEASURABLE_SCORE
+        assert detail == ReadabilityChecker.UNMEASURABLE_DETAIL
+
+    async def test_readability_check_batch_matches_check(self):
+        checker = ReadabilityChecker()
+        examples = [
+            _good_example(output="The cat sat on the mat. The dog ran in the park."),
+            _good_example(),
+            _good_example(output="   "),
+            _good_example(output="12345 67890"),
+        ]
+        scores, details = ReadabilityChecker.check_batch(examples)
+
+        expected = [checker.check(ex) for ex in examples]
+        assert details == [d for _, d in expected]
+        assert scores.tolist() == pytest.approx([s for s, _ in expected])
+
 
 # ---------------------------------------------------------------------------
 # FormatChecker
@@ -129,7 +220,7 @@ class TestFormatChecker:
     async def test_format_checker_valid_example(self):
         checker = FormatChecker()
         example = _good_example()
-        score, detail = await checker.check(example)
+        score, detail = checker.check(example)
 
         assert score == 1.0
         assert "valid" in detail.lower()
@@ -137,7 +228,7 @@ class TestFormatChecker:
     async def test_format_checker_empty_input(self):
         checker = FormatChecker()
         example = _bad_example_empty_input()
-        score, detail = await checker.check(example)
+        score, detail = checker.check(example)
 
         assert score == 0.0
         assert "input" in detail.lower()
@@ -145,11 +236,27 @@ class TestFormatChecker:
     async def test_format_checker_short_output(self):
         checker = FormatChecker()
         example = _bad_example_short_output()
-        score, detail = await checker.check(example)
+        score, detail = checker.check(example)
 
         assert score == 0.0
         assert "output" in detail.lower()
 
+    async def test_format_check_batch_matches_check(self):
+        checker = FormatChecker()
+        examples = [
+            _good_example(),
+            _bad_example_empty_input(),
+            _bad_example_short_output(),
+            {"input": "short", "output": "x" * 30},
+            {"input": "   ", "output": "   "},
+            {"input": 42, "output": "x" * 30},
+        ]
+        scores, details = FormatChecker.check_batch(examples)
+
+        assert [(float(s), d) for s, d in zip(scores, details)] == [
+            checker.check(ex) for ex in examples
+        ]
+
 
 # ---------------------------------------------------------------------------
 # DuplicateChecker
@@ -165,7 +272,7 @@ class TestDuplicateChecker:
         ]
         checker.set_examples(examples)
 
-        score, detail = await checker.check(examples[0], index=0)
+        score, detail = checker.check(examples[0], index=0)
         assert score == 1.0
         assert "unique" in detail.lower()
 
@@ -184,10 +291,57 @@ class TestDuplicateChecker:
         checker.set_examples(examples)
 
         # Check the second example -- it should be marked as a duplicate
-        score, detail = await checker.check(examples[1], index=1)
+        score, detail = checker.check(examples[1], index=1)
         assert score < 1.0
         assert "duplicate" in detail.lower() or "similar" in detail.lower()
 
+    async def test_duplicate_checker_lsh_prefilter(self):
+        """Large example sets compare only against LSH candidates."""
+        checker = DuplicateChecker()
+        checker.LSH_MIN_EXAMPLES = 1  # force the LSH path
+        examples = [
+            _good_example(input="What is Python?", output="Python is a programming language."),
+            _good_example(input="What is Java?", output="Java is an object-oriented language."),
+            _good_example(input="What is Python?", output="Python is a programming language."),
+        ]
+        checker.set_examples(examples)
+
+        assert checker.check(examples[1], index=1)[0] == 1.0
+        score, detail = checker.check(examples[2], index=2)
+        assert score < 1.0
+        assert "duplicate" in detail
+
+    async def test_duplicate_checker_rows_match_query_vectors(self):
+        """Batch-built matrix rows equal the per-text normalised TF vectors."""
+        import numpy as np
+
+        checker = DuplicateChecker()
+        examples = [
+            _good_example(input="A a b", output="c"),
+            _good_example(input="", output=""),
+            _good_example(input="B", output="d D d"),
+        ]
+        checker.set_examples(examples)
+
+        for row, ex in enumerate(examples):
+            expected = checker._query_vector(f"{ex['input']} {ex['output']}")
+            np.testing.assert_allclose(checker._matrix[row].toarray().ravel(), expected)
+
+    async def test_duplicate_checker_indexed_check_matches_query_path(self):
+        """Looking up an example's own row scores like re-vectorizing its text."""
+        checker = DuplicateChecker(threshold=0.5)
+        examples = [
+            _good_example(input="What is Python?", output="Python is a language."),
+            _good_example(input="What is Python", output="Python is a programming language."),
+        ]
+        checker.set_examples(examples)
+
+        indexed = checker.check(examples[1], index=1)
+        unindexed_rows = checker._matrix[:1] @ checker._query_vector(
+            f"{examples[1]['input']} {examples[1]['output']}"
+        )
+        assert indexed[0] == pytest.approx(1.0 - float(unindexed_rows.max()))
+
 
 # ---------------------------------------------------------------------------
 # InspectorStage -- basic identity
@@ -221,14 +375,14 @@ class TestInspectorProcess:
     async def test_inspector_process_passes_good_examples(self, mock_detoxify_cls):
         """Good examples should pass QC with score above threshold."""
         mock_model = MagicMock()
-        mock_model.predict.return_value = {
+        mock_model.predict.side_effect = _batched_predict({
             "toxicity": 0.01,
             "severe_toxicity": 0.0,
             "obscene": 0.0,
             "threat": 0.0,
             "insult": 0.0,
             "identity_attack": 0.0,
-        }
+        })
         mock_detoxify_cls.return_value = mock_model
 
         stage = InspectorStage()
@@ -244,14 +398,14 @@ class TestInspectorProcess:
     async def test_inspector_process_fails_bad_examples(self, mock_detoxify_cls):
         """Examples with toxic content should fail QC."""
         mock_model = MagicMock()
-        mock_model.predict.return_value = {
+        mock_model.predict.side_effect = _batched_predict({
             "toxicity": 0.95,
             "severe_toxicity": 0.9,
             "obscene": 0.9,
             "threat": 0.5,
             "insult": 0.9,
             "identity_attack": 0.7,
-        }
+        })
         mock_detoxify_cls.return_value = mock_model
 
         stage = InspectorStage()
@@ -268,14 +422,14 @@ class TestInspectorProcess:
     async def test_inspector_process_adds_quality_fields(self, mock_detoxify_cls):
         """Each example should be enriched with quality_score, quality_details, passed_qc."""
         mock_model = MagicMock()
-        mock_model.predict.return_value = {
+        mock_model.predict.side_effect = _batched_predict({
             "toxicity": 0.02,
             "severe_toxicity": 0.0,
             "obscene": 0.0,
             "threat": 0.0,
             "insult": 0.0,
             "identity_attack": 0.0,
-        }
+        })
         mock_detoxify_cls.return_value = mock_model
 
         stage = InspectorStage()
@@ -306,8 +460,8 @@ class TestInspectorProcess:
     async def test_inspector_stats_include_pass_fail_counts(self, mock_detoxify_cls):
         """Stats should include total, passed, and failed counts."""
         mock_model = MagicMock()
-        # First call: clean, second call: toxic
-        mock_model.predict.side_effect = [
+        # First example: clean, second example: toxic
+        mock_model.predict.side_effect = _batched_predict(
             {
                 "toxicity": 0.01, "severe_toxicity": 0.0, "obscene": 0.0,
                 "threat": 0.0, "insult": 0.0, "identity_attack": 0.0,
@@ -316,7 +470,7 @@ class TestInspectorProcess:
                 "toxicity": 0.99, "severe_toxicity": 0.9, "obscene": 0.9,
                 "threat": 0.5, "insult": 0.9, "identity_attack": 0.7,
             },
-        ]
+        )
         mock_detoxify_cls.return_value = mock_model
 
         stage = InspectorStage()
@@ -331,3 +485,182 @@ class TestInspectorProcess:
         assert "failed" in result.stats
         assert result.stats["total"] == 2
         assert result.stats["passed"] + result.stats["failed"] == result.stats["total"]
+
+
+class TestInspectorResultCache:
+    @patch("pipeline.quality_checks.toxicity.Detoxify")
+    async def test_cached_results_skip_inference(self, mock_detoxify_cls):
+        mock_model = MagicMock()
+        mock_detoxify_cls.return_value = mock_model
+
+        redis = AsyncMock()
+        redis.get_many.return_value = [[0.42, "cached"], None]
+        stage = InspectorStage(redis_client=redis)
+        examples = [_good_example(), _good_example(input="Another question?")]
+        mock_model.predict.side_effect = _batched_predict({"toxicity": 0.0, "insult": 0.0})
+
+        result = await stage.process(examples, config={"checks": ["toxicity", "duplicate"]})
+
+        # Only the uncached example reaches the model
+        assert [c.args[0] for c in mock_model.predict.call_args_list] == [
+            [f"{examples[1]['input']} {examples[1]['output']}"]
+        ]
+        assert result.data[0]["quality_details"]["toxicity"] == {"score": 0.42, "detail": "cached"}
+        # The duplicate check depends on the whole set and is never cached
+        assert len(redis.get_many.await_args.args[0]) == 2
+        stored = redis.set_many.await_args.args[0]
+        assert list(stored.values()) == [[1.0, "clean"]]
+        assert all(key.startswith("qc:toxicity:") for key in stored)
+
+    @patch("pipeline.quality_checks.toxicity.Detoxify")
+    async def test_cache_failure_does_not_fail_stage(self, mock_detoxify_cls):
+        mock_model = MagicMock()
+        mock_detoxify_cls.return_value = mock_model
+        mock_model.predict.side_effect = _batched_predict({"toxicity": 0.0, "insult": 0.0})
+        redis = AsyncMock()
+        redis.get_many.side_effect = ConnectionError("down")
+        redis.set_many.side_effect = ConnectionError("down")
+        stage = InspectorStage(redis_client=redis)
+
+        result = await stage.process([_good_example()], config={"checks": ["toxicity"]})
+
+        assert result.success is True
+        redis.get_many.assert_awaited_once()
+        assert result.data[0]["quality_details"]["toxicity"]["score"] == 1.0
+
+    async def test_batch_checkers_bypass_cache(self):
+        redis = AsyncMock()
+        stage = InspectorStage(redis_client=redis)
+
+        result = await stage.process(
+            [_good_example()], config={"checks": ["format", "length_balance"]}
+        )
+
+        assert result.data[0]["quality_details"]["format"]["score"] == 1.0
+        redis.get_many.assert_not_awaited()
+        redis.set_many.assert_not_awaited()
+
+    async def test_weighted_score_mixes_batched_and_failing_checkers(self):
+        """Weights apply across batch columns; a failing checker scores 0."""
+        stage = InspectorStage()
+        examples = [_good_example(), _bad_example_short_output()]
+
+        with patch.object(
+            DuplicateChecker, "check", side_effect=[RuntimeError("boom"), (1.0, "unique")]
+        ):
+            result = await stage.process(
+                examples,
+                config={
+                    "checks": ["format", "duplicate"],
+                    "weights": {"format": 3.0},
+                    "min_score": 0.7,
+                },
+            )
+
+        first, second = result.data
+        assert first["quality_score"] == pytest.approx(0.75)
+        assert first["quality_details"]["duplicate"] == {"score": 0.0, "detail": "error: boom"}
+        assert first["passed_qc"] is True
+        assert second["quality_score"] == pytest.approx(0.25)
+        assert second["passed_qc"] is False
+        assert result.stats["passed"] == 1 and result.stats["failed"] == 1
+        assert result.errors == ["duplicate: boom"]
+
+    async def test_malformed_example_only_errors_its_own_batch_score(self):
+        """A batch checker that chokes on one example scores the rest normally."""
+        stage = InspectorStage()
+        examples = [_good_example(), _good_example(output=12345)]
+
+        result = await stage.process(examples, config={"checks": ["readability"]})
+
+        good, bad = result.data
+        assert good["quality_details"]["readability"]["detail"].startswith("Flesch")
+        assert bad["quality_score"] == 0.0
+        assert bad["quality_details"]["readability"]["detail"].startswith("error:")
+        assert len(result.errors) == 1 and result.errors[0].startswith("readability:")
+
+
+@patch("pipeline.quality_checks.toxicity.Detoxify")
+def test_inspector_preload_models_loads_only_configured_models(mock_detoxify_cls):
+    with patch("pipeline.quality_checks.coherence._load_model") as load_coherence:
+        InspectorStage.preload_models(["toxicity", "format", "unknown"])
+
+    mock_detoxify_cls.assert_called_once_with("original")
+    load_coherence.assert_not_called()
+    # Checkers created afterwards reuse the preloaded model
+    ToxicityChecker()
+    mock_detoxify_cls.assert_called_once()
+
+
+def test_concurrent_cold_loads_build_the_model_once():
+    import threading
+    import time
+
+    def slow_detoxify(model_type):
+        time.sleep(0.05)
+        return MagicMock()
+
+    start = threading.Barrier(2)
+    models = []
+
+    def load():
+        start.wait()
+        models.append(toxicity._load_detoxify("original"))
+
+    with patch("pipeline.quality_checks.toxicity.Detoxify", side_effect=slow_detoxify) as ctor:
+        threads = [threading.Thread(target=load) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    ctor.assert_called_once_with("original")
+    assert models[0] is models[1]
+
+
+async def test_inspector_precompute_runs_off_event_loop():
+    import threading
+
+    threads = []
+
+    def record(self, examples):
+        threads.append(threading.current_thread())
+
+    with patch.object(DuplicateChecker, "set_examples", record):
+        await InspectorStage().process([_good_example()], config={"checks": ["duplicate"]})
+
+    assert threads and threads[0] is not threading.main_thread()
+
+
+async def test_inspector_awaits_acheck_on_plugin_checkers():
+    from pipeline.quality_checks import QualityChecker
+
+    class PluginChecker(QualityChecker):
+        name = "plugin"
+
+        def check(self, example: dict) -> tuple[float, str]:
+            raise AssertionError("acheck override should be used")
+
+        async def acheck(self, example: dict) -> tuple[float, str]:
+            return 1.0, "async"
+
+    with patch.dict("pipeline.stages.quality._CHECKER_REGISTRY", {"plugin": PluginChecker}):
+        result = await InspectorStage().process([_good_example()], config={"checks": ["plugin"]})
+
+    assert result.errors == []
+    assert result.data[0]["quality_score"] == 1.0
+
+
+async def test_failed_precompute_only_errors_its_checker():
+    def broken(self, examples):
+        raise RuntimeError("no vectors")
+
+    with patch.object(DuplicateChecker, "set_examples", broken):
+        result = await InspectorStage().process(
+            [_good_example()], config={"checks": ["format", "duplicate"]}
+        )
+
+    details = result.data[0]["quality_details"]
+    assert details["duplicate"] == {"score": 0.0, "detail": "error: no vectors"}
+    assert details["format"]["score"] == 1.0
+    assert result.errors == ["duplicate: no vectors"]
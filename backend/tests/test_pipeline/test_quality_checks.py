@@ -6,6 +6,7 @@ from unittest.mock import patch, MagicMock
 import numpy as np
 
 from pipeline.quality_checks.length_balance import LengthBalanceChecker
+from pipeline.quality_checks import coherence
 from pipeline.quality_checks.coherence import CoherenceChecker
 
 
@@ -18,7 +19,7 @@ async def test_length_balance_balanced() -> None:
         "input": "What is machine learning?",
         "output": "Machine learning is a subset of artificial intelligence that enables systems to learn and improve from experience without being explicitly programmed.",
     }
-    score, detail = await checker.check(example)
+    score, detail = checker.check(example)
     assert score == 1.0
     assert "balanced" in detail
 
@@ -26,7 +27,7 @@ async def test_length_balance_balanced() -> None:
 async def test_length_balance_empty_output() -> None:
     """Empty output gets score 0.0."""
     checker = LengthBalanceChecker()
-    score, detail = await checker.check({"input": "some text", "output": ""})
+    score, detail = checker.check({"input": "some text", "output": ""})
     assert score == 0.0
     assert "empty output" in detail
 
@@ -34,7 +35,7 @@ async def test_length_balance_empty_output() -> None:
 async def test_length_balance_empty_input() -> None:
     """Empty input gets score 0.3."""
     checker = LengthBalanceChecker()
-    score, detail = await checker.check({"input": "", "output": "some output text"})
+    score, detail = checker.check({"input": "", "output": "some output text"})
     assert score == 0.3
     assert "empty input" in detail
 
@@ -42,7 +43,7 @@ async def test_length_balance_empty_input() -> None:
 async def test_length_balance_both_empty() -> None:
     """Both empty gets score 0.5."""
     checker = LengthBalanceChecker()
-    score, detail = await checker.check({"input": "", "output": ""})
+    score, detail = checker.check({"input": "", "output": ""})
     assert score == 0.5
 
 
@@ -53,7 +54,7 @@ async def test_length_balance_very_long_output() -> None:
         "input": "Hello",
         "output": " ".join(["word"] * 500),  # 500 words vs 1 word = 500x ratio
     }
-    score, detail = await checker.check(example)
+    score, detail = checker.check(example)
     assert score < 1.0
     assert "too long" in detail
 
@@ -65,11 +66,30 @@ async def test_length_balance_very_short_output() -> None:
         "input": " ".join(["word"] * 100),  # 100 words
         "output": "yes",  # 1 word = 0.01x ratio
     }
-    score, detail = await checker.check(example)
+    score, detail = checker.check(example)
     assert score < 1.0
     assert "too short" in detail
 
 
+async def test_length_balance_check_batch_matches_check() -> None:
+    checker = LengthBalanceChecker()
+    examples = [
+        {"input": "one two three four", "output": "a b c d e f"},
+        {"input": "", "output": ""},
+        {"input": "", "output": "some words"},
+        {"input": "some words", "output": "  "},
+        {"input": " ".join(["w"] * 10), "output": "a b"},
+        {"input": "w", "output": " ".join(["o"] * 50)},
+        {"input": "w", "output": " ".join(["o"] * 150)},
+    ]
+    scores, details = LengthBalanceChecker.check_batch(examples)
+
+    assert scores.shape == (len(examples),)
+    expected = [checker.check(ex) for ex in examples]
+    assert [d for _, d in expected] == details
+    np.testing.assert_allclose(scores, [s for s, _ in expected])
+
+
 # --- CoherenceChecker tests (mock sentence-transformers) ---
 
 async def test_coherence_high_similarity() -> None:
@@ -84,7 +104,7 @@ async def test_coherence_high_similarity() -> None:
     mock_model.encode.return_value = np.array([vec1, vec2])
     checker._model = mock_model
 
-    score, detail = await checker.check({
+    score, detail = checker.check({
         "input": "What is ML?",
         "output": "ML is machine learning.",
     })
@@ -103,7 +123,7 @@ async def test_coherence_low_similarity() -> None:
     mock_model.encode.return_value = np.array([vec1, vec2])
     checker._model = mock_model
 
-    score, detail = await checker.check({
+    score, detail = checker.check({
         "input": "What is ML?",
         "output": "The weather is nice.",
     })
@@ -114,7 +134,7 @@ async def test_coherence_low_similarity() -> None:
 async def test_coherence_missing_text() -> None:
     """Missing input or output returns 0.5."""
     checker = CoherenceChecker()
-    score, detail = await checker.check({"input": "", "output": "some text"})
+    score, detail = checker.check({"input": "", "output": "some text"})
     assert score == 0.5
     assert "missing" in detail
 
@@ -130,10 +150,59 @@ async def test_coherence_lazy_model_load() -> None:
     mock_st_class.return_value = MagicMock()
     fake_module = MagicMock(SentenceTransformer=mock_st_class)
 
-    with patch.dict(sys.modules, {"sentence_transformers": fake_module}):
-        model = checker._get_model()
-        mock_st_class.assert_called_once_with("all-MiniLM-L6-v2")
-        assert model is not None
-        # Second call doesn't re-instantiate -- cached on checker._model
-        checker._get_model()
-        mock_st_class.assert_called_once()  # Still just 1 call
+    coherence._load_model.cache_clear()
+    try:
+        with patch.dict(sys.modules, {"sentence_transformers": fake_module}):
+            model = checker._get_model()
+            mock_st_class.assert_called_once_with("all-MiniLM-L6-v2")
+            assert model is not None
+            # Second call doesn't re-instantiate -- cached on checker._model
+            checker._get_model()
+            mock_st_class.assert_called_once()  # Still just 1 call
+            # Nor does a new checker: the model is cached per process
+            assert CoherenceChecker()._get_model() is model
+            mock_st_class.assert_called_once()
+    finally:
+        coherence._load_model.cache_clear()
+
+
+async def test_coherence_set_examples_encodes_once() -> None:
+    """set_examples encodes all distinct texts in one call; check reuses them."""
+    checker = CoherenceChecker()
+
+    mock_model = MagicMock()
+    # Rows: "Q1", "A1", "A2" (duplicate "Q1" input is encoded once)
+    mock_model.encode.return_value = np.array([
+        [1.0, 0.0],
+        [1.0, 0.0],
+        [0.0, 1.0],
+    ])
+    checker._model = mock_model
+
+    checker.set_examples([
+        {"input": "Q1", "output": "A1"},
+        {"input": "Q1", "output": "A2"},
+    ])
+    high, _ = checker.check({"input": "Q1", "output": "A1"})
+    low, _ = checker.check({"input": "Q1", "output": "A2"})
+
+    mock_model.encode.assert_called_once()
+    assert mock_model.encode.call_args.args[0] == ["Q1", "A1", "A2"]
+    assert high == 1.0
+    assert low == 0.0
+
+
+@pytest.mark.parametrize("device, halved", [("cuda", True), ("cpu", False)])
+def test_coherence_model_uses_fp16_only_on_gpu(device: str, halved: bool) -> None:
+    mock_model = MagicMock()
+    mock_model.device.type = device
+    fake_module = MagicMock(SentenceTransformer=MagicMock(return_value=mock_model))
+
+    coherence._load_model.cache_clear()
+    try:
+        with patch.dict(sys.modules, {"sentence_transformers": fake_module}):
+            assert coherence._load_model("all-MiniLM-L6-v2") is mock_model
+    finally:
+        coherence._load_model.cache_clear()
+
+    assert mock_model.half.called is halved
@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from clients.redis_client import RedisClient
 
@@ -16,3 +16,73 @@ async def test_redis_client_enqueue_job() -> None:
     client._redis = AsyncMock()
     await client.enqueue_job(job_id=1, config={"urls": ["https://example.com"]})
     client._redis.lpush.assert_called_once()
+
+
+async def test_get_redis_client_is_shared() -> None:
+    from clients import redis_client
+
+    with patch.object(redis_client, "_shared_client", None):
+        first = redis_client.get_redis_client()
+        assert redis_client.get_redis_client() is first
+        first._redis = AsyncMock()
+        await redis_client.close_redis_client()
+        first._redis.close.assert_called_once()
+        assert redis_client._shared_client is None
+
+
+async def test_redis_client_dequeue_round_trip() -> None:
+    client = RedisClient.__new__(RedisClient)
+    client._redis = AsyncMock()
+    await client.enqueue_job(job_id=7, config={"urls": ["https://example.com"]})
+    payload = client._redis.lpush.call_args.args[1]
+    client._redis.blmpop.return_value = ["pipeline:jobs", [payload]]
+
+    assert await client.dequeue_job(timeout=1) == {
+        "job_id": 7,
+        "config": {"urls": ["https://example.com"]},
+    }
+
+
+async def test_redis_client_dequeue_jobs_batches() -> None:
+    client = RedisClient.__new__(RedisClient)
+    client._redis = AsyncMock()
+    client._redis.blmpop.return_value = ["pipeline:jobs", ['{"job_id": 1}', '{"job_id": 2}']]
+
+    jobs = await client.dequeue_jobs(max_count=8, timeout=5)
+
+    assert jobs == [{"job_id": 1}, {"job_id": 2}]
+    client._redis.blmpop.assert_awaited_once_with(
+        5, 2, "hf:pushes", "pipeline:jobs", direction="RIGHT", count=8
+    )
+
+    client._redis.blmpop.return_value = None
+    assert await client.dequeue_job(timeout=1) is None
+
+
+async def test_requeue_returns_payloads_to_their_queues() -> None:
+    client = RedisClient.__new__(RedisClient)
+    client._redis = AsyncMock()
+
+    await client.requeue_jobs([{"job_id": 1}, {"hf_push_id": 5}, {"job_id": 2}])
+
+    calls = {c.args[0]: c.args[1:] for c in client._redis.rpush.await_args_list}
+    assert calls == {
+        "hf:pushes": (b'{"hf_push_id":5}',),
+        "pipeline:jobs": (b'{"job_id":2}', b'{"job_id":1}'),
+    }
+
+
+async def test_get_many_and_set_many_round_trip_json() -> None:
+    client = RedisClient.__new__(RedisClient)
+    client._redis = MagicMock()
+    client._redis.mget = AsyncMock(return_value=['[0.5, "ok"]', None])
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    client._redis.pipeline.return_value.__aenter__ = AsyncMock(return_value=pipe)
+    client._redis.pipeline.return_value.__aexit__ = AsyncMock(return_value=False)
+
+    assert await client.get_many(["a", "b"]) == [[0.5, "ok"], None]
+    await client.set_many({"a": [0.5, "ok"]}, ttl=60)
+
+    pipe.setex.assert_called_once_with("a", 60, b'[0.5,"ok"]')
+    pipe.execute.assert_awaited_once()
@@ -29,3 +29,21 @@ def test_project_create_validation() -> None:
 def test_job_create_requires_urls() -> None:
     with pytest.raises(Exception):
         JobCreate(urls=[])
+
+
+def test_job_create_defaults_are_per_instance(monkeypatch) -> None:
+    from config import get_settings
+
+    first = JobCreate(urls=["https://example.com"])
+    first.config.quality.checks.append("custom")
+    assert JobCreate(urls=["https://example.com"]).config.quality.checks == [
+        "toxicity", "readability", "format",
+    ]
+
+    # The default model follows settings at validation time, not import time
+    monkeypatch.setenv("GENERATION_MODEL", "gpt-4o")
+    get_settings.cache_clear()
+    try:
+        assert JobCreate(urls=["https://example.com"]).config.generation.model == "gpt-4o"
+    finally:
+        get_settings.cache_clear()
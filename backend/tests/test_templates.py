@@ -26,6 +26,18 @@ class TestTemplateRegistry:
             tmpl = TemplateRegistry.get(name)
             assert isinstance(tmpl, PromptTemplate)
 
+    def test_builtin_templates_compiled_at_import(self):
+        from templates.base import _compile
+
+        hits = _compile.cache_info().hits
+        for name in ("qa", "summarization", "classification", "instruction"):
+            TemplateRegistry.get(name).render("text", {"num_examples": 1})
+
+        assert _compile.cache_info().hits == hits + 4
+
+    def test_registry_get_reuses_builtin_instance(self):
+        assert TemplateRegistry.get("qa") is TemplateRegistry.get("qa")
+
     def test_registry_get_unknown_raises_error(self):
         with pytest.raises(ValueError, match="Unknown template"):
             TemplateRegistry.get("nonexistent")
@@ -154,3 +166,65 @@ class TestAllTemplatesHaveType:
             assert instance.template_type == type_name, (
                 f"{cls.__name__}.template_type should be '{type_name}', got '{instance.template_type}'"
             )
+
+
+# ---------------------------------------------------------------------------
+# Prompt prefix split
+# ---------------------------------------------------------------------------
+
+class TestRenderParts:
+    @pytest.mark.parametrize("name", ["qa", "summarization", "classification", "instruction"])
+    def test_parts_concatenate_to_render_with_stable_prefix(self, name):
+        tmpl = TemplateRegistry.get(name)
+        meta = {"num_examples": 4, "labels": ["a", "b"]}
+
+        prefix_1, suffix_1 = tmpl.render_parts("First chunk.", {**meta, "title": "One"})
+        prefix_2, _ = tmpl.render_parts("Second chunk.", {**meta, "title": "Two"})
+
+        assert prefix_1 + suffix_1 == tmpl.render("First chunk.", {**meta, "title": "One"})
+        assert prefix_1 and prefix_1 == prefix_2
+        assert suffix_1.startswith("First chunk.")
+
+    def test_content_dependent_prefix_falls_back_to_full_prompt(self):
+        from templates import DynamicTemplate
+
+        tmpl = DynamicTemplate(
+            name="custom",
+            template_type="qa",
+            system_prompt_text="sys",
+            user_prompt_template_text="{{ content | length }} chars: {{ content }}",
+        )
+
+        assert tmpl.render_parts("abc") == ("", "3 chars: abc")
+
+    def test_single_content_slot_renders_once_per_metadata(self):
+        from unittest.mock import patch
+
+        from templates import DynamicTemplate
+
+        tmpl = DynamicTemplate(
+            name="custom",
+            template_type="qa",
+            system_prompt_text="sys",
+            user_prompt_template_text="Title: {{ title }}\n{{ content }}\nN={{ num_examples }}",
+        )
+        meta = {"title": "Doc", "num_examples": 2}
+
+        with patch.object(tmpl, "render", wraps=tmpl.render) as render:
+            parts = [tmpl.render_parts(text, meta) for text in ("one", "two", "three")]
+
+        assert render.call_count == 1
+        assert parts[1] == ("Title: Doc\n", "two\nN=2")
+        assert "".join(parts[2]) == tmpl.render("three", meta)
+
+    def test_repeated_content_slot_renders_each_chunk(self):
+        from templates import DynamicTemplate
+
+        tmpl = DynamicTemplate(
+            name="custom",
+            template_type="qa",
+            system_prompt_text="sys",
+            user_prompt_template_text="{% for _ in range(2) %}[{{ content }}]{% endfor %}",
+        )
+
+        assert tmpl.render_parts("x") == ("[", "x][x]")
@@ -0,0 +1,159 @@
+import asyncio
+from collections import defaultdict
+
+from worker import Worker
+
+
+class FakeRedis:
+    """In-memory stand-in for the dequeue side of RedisClient."""
+
+    def __init__(self, queue: list[dict] | None = None) -> None:
+        self.queue = list(queue or [])
+        self.pops: list[int] = []
+        self.requeued: list[dict] = []
+        self.pop_started = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def dequeue_jobs(self, max_count: int = 1, timeout: int = 5) -> list[dict]:
+        self.pops.append(max_count)
+        self.pop_started.set()
+        await self.release.wait()
+        if not self.queue:
+            await asyncio.sleep(0.01)  # the BLMPOP timeout, shortened
+        popped, self.queue = self.queue[:max_count], self.queue[max_count:]
+        return popped
+
+    async def requeue_jobs(self, payloads: list[dict]) -> None:
+        self.requeued.extend(payloads)
+
+
+class FakeOrchestrator:
+    """Runs each job until the test sets its ``finish`` event."""
+
+    def __init__(self) -> None:
+        self.started: list[int] = []
+        self.cancelled: list[int] = []
+        self.finish: defaultdict[int, asyncio.Event] = defaultdict(asyncio.Event)
+
+    async def run(self, job_id: int) -> None:
+        self.started.append(job_id)
+        try:
+            await self.finish[job_id].wait()
+        except asyncio.CancelledError:
+            self.cancelled.append(job_id)
+            raise
+
+
+async def _until(condition) -> None:
+    for _ in range(400):
+        if condition():
+            return
+        await asyncio.sleep(0.005)
+    raise AssertionError("condition never became true")
+
+
+def _worker(redis: FakeRedis) -> Worker:
+    worker = Worker()
+    worker._redis = redis
+    return worker
+
+
+async def test_dequeue_returns_popped_jobs() -> None:
+    redis = FakeRedis([{"job_id": 1}, {"job_id": 2}, {"job_id": 3}])
+    redis.release.set()
+
+    payloads = await _worker(redis)._dequeue(2)
+
+    assert payloads == [{"job_id": 1}, {"job_id": 2}]
+    assert redis.requeued == []
+
+
+async def test_dequeue_stop_requeues_jobs_from_pending_pop() -> None:
+    redis = FakeRedis([{"job_id": 1}, {"hf_push_id": 7}])
+    worker = _worker(redis)
+
+    dequeue = asyncio.create_task(worker._dequeue(4))
+    await redis.pop_started.wait()
+    worker.request_stop()
+    await asyncio.sleep(0)
+    # The stop does not abandon the in-flight pop
+    assert not dequeue.done()
+
+    redis.release.set()
+    assert await dequeue == []
+    assert redis.requeued == [{"job_id": 1}, {"hf_push_id": 7}]
+
+
+async def test_dequeue_stop_with_empty_pop_requeues_nothing() -> None:
+    redis = FakeRedis()
+    worker = _worker(redis)
+
+    dequeue = asyncio.create_task(worker._dequeue(4))
+    await redis.pop_started.wait()
+    worker.request_stop()
+    redis.release.set()
+
+    assert await dequeue == []
+    assert redis.requeued == []
+
+
+async def test_run_jobs_takes_only_free_slots_and_refills_as_jobs_finish() -> None:
+    redis = FakeRedis([{"job_id": 1}, {"job_id": 2}, {"job_id": 3}])
+    redis.release.set()
+    orchestrator = FakeOrchestrator()
+    worker = _worker(redis)
+
+    loop_task = asyncio.create_task(worker._run_jobs(orchestrator, concurrency=2))
+    await _until(lambda: orchestrator.started == [1, 2])
+    await asyncio.sleep(0.02)
+    # Both slots busy: the loop waits on its jobs instead of popping more
+    assert redis.pops == [2]
+    assert redis.queue == [{"job_id": 3}]
+
+    orchestrator.finish[1].set()
+    await _until(lambda: orchestrator.started == [1, 2, 3])
+    assert redis.pops[:2] == [2, 1]
+
+    worker.request_stop()
+    orchestrator.finish[2].set()
+    orchestrator.finish[3].set()
+    await loop_task
+    assert orchestrator.cancelled == []
+
+
+async def test_run_jobs_stop_requeues_popped_jobs_and_waits_for_running_ones() -> None:
+    redis = FakeRedis([{"job_id": 1}])
+    redis.release.set()
+    orchestrator = FakeOrchestrator()
+    worker = _worker(redis)
+
+    loop_task = asyncio.create_task(worker._run_jobs(orchestrator, concurrency=2))
+    await _until(lambda: orchestrator.started == [1])
+    # Hold the next pop open, let it pick up a job, and stop meanwhile
+    pops = len(redis.pops)
+    redis.release.clear()
+    await _until(lambda: len(redis.pops) > pops)
+    redis.queue.append({"job_id": 2})
+    worker.request_stop()
+    redis.release.set()
+
+    await _until(lambda: redis.requeued == [{"job_id": 2}])
+    assert not loop_task.done()  # job 1 is still running
+
+    orchestrator.finish[1].set()
+    await loop_task
+    assert orchestrator.started == [1]
+    assert orchestrator.cancelled == []
+
+
+async def test_cancelled_run_jobs_cancels_running_jobs_then_gathers_them() -> None:
+    redis = FakeRedis([{"job_id": 1}, {"job_id": 2}])
+    redis.release.set()
+    orchestrator = FakeOrchestrator()
+
+    loop_task = asyncio.create_task(_worker(redis)._run_jobs(orchestrator, concurrency=2))
+    await _until(lambda: orchestrator.started == [1, 2])
+    loop_task.cancel()
+    await asyncio.gather(loop_task, return_exceptions=True)
+
+    assert sorted(orchestrator.cancelled) == [1, 2]
@@ -19,6 +19,10 @@ import { useJob } from "@/hooks/useJobs";
 import { api } from "@/lib/api";
 import type { Export, HFPushResponse } from "@/lib/types";
 
+const HF_POLL_INTERVAL_MS = 2000;
+// Stop waiting after 15 minutes; the push keeps running in the worker
+const HF_POLL_MAX_ATTEMPTS = 450;
+
 export default function JobResultsPage({
   params,
 }: {
@@ -91,10 +95,25 @@ export default function JobResultsPage({
     setHfError(null);
     setHfResult(null);
     try {
-      const result = await api.pushToHuggingFace(exportId, {
+      // The upload runs in the worker; poll until it finishes
+      let result = await api.pushToHuggingFace(exportId, {
         repo_id: hfRepoId.trim(),
         private: hfPrivate,
       });
+      for (
+        let attempt = 0;
+        result.status === "pending" || result.status === "running";
+        attempt++
+      ) {
+        if (attempt >= HF_POLL_MAX_ATTEMPTS) {
+          throw new Error("Push to HuggingFace is taking too long; check the repository later");
+        }
+        await new Promise((resolve) => setTimeout(resolve, HF_POLL_INTERVAL_MS));
+        result = await api.getHFPushStatus(exportId, result.id);
+      }
+      if (result.status === "failed") {
+        throw new Error(result.error ?? "Push to HuggingFace failed");
+      }
       setHfResult(result);
     } catch (err) {
       setHfError(err instanceof Error ? err.message : "Push to HuggingFace failed");
@@ -258,7 +277,7 @@ export default function JobResultsPage({
                           </span>
                         </div>
                         <a
-                          href={hfResult.url}
+                          href={hfResult.url ?? undefined}
                           target="_blank"
                           rel="noopener noreferrer"
                           className="inline-flex items-center gap-1 font-mono text-xs text-[#00d4ff] underline underline-offset-2 hover:text-[#00d4ff]/80"
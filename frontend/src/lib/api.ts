@@ -83,6 +83,8 @@ export const api = {
       method: "POST",
       body: JSON.stringify(data),
     }),
+  getHFPushStatus: (exportId: number, pushId: number) =>
+    request<HFPushResponse>(`/api/exports/${exportId}/push-status/${pushId}`),
 
   // Custom Templates
   getCustomTemplates: () => request<CustomTemplate[]>("/api/custom-templates"),
@@ -84,9 +84,15 @@ export interface HFPushRequest {
 }
 
 export interface HFPushResponse {
+  id: number;
+  export_id: number;
   repo_id: string;
-  url: string;
+  status: "pending" | "running" | "completed" | "failed";
+  url: string | null;
   files_uploaded: number;
+  error: string | null;
+  created_at: string;
+  completed_at: string | null;
 }
 
 // --- Custom Templates ---